@@ -11,6 +11,8 @@ class ExtendedSIRModelHTuckerNoDiff:
     def __init__(self, A0, lamda, gamma):
         self.A0 = A0
         self.lamda = lamda
+        # Vorbereitete Kontraktion von lamda mit I (siehe HTucker.contraction_plan)
+        self.lamda_plan = None
         self.gamma = gamma
         self.rank = {"S": 0, "I": 0}
         self.error = {"S": 0, "I": 0}
@@ -24,19 +26,28 @@ class ExtendedSIRModelHTuckerNoDiff:
         self.eps_r = None
         self.max_rank_k = None
         self.max_rank_r = None
+        self.oversampling = None
 
     def set_population_settings(self, N, f_A, f_B, f_AB):
         self.N= N
         self.f_A, self.f_B = f_A, f_B
         self.f_AB = f_AB
 
-    def set_htucker_settings(self, mrs, mrd, aes, aed):
+    def set_htucker_settings(self, mrs, mrd, aes, aed, oversampling=None):
         self.max_rank_k, self.max_rank_r = mrs, mrd
         self.eps_k, self.eps_r = aes, aed
+        # Ist 'oversampling' gesetzt, wird das Produkt S * lamdaI direkt mit Rang max_rank_r + oversampling gebildet
+        # und gekürzt, statt zunächst den Produktrang zuzulassen
+        self.oversampling = oversampling
 
     def truncate_A0(self, enable_truncation_info=False):
-        S0, err_bnd_S0, _ = HTucker.truncate(A=self.A0[0], max_rank=self.max_rank_k, abs_err=self.eps_k)
-        I0, err_bnd_I0, _ = HTucker.truncate(A=self.A0[1], max_rank=self.max_rank_k, abs_err=self.eps_k)
+        # Die Anfangswerte können dicht oder bereits exakt im hierarchischen Tuckerformat vorliegen (z.B. über
+        # HTucker.from_cp). Im zweiten Fall wird nur noch gekürzt, ohne den vollen Tensor zu zerlegen. 'sequential'
+        # betrifft nur die Zerlegung dichter Anfangswerte
+        S0, err_bnd_S0, _ = HTucker.truncate(A=self.A0[0], max_rank=self.max_rank_k, abs_err=self.eps_k,
+                                             sequential=True)
+        I0, err_bnd_I0, _ = HTucker.truncate(A=self.A0[1], max_rank=self.max_rank_k, abs_err=self.eps_k,
+                                             sequential=True)
         if enable_truncation_info:
             print("Fehlerschranke S0: ", get_error(err_bnd_S0))
             print("Fehlerschranke I0: ", get_error(err_bnd_I0))
@@ -49,26 +60,43 @@ class ExtendedSIRModelHTuckerNoDiff:
         self.rank["I"] = max(I0.rank.values())
 
     def prepare_lamda(self, enable_truncation_info=False):
-        lamda_ht, err_bnd_lamda, _ = HTucker.truncate(A=self.lamda, max_rank=60, abs_err=1e-6)
+        # lamda kann dicht oder bereits im hierarchischen Tuckerformat vorliegen (siehe
+        # get_lamda_scaled_htucker). 'sequential' betrifft nur die Zerlegung eines dichten lamda
+        lamda_ht, err_bnd_lamda, _ = HTucker.truncate(A=self.lamda, max_rank=60, abs_err=1e-6,
+                                                      sequential=True)
         if enable_truncation_info:
             print("Fehlerschranke lamda: ", get_error(err_bnd_lamda))
         self.lamda = lamda_ht
+        self.lamda_plan = HTucker.contraction_plan(x=self.lamda, dims_x=[2, 3], dims_y=[0, 1])
 
     def set_time_discretization(self, T, Nt):
         self.t_disc = np.arange(0, T + T/Nt, T / Nt)
 
     def reaction(self):
         S, I = self.A
-        lamdaI = HTucker.contract(x=self.lamda, y=I, dims_x=[2, 3], dims_y=[0, 1])
-        mr = max(lamdaI.rank.values()) * max(S.rank.values())
-        S2I, _, _ = HTucker.ews_multiplication(x=S, y=lamdaI, max_rank=mr, abs_err=self.eps_r)
+        if self.lamda_plan is None:
+            self.lamda_plan = HTucker.contraction_plan(x=self.lamda, dims_x=[2, 3], dims_y=[0, 1])
+        lamdaI = self.lamda_plan.apply(I)
+        if self.oversampling is None:
+            mr = max(lamdaI.rank.values()) * max(S.rank.values())
+            S2I, _, _ = HTucker.ews_multiplication(x=S, y=lamdaI, max_rank=mr, abs_err=self.eps_r)
+        else:
+            S2I, _, _ = HTucker.ews_multiplication(x=S, y=lamdaI, max_rank=self.max_rank_r, abs_err=self.eps_r,
+                                                   oversampling=self.oversampling)
         I2R = HTucker.ews_mode_multiplication(x=I, vec=self.gamma, mu=0)
         return S2I, I2R
 
-    def rhs(self, t):
+    def rhs_lazy(self, t):
+        """
+        Gibt die rechte Seite als ungekürzte, verzögert ausgewertete Linearkombinationen zurück.
+        """
         S2I, I2R = self.reaction()
-        rhs_S, _, _ = HTucker.add_and_truncate(summanden=[HTucker.scalar_mul(x=S2I, a=-1)],
-                                                   max_rank=self.max_rank_r, abs_err=self.eps_r, copy=False)
-        rhs_I, _, _ = HTucker.add_and_truncate(summanden=[S2I, HTucker.scalar_mul(x=I2R, a=-1)],
-                                                   max_rank=self.max_rank_r, abs_err=self.eps_r, copy=False)
+        rhs_S = -S2I
+        rhs_I = S2I - I2R
+        return [rhs_S, rhs_I]
+
+    def rhs(self, t):
+        rhs_S, rhs_I = self.rhs_lazy(t)
+        rhs_S, _, _ = rhs_S.evaluate(max_rank=self.max_rank_r, abs_err=self.eps_r)
+        rhs_I, _, _ = rhs_I.evaluate(max_rank=self.max_rank_r, abs_err=self.eps_r)
         return [rhs_S, rhs_I]
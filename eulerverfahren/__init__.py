@@ -1,2 +1,8 @@
 from .explizites_eulerverfahren import ExplizitesEulerverfahren
 from .rangadaptives_eulerverfahren import RangadaptivesEulerverfahren
+from .exponentielles_eulerverfahren import ExponentiellesEulerverfahren
+from .adaptives_heunverfahren import AdaptivesHeunverfahren
+from .explizites_runge_kutta_verfahren import ExplizitesRungeKuttaVerfahren
+from .rangadaptives_runge_kutta_verfahren import RangadaptivesRungeKuttaVerfahren
+from .bug_verfahren import BUGVerfahren
+from .parareal_verfahren import PararealVerfahren
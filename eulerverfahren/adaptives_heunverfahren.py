@@ -0,0 +1,126 @@
+import warnings
+import numpy as np
+from tqdm import tqdm
+from tensor.htucker import HTucker
+from utils.misc_utils.get_error import get_error
+
+
+class AdaptivesHeunverfahren:
+    """
+    Rangadaptives Heunverfahren mit Schrittweitensteuerung
+    Jeder Schritt berechnet das eingebettete Paar aus explizitem Euler- (Ordnung 1) und Heunverfahren (Ordnung 2)
+    im hierarchischen Tuckerformat. Die Differenz beider Lösungen tau/2 * ||k2 - k1|| schätzt den lokalen Fehler des
+    Eulerverfahrens. Sie wird für S und I getrennt relativ zur Norm des jeweiligen Kompartiments mit 'tol'
+    verglichen, maßgeblich ist das Maximum. So wird auch der Fehler des deutlich kleineren Kompartiments I
+    kontrolliert. Fortgesetzt wird mit der genaueren Heunlösung.
+    Der über get_error gemeldete Kürzungsfehler sinkt nicht mit der Schrittweite und geht daher nicht in die
+    Schrittweitensteuerung ein. Er wird wie bei den übrigen Verfahren in model.error festgehalten.
+    Die Schrittweite wird nach jedem Schritt mit dem Faktor 'safety' * (tol / err)^(1/2) angepasst, begrenzt auf
+    das Intervall ['fac_min', 'fac_max'] sowie ['tau_min', 'tau_max']. Ein Schritt mit zu großem Fehler wird mit
+    kleinerer Schrittweite wiederholt, sofern nicht bereits 'tau_min' erreicht ist. Schritte, die trotz zu großen
+    Fehlers mit 'tau_min' akzeptiert werden, werden in 'forced' gezählt, am Ende wird dann eine Warnung ausgegeben.
+    Die Schritte werden stets so gewählt, dass jeder volle Tag exakt getroffen und dort ein Snapshot geschrieben wird.
+    Die Anfangsschrittweite ist durch model.t_disc gegeben, der Endzeitpunkt durch model.t_disc[-1].
+    """
+    def __init__(self, model, output_handler, tol=1e-4, tau_min=1e-4, tau_max=1., safety=0.9, fac_min=0.2,
+                 fac_max=5., progress=True):
+        if not isinstance(progress, bool):
+            raise TypeError("'progress' muss vom Typ bool sein.")
+        if not isinstance(tol, float) or not tol > 0:
+            raise ValueError("'tol' muss ein positiver float sein.")
+        if not isinstance(tau_min, float) or not isinstance(tau_max, float) or not 0 < tau_min <= tau_max:
+            raise ValueError("'tau_min' und 'tau_max' müssen floats mit 0 < tau_min <= tau_max sein.")
+        if not isinstance(safety, float) or not 0 < safety <= 1:
+            raise ValueError("'safety' muss ein float aus (0, 1] sein.")
+        if not isinstance(fac_min, float) or not isinstance(fac_max, float) or not 0 < fac_min < 1 < fac_max:
+            raise ValueError("'fac_min' und 'fac_max' müssen floats mit 0 < fac_min < 1 < fac_max sein.")
+        self.model = model
+        self.output_handler = output_handler
+        self.progress = progress
+        self.tol = tol
+        self.tau_min = tau_min
+        self.tau_max = tau_max
+        self.safety = safety
+        self.fac_min = fac_min
+        self.fac_max = fac_max
+        # Akzeptierte Zeitpunkte und Schrittweiten sowie Anzahl verworfener Schritte
+        self.t_accepted = []
+        self.tau_accepted = []
+        self.rejected = 0
+        # Anzahl der mit 'tau_min' trotz zu großen Fehlers akzeptierten Schritte
+        self.forced = 0
+
+    def compute(self):
+        self.model.A = self.model.A0
+        T = self.model.t_disc[-1]
+        tau = min(max(self.model.t_disc[1] - self.model.t_disc[0], self.tau_min), self.tau_max)
+        t = self.model.t_disc[0]
+        progress = tqdm(total=round(T), smoothing=0, disable=not self.progress)
+        while t < T:
+            # Speichern eines Snapshots für jeden vollen Tag
+            if round(t) == t:
+                # Uebergabe an den OutputHandler
+                self.output_handler.write_snapshot(round(t))
+            # Der nächste volle Tag bzw. der Endzeitpunkt wird exakt getroffen
+            t_next_day = min(np.floor(t) + 1, T)
+            while True:
+                # Bliebe bis zum nächsten vollen Tag nur ein sehr kurzes Reststück, wird der Schritt leicht verlängert
+                tau_step = t_next_day - t if t_next_day - t <= 1.1 * tau else tau
+                S, I, err_S, err_I, err = self.step(tau_step, t)
+                # Anpassung der Schrittweite
+                fac = self.fac_max if err == 0 else self.safety * np.sqrt(1 / err)
+                tau_new = min(max(tau_step * min(max(fac, self.fac_min), self.fac_max), self.tau_min), self.tau_max)
+                if err <= 1:
+                    break
+                if tau_step <= self.tau_min:
+                    self.forced += 1
+                    break
+                self.rejected += 1
+                tau = tau_new
+            # Übernahme neuer Lösung
+            t = t_next_day if t_next_day - (t + tau_step) <= 1e-12 * max(T, 1) else t + tau_step
+            self.model.A = [S, I]
+            self.t_accepted.append(t)
+            self.tau_accepted.append(tau_step)
+            # Wurde der Schritt durch den nächsten vollen Tag begrenzt, bleibt die bisherige Schrittweite erhalten,
+            # sofern die Fehlerschätzung keine Verkleinerung verlangt
+            if tau_step >= tau or tau_new < tau_step:
+                tau = tau_new
+            # Update Error
+            self.model.error["S"] = get_error(err_S)
+            self.model.error["I"] = get_error(err_I)
+            # Update rank
+            self.model.rank["S"] = max(S.rank.values())
+            self.model.rank["I"] = max(I.rank.values())
+            if round(t) == t:
+                progress.update(1)
+        progress.close()
+        if self.forced > 0:
+            warnings.warn(f"{self.forced} Schritte wurden mit 'tau_min' = {self.tau_min} trotz Überschreitung von "
+                          f"'tol' akzeptiert.")
+
+        # Schreibe letzte Lösung
+        self.output_handler.write_solution(round(T))
+
+    def step(self, tau, t):
+        """
+        Ein Schritt des eingebetteten Euler/Heun-Paars. Gibt die Heunlösung, die Kürzungsfehler und den größten auf
+        'tol' und die Norm des jeweiligen Kompartiments bezogenen lokalen Fehler zurück.
+        """
+        A = self.model.A
+        max_rank, abs_err = self.model.max_rank_r, self.model.eps_k
+        # Eulerschritt
+        k1 = self.model.rhs(t)
+        A_euler = [(A[ii] + tau * k1[ii]).evaluate(max_rank=max_rank, abs_err=abs_err)[0] for ii in range(2)]
+        # Heunschritt
+        self.model.A = A_euler
+        k2 = self.model.rhs(t + tau)
+        self.model.A = A
+        S, err_S, _ = (A[0] + tau / 2 * k1[0] + tau / 2 * k2[0]).evaluate(max_rank=max_rank, abs_err=abs_err)
+        I, err_I, _ = (A[1] + tau / 2 * k1[1] + tau / 2 * k2[1]).evaluate(max_rank=max_rank, abs_err=abs_err)
+        # Lokaler Fehler je Kompartiment: Differenz beider Verfahren relativ zur Norm der Lösung
+        err_local = 0.
+        for ii, x in enumerate((S, I)):
+            est = tau / 2 * HTucker.norm(HTucker.add(k2[ii], HTucker.scalar_mul(k1[ii], -1.)))
+            err_local = max(err_local, est / (self.tol * max(HTucker.norm(x), 1e-300)))
+        return S, I, err_S, err_I, err_local
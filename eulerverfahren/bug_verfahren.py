@@ -0,0 +1,56 @@
+from tqdm import tqdm
+from tensor.htucker import HTucker
+from utils.misc_utils.get_error import get_error
+
+
+class BUGVerfahren:
+    """
+    Rangadaptiver Basis-Update-&-Galerkin-Integrator (BUG) auf der Mannigfaltigkeit hierarchischer Tuckertensoren
+    Jeder Zeitschritt erweitert die Basen der aktuellen Lösung um die Richtungen der ungekürzten rechten Seite
+    (siehe rhs_lazy) und löst das auf die erweiterten Basen projizierte Problem mit einem expliziten Eulerschritt
+    (siehe HTucker.bug_step). Die Summe A + tau * rhs wird dabei nicht gebildet, gekürzt wird nur der Galerkin-Schritt
+    mit höchstens doppeltem Rang.
+    Anteile der rechten Seite außerhalb der erweiterten Basen (Normalanteil) gehen verloren. Das Verfahren eignet
+    sich daher für Lösungen, deren Ränge ausreichend groß sind, um die Dynamik zu erfassen, z.B. glatte
+    Anfangswerte. Bei Anfangswerten sehr kleinen Rangs mit schnellem Rangwachstum (z.B. Punktquellen) ist das
+    RangadaptiveEulerverfahren genauer.
+    """
+    def __init__(self, model, output_handler, progress=True):
+        if not isinstance(progress, bool):
+            raise TypeError("'progress' muss vom Typ bool sein.")
+        self.model = model
+        self.output_handler = output_handler
+        self.progress = progress
+
+    def compute(self):
+        self.model.A = self.model.A0
+        tau = self.model.t_disc[1] - self.model.t_disc[0]    # Konstante Zeitschrittweite
+        for t in tqdm(self.model.t_disc[:-1], smoothing=0, disable=not self.progress):
+            S, I, err_S, err_I = self.step(tau, t)
+            A_next = [S, I]
+            # Speichern eines Snapshots für jeden vollen Tag
+            if round(t) == t:
+                # Uebergabe an den OutputHandler
+                self.output_handler.write_snapshot(round(t))
+            # Übernahme neuer Lösung
+            self.model.A = A_next
+            # Update Error
+            self.model.error["S"] = get_error(err_S)
+            self.model.error["I"] = get_error(err_I)
+            # Update rank
+            self.model.rank["S"] = max(S.rank.values())
+            self.model.rank["I"] = max(I.rank.values())
+
+        # Schreibe letzte Lösung
+        self.output_handler.write_solution(round(self.model.t_disc[-1]))
+
+    def step(self, tau, t):
+        """
+        Ein Zeitschritt: Basis-Update und Galerkin-Schritt für S und I mit der ungekürzten rechten Seite.
+        """
+        rhs_S, rhs_I = self.model.rhs_lazy(t)
+        S, err_S, _ = HTucker.bug_step(x=self.model.A[0], f=rhs_S, tau=tau, max_rank=self.model.max_rank_r,
+                                       abs_err=self.model.eps_k)
+        I, err_I, _ = HTucker.bug_step(x=self.model.A[1], f=rhs_I, tau=tau, max_rank=self.model.max_rank_r,
+                                       abs_err=self.model.eps_k)
+        return S, I, err_S, err_I
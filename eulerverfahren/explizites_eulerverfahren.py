@@ -5,14 +5,17 @@ class ExplizitesEulerverfahren:
     """
     Explizites Eulerverfahren
     """
-    def __init__(self, model, output_handler):
+    def __init__(self, model, output_handler, progress=True):
+        if not isinstance(progress, bool):
+            raise TypeError("'progress' muss vom Typ bool sein.")
         self.model = model
         self.output_handler = output_handler
+        self.progress = progress
 
     def compute(self):
         self.model.A = self.model.A0
         tau = self.model.t_disc[1] - self.model.t_disc[0]   # Konstante Zeitschrittweite
-        for t in tqdm(self.model.t_disc[:-1], smoothing=0):
+        for t in tqdm(self.model.t_disc[:-1], smoothing=0, disable=not self.progress):
             A_new = self.model.A + tau * self.model.rhs(t)
             # Speichern eines Snapshots für jeden vollen Tag
             if round(t) == t:
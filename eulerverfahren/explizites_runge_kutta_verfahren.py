@@ -0,0 +1,91 @@
+from tqdm import tqdm
+
+# Explizite Runge-Kutta-Verfahren in Shu-Osher-Form
+# Die Stufen ergeben sich als u_i = sum_j (alpha[i][j] * u_j + tau * beta[i][j] * rhs(u_j)) für j < i mit u_0 = u,
+# die letzte Stufe ist die neue Lösung. 'c' enthält die Zeitpunkte t + c_j * tau, an denen rhs(u_j) ausgewertet wird.
+# Ordnung 2 und 3 sind die starkstabilitätserhaltenden (SSP) Verfahren von Shu und Osher, d.h. Konvexkombinationen
+# expliziter Eulerschritte. Für Ordnung 4 existiert kein SSP-Verfahren mit vier Stufen, verwendet wird daher das
+# klassische Runge-Kutta-Verfahren.
+SHU_OSHER = {
+    2: {"alpha": [[1.],
+                  [1 / 2, 1 / 2]],
+        "beta": [[1.],
+                 [0., 1 / 2]],
+        "c": [0., 1.]},
+    3: {"alpha": [[1.],
+                  [3 / 4, 1 / 4],
+                  [1 / 3, 0., 2 / 3]],
+        "beta": [[1.],
+                 [0., 1 / 4],
+                 [0., 0., 2 / 3]],
+        "c": [0., 1., 1 / 2]},
+    4: {"alpha": [[1.],
+                  [1., 0.],
+                  [1., 0., 0.],
+                  [-1 / 3, 1 / 3, 2 / 3, 1 / 3]],
+        "beta": [[1 / 2],
+                 [0., 1 / 2],
+                 [0., 0., 1.],
+                 [0., 0., 0., 1 / 6]],
+        "c": [0., 1 / 2, 1 / 2, 1.]},
+}
+
+
+def check_order(order):
+    """
+    Helferfunktion: Prüft die Ordnung eines Runge-Kutta-Verfahrens.
+    """
+    if not isinstance(order, int):
+        raise TypeError("'order' muss einer der ints 2, 3, 4 sein.")
+    if order not in SHU_OSHER:
+        raise ValueError("'order' muss einer der ints 2, 3, 4 sein.")
+
+
+class ExplizitesRungeKuttaVerfahren:
+    """
+    Explizites Runge-Kutta-Verfahren der Ordnung 'order' (siehe SHU_OSHER) für volle Tensoren
+    Gegenstück zum RangadaptivenRungeKuttaVerfahren zur Validierung.
+    """
+    def __init__(self, model, output_handler, order=2, progress=True):
+        if not isinstance(progress, bool):
+            raise TypeError("'progress' muss vom Typ bool sein.")
+        check_order(order)
+        self.model = model
+        self.output_handler = output_handler
+        self.progress = progress
+        self.order = order
+
+    def compute(self):
+        self.model.A = self.model.A0
+        tau = self.model.t_disc[1] - self.model.t_disc[0]   # Konstante Zeitschrittweite
+        for t in tqdm(self.model.t_disc[:-1], smoothing=0, disable=not self.progress):
+            A_new = self.step(tau, t)
+            # Speichern eines Snapshots für jeden vollen Tag
+            if round(t) == t:
+                # Übergabe an den OutputHandler
+                self.output_handler.write_snapshot(round(t))
+            self.model.A = A_new
+        # Schreibe letzte Lösung
+        self.output_handler.write_solution(round(self.model.t_disc[-1]))
+
+    def step(self, tau, t):
+        """
+        Ein Zeitschritt: Die Stufen werden nacheinander aus den vorherigen Stufen und deren rechten Seiten gebildet.
+        """
+        table = SHU_OSHER[self.order]
+        A = self.model.A
+        stages = [A]
+        rhs = []
+        for alpha, beta in zip(table["alpha"], table["beta"]):
+            # Rechte Seite der zuletzt berechneten Stufe
+            self.model.A = stages[-1]
+            rhs.append(self.model.rhs(t + table["c"][len(rhs)] * tau))
+            stage = 0
+            for j in range(len(alpha)):
+                if alpha[j] != 0:
+                    stage = stage + alpha[j] * stages[j]
+                if beta[j] != 0:
+                    stage = stage + tau * beta[j] * rhs[j]
+            stages.append(stage)
+        self.model.A = A
+        return stages[-1]
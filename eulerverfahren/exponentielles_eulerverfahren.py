@@ -0,0 +1,79 @@
+import scipy.linalg
+from tqdm import tqdm
+from tensor.htucker import HTucker
+from utils.misc_utils.get_error import get_error
+
+
+class ExponentiellesEulerverfahren:
+    """
+    Exponentielles Splittingverfahren (Strang-Splitting) für Modelle mit Diffusion
+    Ein Zeitschritt besteht aus einem halben Diffusionsschritt, einem expliziten Eulerschritt für die Reaktion und
+    einem weiteren halben Diffusionsschritt. Der diskrete Laplace-Operator ist die Kroneckersumme von diffx und diffy,
+    die Diffusion wird daher exakt über die Modusmultiplikationen mit expm(tau/2 * diffx) und expm(tau/2 * diffy)
+    gelöst. Diese wirken nur auf die Blattmatrizen der räumlichen Modi und lassen die hierarchischen Ränge
+    unverändert.
+    Die CFL-Bedingung tau < h^2 / (2D) des expliziten Verfahrens entfällt damit (siehe
+    ExtendedSIRModelHTucker.set_time_discretization mit cfl=False). Die Zeitschrittweite ist nur noch durch die
+    Genauigkeit der Reaktion beschränkt.
+    """
+    def __init__(self, model, output_handler, progress=True):
+        if not isinstance(progress, bool):
+            raise TypeError("'progress' muss vom Typ bool sein.")
+        self.model = model
+        self.output_handler = output_handler
+        self.progress = progress
+
+    def compute(self):
+        self.model.A = self.model.A0
+        tau = self.model.t_disc[1] - self.model.t_disc[0]    # Konstante Zeitschrittweite
+        # Die Propagatoren des halben Diffusionsschritts werden einmalig berechnet
+        Ex, Ey = self.propagators(tau / 2)
+        for t in tqdm(self.model.t_disc[:-1], smoothing=0, disable=not self.progress):
+            S, I, err_S, err_I = self.step(tau, t, Ex, Ey)
+            A_next = [S, I]
+            # Speichern eines Snapshots für jeden vollen Tag
+            if round(t) == t:
+                # Uebergabe an den OutputHandler
+                self.output_handler.write_snapshot(round(t))
+            # Übernahme neuer Lösung
+            self.model.A = A_next
+            # Update Error
+            self.model.error["S"] = get_error(err_S)
+            self.model.error["I"] = get_error(err_I)
+            # Update rank
+            self.model.rank["S"] = max(S.rank.values())
+            self.model.rank["I"] = max(I.rank.values())
+
+        # Schreibe letzte Lösung
+        self.output_handler.write_solution(round(self.model.t_disc[-1]))
+
+    def propagators(self, tau):
+        """
+        Gibt die exakten Lösungsoperatoren expm(tau * diffx) und expm(tau * diffy) der Diffusion zurück.
+        """
+        return scipy.linalg.expm(tau * self.model.diffx), scipy.linalg.expm(tau * self.model.diffy)
+
+    @staticmethod
+    def diffuse(x, Ex, Ey):
+        """
+        Exakter Diffusionsschritt: Modusmultiplikation der räumlichen Modi 2 und 3 mit den Propagatoren.
+        """
+        x = HTucker.mode_multiplication(x, Ex, 2)
+        return HTucker.mode_multiplication(x, Ey, 3)
+
+    def step(self, tau, t, Ex, Ey):
+        """
+        Ein Zeitschritt des Strang-Splittings.
+        """
+        # Halber Diffusionsschritt
+        A = self.model.A
+        S, I = self.diffuse(A[0], Ex, Ey), self.diffuse(A[1], Ex, Ey)
+        # Expliziter Eulerschritt der Reaktion
+        # model.A enthält danach wieder den Zustand zum Zeitpunkt t, der im Snapshot gespeichert wird
+        self.model.A = [S, I]
+        S2I, I2R = self.model.reaction()
+        self.model.A = A
+        S, err_S, _ = (S - tau * S2I).evaluate(max_rank=self.model.max_rank_r, abs_err=self.model.eps_k)
+        I, err_I, _ = (I + tau * S2I - tau * I2R).evaluate(max_rank=self.model.max_rank_r, abs_err=self.model.eps_k)
+        # Halber Diffusionsschritt
+        return self.diffuse(S, Ex, Ey), self.diffuse(I, Ex, Ey), err_S, err_I
@@ -0,0 +1,243 @@
+import copy
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from tqdm import tqdm
+from tensor.htucker import HTucker
+from utils.misc_utils.get_error import get_error
+from .rangadaptives_eulerverfahren import RangadaptivesEulerverfahren
+from .exponentielles_eulerverfahren import ExponentiellesEulerverfahren
+
+# Zustand der Worker-Prozesse (siehe init_worker)
+_worker = {}
+
+
+class PararealVerfahren:
+    """
+    Zeitparalleles Parareal-Verfahren für Modelle im hierarchischen Tuckerformat
+    Das Zeitintervall model.t_disc wird in 'n_slices' Zeitscheiben zerlegt, deren Grenzen nach Möglichkeit auf volle
+    Tage fallen. Ein günstiger grober Propagator G ('coarse' mit 'coarse_factor'-fach größerer Schrittweite und
+    Rangschranke 'coarse_max_rank') liefert sequentiell Startwerte für alle Zeitscheiben. Der feine Propagator F
+    ('fine' auf dem Gitter model.t_disc) wird je Iteration für alle noch nicht konvergierten Zeitscheiben parallel in
+    einem ProcessPoolExecutor mit 'max_workers' Prozessen berechnet. Die Korrektur
+        U_{n+1} = G(U_n^neu) + F(U_n^alt) - G(U_n^alt)
+    wird im hierarchischen Tuckerformat gebildet und mit max_rank_r und eps_k gekürzt.
+    Iteriert wird, bis die größte relative Änderung der Startwerte je Kompartiment höchstens 'tol' beträgt,
+    höchstens aber 'iterations' mal. Nach n_slices Iterationen stimmt das Ergebnis mit dem sequentiellen feinen
+    Propagator überein.
+    Die Zustände werden zwischen den Prozessen im kompakten Pufferformat übertragen (siehe HTucker.__getstate__).
+    Die Snapshots der vollen Tage stammen aus den feinen Läufen der letzten Iteration.
+    Ist 'coarse' None, wird für Modelle mit Diffusion das ExponentiellesEulerverfahren verwendet, dessen Schrittweite
+    keiner CFL-Bedingung unterliegt, und sonst das RangadaptiveEulerverfahren.
+    Mit 'blas_threads' wird die Anzahl der BLAS-Threads je Prozess begrenzt, sodass sich Prozesse und BLAS-Threads
+    nicht gegenseitig überbuchen. Dafür wird das optionale Paket threadpoolctl benötigt.
+    """
+    def __init__(self, model, output_handler, fine=RangadaptivesEulerverfahren, fine_kwargs=None, coarse=None,
+                 coarse_kwargs=None, coarse_factor=10, coarse_max_rank=None, n_slices=None, iterations=None,
+                 tol=1e-6, max_workers=None, blas_threads=None):
+        if not isinstance(model.A0, list) or not all(isinstance(x, HTucker) for x in model.A0):
+            raise TypeError("Die Anfangswerte des Modells müssen hierarchische Tuckertensoren sein (siehe "
+                            "truncate_A0).")
+        if not isinstance(coarse_factor, int) or coarse_factor < 1:
+            raise ValueError("'coarse_factor' muss ein positiver int sein.")
+        if coarse_max_rank is not None and (not isinstance(coarse_max_rank, int) or coarse_max_rank < 1):
+            raise ValueError("'coarse_max_rank' muss None oder ein positiver int sein.")
+        if n_slices is not None and (not isinstance(n_slices, int) or n_slices < 1):
+            raise ValueError("'n_slices' muss None oder ein positiver int sein.")
+        if iterations is not None and (not isinstance(iterations, int) or iterations < 1):
+            raise ValueError("'iterations' muss None oder ein positiver int sein.")
+        if not isinstance(tol, float) or tol < 0:
+            raise ValueError("'tol' muss ein nicht-negativer float sein.")
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+            raise ValueError("'max_workers' muss None oder ein positiver int sein.")
+        if blas_threads is not None and (not isinstance(blas_threads, int) or blas_threads < 1):
+            raise ValueError("'blas_threads' muss None oder ein positiver int sein.")
+        if blas_threads is not None:
+            try:
+                import threadpoolctl
+            except ImportError:
+                raise ImportError("Zum Begrenzen der BLAS-Threads wird das Paket 'threadpoolctl' benötigt.")
+        if coarse is None:
+            coarse = ExponentiellesEulerverfahren if getattr(model, "diffx", None) is not None \
+                else RangadaptivesEulerverfahren
+        self.model = model
+        self.output_handler = output_handler
+        self.fine = fine
+        # Die Teilläufe zeigen keine eigenen Fortschrittsbalken an
+        self.fine_kwargs = {"progress": False, **({} if fine_kwargs is None else fine_kwargs)}
+        self.coarse = coarse
+        self.coarse_kwargs = {"progress": False, **({} if coarse_kwargs is None else coarse_kwargs)}
+        self.coarse_factor = coarse_factor
+        self.coarse_max_rank = coarse_max_rank
+        self.n_slices = n_slices
+        self.iterations = iterations
+        self.tol = tol
+        self.max_workers = max_workers
+        self.blas_threads = blas_threads
+        # Größte relative Änderung der Startwerte je Iteration
+        self.changes = []
+
+    def compute(self):
+        self.model.A = self.model.A0
+        t_disc = self.model.t_disc
+        bounds = self.slices()
+        K = len(bounds) - 1
+        grids = [t_disc[bounds[n]:bounds[n + 1] + 1] for n in range(K)]
+        iterations = K if self.iterations is None else min(self.iterations, K)
+        coarse_model = self.coarse_model()
+
+        # Startwerte aus dem groben Propagator
+        U = [list(self.model.A0)]
+        G = []
+        for n in range(K):
+            G.append(self.coarse_propagate(coarse_model, U[n], grids[n]))
+            U.append(G[n])
+        # Fehlerschranken der Korrekturen
+        E = [{"S": 0., "I": 0.} for _ in range(K + 1)]
+
+        fine = [None] * K
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=init_worker,
+                                 initargs=(self.model, self.fine, self.fine_kwargs, self.blas_threads)) as executor:
+            for k in tqdm(range(iterations), smoothing=0):
+                # Feine Propagation aller noch nicht konvergierten Zeitscheiben
+                futures = {n: executor.submit(fine_propagate, U[n], grids[n]) for n in range(k, K)}
+                for n, future in futures.items():
+                    fine[n] = future.result()
+                # Sequentielle Korrektur. Die Zeitscheibe k ist nach dieser Iteration exakt
+                U_new = U[:k + 1] + [fine[k][0]]
+                E[k + 1] = {"S": 0., "I": 0.}
+                change = relative_change(U_new[k + 1], U[k + 1])
+                for n in range(k + 1, K):
+                    G_new = self.coarse_propagate(coarse_model, U_new[n], grids[n])
+                    U_next, E[n + 1] = self.correct(G_new, fine[n][0], G[n])
+                    G[n] = G_new
+                    change = max(change, relative_change(U_next, U[n + 1]))
+                    U_new.append(U_next)
+                U = U_new
+                self.changes.append(change)
+                if change <= self.tol:
+                    break
+
+        # Snapshots der vollen Tage aus den feinen Läufen
+        for n in range(K):
+            for day, A, error, rank in fine[n][1]:
+                self.model.A = A
+                self.model.error = error
+                self.model.rank = rank
+                self.output_handler.write_snapshot(day)
+        # Letzte Lösung
+        S, I = U[K]
+        self.model.A = [S, I]
+        self.model.error = {s: np.sqrt(fine[K - 1][2][s] ** 2 + E[K][s] ** 2) for s in ("S", "I")}
+        self.model.rank = {"S": max(S.rank.values()), "I": max(I.rank.values())}
+        self.output_handler.write_solution(round(t_disc[-1]))
+
+    def slices(self):
+        """
+        Gibt die Indizes der Grenzen der Zeitscheiben in model.t_disc zurück. Die Grenzen werden möglichst
+        gleichmäßig auf die vollen Tage verteilt. Gibt es weniger volle Tage als Zeitscheiben, werden die Zeitschritte
+        gleichmäßig verteilt.
+        """
+        t_disc = self.model.t_disc
+        n_steps = len(t_disc) - 1
+        n_slices = self.n_slices
+        if n_slices is None:
+            n_slices = self.max_workers if self.max_workers is not None else os.cpu_count()
+        n_slices = min(n_slices, n_steps)
+        days = [ii for ii, t in enumerate(t_disc[:-1]) if round(t) == t] + [n_steps]
+        if len(days) - 1 >= n_slices:
+            positions = np.round(np.linspace(0, len(days) - 1, n_slices + 1)).astype(int)
+            bounds = [days[p] for p in positions]
+        else:
+            bounds = np.round(np.linspace(0, n_steps, n_slices + 1)).astype(int).tolist()
+        return sorted(set(bounds))
+
+    def coarse_model(self):
+        """
+        Gibt eine flache Kopie des Modells für den groben Propagator mit Rangschranke 'coarse_max_rank' zurück.
+        """
+        coarse_model = copy.copy(self.model)
+        coarse_model.error = dict(self.model.error)
+        coarse_model.rank = dict(self.model.rank)
+        if self.coarse_max_rank is not None:
+            coarse_model.max_rank_r = self.coarse_max_rank
+        return coarse_model
+
+    def coarse_propagate(self, coarse_model, A, grid):
+        """
+        Grober Propagator: Löst das Modell mit 'coarse_factor'-fach größerer Schrittweite von grid[0] bis grid[-1].
+        """
+        n_steps = max(int(np.ceil((len(grid) - 1) / self.coarse_factor)), 1)
+        coarse_model.A0 = A
+        coarse_model.t_disc = np.linspace(grid[0], grid[-1], n_steps + 1)
+        self.coarse(coarse_model, SnapshotRecorder(coarse_model, record=False), **self.coarse_kwargs).compute()
+        return coarse_model.A
+
+    def correct(self, G_new, F_old, G_old):
+        """
+        Parareal-Korrektur G(U_n^neu) + F(U_n^alt) - G(U_n^alt), gekürzt mit max_rank_r und eps_k.
+        """
+        A, errors = [], {}
+        for ii, s in enumerate(("S", "I")):
+            x, err, _ = (G_new[ii] + F_old[ii] - G_old[ii]).evaluate(max_rank=self.model.max_rank_r,
+                                                                     abs_err=self.model.eps_k)
+            A.append(x)
+            errors[s] = get_error(err)
+        return A, errors
+
+
+class SnapshotRecorder:
+    """
+    Ersatz für den OutputHandler in den Teilläufen: Speichert die Zustände der vollen Tage samt Fehlerschranken und
+    Rängen im Speicher, statt sie auf die Festplatte zu schreiben.
+    """
+    def __init__(self, model, record=True):
+        self.model = model
+        self.record = record
+        self.snapshots = []
+
+    def write_snapshot(self, t):
+        if self.record:
+            self.snapshots.append((t, list(self.model.A), dict(self.model.error), dict(self.model.rank)))
+
+    def write_solution(self, t):
+        pass
+
+
+def init_worker(model, integrator, kwargs, blas_threads):
+    """
+    Helferfunktion: Initialisiert einen Worker-Prozess mit dem Modell und dem feinen Propagator. Das Modell wird so
+    nur einmal je Prozess übertragen.
+    """
+    if blas_threads is not None:
+        # Die Verfügbarkeit von threadpoolctl wird bereits in PararealVerfahren.__init__ geprüft
+        from threadpoolctl import threadpool_limits
+        _worker["limits"] = threadpool_limits(limits=blas_threads, user_api="blas")
+    _worker["model"] = model
+    _worker["integrator"] = integrator
+    _worker["kwargs"] = kwargs
+
+
+def fine_propagate(A, grid):
+    """
+    Helferfunktion: Feiner Propagator im Worker-Prozess. Löst das Modell auf dem Gitter 'grid' mit Startwert 'A' und
+    gibt die Lösung, die Snapshots der vollen Tage und die Fehlerschranken zurück.
+    """
+    model = _worker["model"]
+    model.A0 = A
+    model.t_disc = grid
+    recorder = SnapshotRecorder(model)
+    _worker["integrator"](model, recorder, **_worker["kwargs"]).compute()
+    return model.A, recorder.snapshots, dict(model.error)
+
+
+def relative_change(x, y):
+    """
+    Helferfunktion: Größte relative Änderung ||x_i - y_i|| / ||x_i|| der Zustände 'x' und 'y' über die Kompartimente
+    S und I. So wird auch die Konvergenz des deutlich kleineren Kompartiments I geprüft.
+    """
+    change = 0.
+    for ii in range(2):
+        diff = HTucker.norm(HTucker.add(x[ii], HTucker.scalar_mul(y[ii], -1.)))
+        change = max(change, diff / max(HTucker.norm(x[ii]), 1e-300))
+    return change
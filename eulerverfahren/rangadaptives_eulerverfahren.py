@@ -6,24 +6,28 @@ from utils.misc_utils.get_error import get_error
 class RangadaptivesEulerverfahren:
     """
     Rangadaptives Eulerverfahren
+    Ist 'fused' gesetzt, wird die ungekürzte rechte Seite des Modells (siehe rhs_lazy) direkt mit der aktuellen
+    Lösung zu A + tau * rhs zusammengefasst und in einem einzigen Durchlauf gekürzt. Die separate Kürzung der rechten
+    Seite entfällt dann.
     """
-    def __init__(self, model, output_handler):
+    def __init__(self, model, output_handler, fused=False, progress=True):
+        if not isinstance(progress, bool):
+            raise TypeError("'progress' muss vom Typ bool sein.")
+        if not isinstance(fused, bool):
+            raise TypeError("'fused' muss vom Typ bool sein.")
         self.model = model
         self.output_handler = output_handler
+        self.progress = progress
+        self.fused = fused
 
     def compute(self):
         self.model.A = self.model.A0
         tau = self.model.t_disc[1] - self.model.t_disc[0]    # Konstante Zeitschrittweite
-        for t in tqdm(self.model.t_disc[:-1], smoothing=0):
-            # Aktuelle Lösung
-            # Berechnung rhs
-            rhs_S, rhs_I = self.model.rhs(t)
-            # Update der Lösung
-            S = HTucker.add(x=self.model.A[0], y=HTucker.scalar_mul(x=rhs_S, a=tau))
-            I = HTucker.add(x=self.model.A[1], y=HTucker.scalar_mul(x=rhs_I, a=tau))
-            # Kürzen der Lösung
-            S, err_S, _ = HTucker.truncate_htucker(x=S, max_rank=self.model.max_rank_r, abs_err=self.model.eps_k)
-            I, err_I, _ = HTucker.truncate_htucker(x=I, max_rank=self.model.max_rank_r, abs_err=self.model.eps_k)
+        for t in tqdm(self.model.t_disc[:-1], smoothing=0, disable=not self.progress):
+            if self.fused:
+                S, I, err_S, err_I = self.step_fused(tau, t)
+            else:
+                S, I, err_S, err_I = self.step(tau, t)
             A_next = [S,I]
             # Speichern eines Snapshots für jeden vollen Tag
             if round(t) == t:
@@ -41,3 +45,31 @@ class RangadaptivesEulerverfahren:
         # Schreibe letzte Lösung
         self.output_handler.write_solution(round(self.model.t_disc[-1]))
 
+    def step(self, tau, t):
+        """
+        Ein Zeitschritt: Die gekürzte rechte Seite wird zur aktuellen Lösung addiert und die Summe erneut gekürzt.
+        """
+        # Aktuelle Lösung
+        # Berechnung rhs
+        rhs_S, rhs_I = self.model.rhs(t)
+        # Update der Lösung
+        S = HTucker.add(x=self.model.A[0], y=HTucker.scalar_mul(x=rhs_S, a=tau))
+        I = HTucker.add(x=self.model.A[1], y=HTucker.scalar_mul(x=rhs_I, a=tau))
+        # Kürzen der Lösung
+        S, err_S, _ = HTucker.truncate_htucker(x=S, max_rank=self.model.max_rank_r, abs_err=self.model.eps_k)
+        I, err_I, _ = HTucker.truncate_htucker(x=I, max_rank=self.model.max_rank_r, abs_err=self.model.eps_k)
+        return S, I, err_S, err_I
+
+    def step_fused(self, tau, t):
+        """
+        Ein Zeitschritt: Aktuelle Lösung und ungekürzte Summanden der rechten Seite werden mit einem einzigen Aufruf
+        von HTucker.add_and_truncate addiert und gekürzt.
+        """
+        # Berechnung der ungekürzten rhs
+        rhs_S, rhs_I = self.model.rhs_lazy(t)
+        # Update und Kürzen der Lösung
+        S, err_S, _ = (self.model.A[0] + tau * rhs_S).evaluate(max_rank=self.model.max_rank_r,
+                                                                abs_err=self.model.eps_k)
+        I, err_I, _ = (self.model.A[1] + tau * rhs_I).evaluate(max_rank=self.model.max_rank_r,
+                                                                abs_err=self.model.eps_k)
+        return S, I, err_S, err_I
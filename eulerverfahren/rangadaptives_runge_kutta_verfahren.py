@@ -0,0 +1,69 @@
+from tqdm import tqdm
+from utils.misc_utils.get_error import get_error
+from .explizites_runge_kutta_verfahren import SHU_OSHER, check_order
+
+
+class RangadaptivesRungeKuttaVerfahren:
+    """
+    Rangadaptives Runge-Kutta-Verfahren der Ordnung 'order' (siehe SHU_OSHER)
+    Jede Stufe ist eine Linearkombination der vorherigen Stufen und der ungekürzten rechten Seiten (siehe rhs_lazy),
+    die mit einem einzigen Aufruf von HTucker.add_and_truncate gebildet und gekürzt wird. Gekürzt wird damit einmal
+    je Stufe, die Ränge der Stufen sind durch max_rank_r beschränkt.
+    """
+    def __init__(self, model, output_handler, order=2, progress=True):
+        if not isinstance(progress, bool):
+            raise TypeError("'progress' muss vom Typ bool sein.")
+        check_order(order)
+        self.model = model
+        self.output_handler = output_handler
+        self.progress = progress
+        self.order = order
+
+    def compute(self):
+        self.model.A = self.model.A0
+        tau = self.model.t_disc[1] - self.model.t_disc[0]    # Konstante Zeitschrittweite
+        for t in tqdm(self.model.t_disc[:-1], smoothing=0, disable=not self.progress):
+            S, I, err_S, err_I = self.step(tau, t)
+            A_next = [S, I]
+            # Speichern eines Snapshots für jeden vollen Tag
+            if round(t) == t:
+                # Uebergabe an den OutputHandler
+                self.output_handler.write_snapshot(round(t))
+            # Übernahme neuer Lösung
+            self.model.A = A_next
+            # Update Error
+            self.model.error["S"] = get_error(err_S)
+            self.model.error["I"] = get_error(err_I)
+            # Update rank
+            self.model.rank["S"] = max(S.rank.values())
+            self.model.rank["I"] = max(I.rank.values())
+
+        # Schreibe letzte Lösung
+        self.output_handler.write_solution(round(self.model.t_disc[-1]))
+
+    def step(self, tau, t):
+        """
+        Ein Zeitschritt: Die Stufen werden nacheinander gebildet und jeweils gekürzt. Zurückgegeben werden die letzte
+        Stufe und deren Kürzungsfehler.
+        """
+        table = SHU_OSHER[self.order]
+        A = self.model.A
+        stages = [A]
+        rhs = []
+        for alpha, beta in zip(table["alpha"], table["beta"]):
+            # Ungekürzte rechte Seite der zuletzt berechneten Stufe
+            self.model.A = stages[-1]
+            rhs.append(self.model.rhs_lazy(t + table["c"][len(rhs)] * tau))
+            stage = []
+            errors = []
+            for ii in range(2):
+                terms = [alpha[j] * stages[j][ii] for j in range(len(alpha)) if alpha[j] != 0]
+                terms += [tau * beta[j] * rhs[j][ii] for j in range(len(beta)) if beta[j] != 0]
+                x, err, _ = sum(terms[1:], terms[0]).evaluate(max_rank=self.model.max_rank_r,
+                                                              abs_err=self.model.eps_k)
+                stage.append(x)
+                errors.append(err)
+            stages.append(stage)
+        self.model.A = A
+        S, I = stages[-1]
+        return S, I, errors[0], errors[1]
@@ -0,0 +1,71 @@
+import numpy as np
+from tensor.utils.precision import to_accumulation
+from .left_svd_gramian import left_svd_gramian_unchecked
+from .left_svd_qr import left_svd_qr
+
+# Verfügbare Verfahren zur Berechnung der linken Singulärvektoren
+# "svd":     Direkte (dünne) Singulärwertzerlegung
+# "qr":      QR-Zerlegung mit anschließender Singulärwertzerlegung des R-Faktors (siehe 'left_svd_qr')
+# "gramian": Eigenwertzerlegung der Gram'schen Matrix (siehe 'left_svd_gramian')
+METHODS = ("svd", "qr", "gramian")
+
+# Die Gram'sche Matrix quadriert die Kondition. Singulärwerte unterhalb von etwa sqrt(eps) * s_max werden damit nicht
+# mehr aufgelöst. Das Verfahren "gramian" kommt daher nur für relative Toleranzen ab diesem Wert in Frage
+GRAMIAN_MIN_REL_TOL = 1e-7
+
+
+def left_svd_flops(m, n, method):
+    """
+    Kostenmodell: Schätzt die Anzahl der Gleitkommaoperationen, um die linken Singulärvektoren einer (m x n)-Matrix
+    mit dem Verfahren 'method' zu berechnen (nach Golub/Van Loan, Matrix Computations).
+    @param m: positiver int
+    @param n: positiver int
+    @param method: "svd", "qr" oder "gramian"
+    @return: float
+    """
+    m, n = float(m), float(n)
+    if method == "svd":
+        # Bidiagonalisierung samt Akkumulation von U
+        if m <= n:
+            return 4 * m ** 2 * n + 22 * m ** 3
+        return 14 * m * n ** 2 + 8 * n ** 3
+    if method == "qr":
+        if m > n:
+            # QR-Zerlegung mit explizitem Q, SVD von R und Produkt Q @ u
+            return 4 * m * n ** 2 + 22 * n ** 3 + 2 * m * n ** 2
+        # Nur der R-Faktor von x^T wird benötigt
+        return 2 * n * m ** 2 - 2 / 3 * m ** 3 + 22 * m ** 3
+    if method == "gramian":
+        # Symmetrisches Produkt x x^T und symmetrische Eigenwertzerlegung
+        return m ** 2 * n + 9 * m ** 3
+    raise ValueError("'method' muss einer der Strings 'svd', 'qr', 'gramian' sein.")
+
+
+def select_left_svd(m, n, allow_gramian=True):
+    """
+    Wählt gemäß 'left_svd_flops' das günstigste Verfahren für eine (m x n)-Matrix aus.
+    @param m: positiver int
+    @param n: positiver int
+    @param allow_gramian: bool. Falls False, wird "gramian" nicht berücksichtigt
+    @return: str
+    """
+    methods = [method for method in METHODS if allow_gramian or method != "gramian"]
+    return min(methods, key=lambda method: left_svd_flops(m, n, method))
+
+
+def left_svd_unchecked(x, method, k=None):
+    """
+    Berechnet die linken Singulärvektoren und Singulärwerte der Matrix 'x' mit dem Verfahren 'method', ohne Prüfung
+    der Argumente. 'k' wird an 'left_svd_gramian' weitergereicht.
+    @param x: 2-D np.ndarray
+    @param method: "svd", "qr" oder "gramian"
+    @param k: positiver int oder None
+    @return: (2-D np.ndarray, 1-D np.ndarray)
+    """
+    if method == "svd":
+        u, s, _ = np.linalg.svd(x, full_matrices=False)
+        return u, s
+    if method == "qr":
+        return left_svd_qr(x)
+    x = to_accumulation(x)
+    return left_svd_gramian_unchecked(x @ x.T, k)
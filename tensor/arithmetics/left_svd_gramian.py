@@ -1,23 +1,129 @@
 import numpy as np
+import scipy.linalg
+from tensor.utils.validation import check_cheap, check_full
+from tensor.utils.parallel import map_nodes
+from tensor.utils.precision import to_accumulation
 
+# Verfügbare Backends für die Eigenwertzerlegung der Gram'schen Matrizen
+# "eig":          Allgemeine Eigenwertzerlegung (np.linalg.eig), ursprüngliche Implementierung
+# "eigh":         Symmetrische Eigenwertzerlegung (np.linalg.eigh), gleich große Matrizen werden gestapelt zerlegt
+# "eigh_partial": Symmetrische Eigenwertzerlegung, die nur die k führenden Eigenpaare berechnet (LAPACK syevr)
+BACKENDS = ("eig", "eigh", "eigh_partial")
 
-def left_svd_gramian(x):
+# Global voreingestelltes Backend. Alternativ kann eine Funktion f(x, k) -> (u, s) gesetzt werden.
+_backend = "eigh"
+
+
+def set_gramian_backend(backend):
+    """
+    Setzt das global voreingestellte Backend zur Berechnung der linken Singulärvektoren aus Gram'schen Matrizen.
+    Eine übergebene Funktion erhält die Gram'sche Matrix 'x' sowie die Anzahl 'k' der benötigten führenden Paare
+    (oder None) und gibt wie 'left_svd_gramian' ein Tupel (u, s) zurück.
+    @param backend: "eig", "eigh", "eigh_partial" oder callable
+    """
+    global _backend
+    if not callable(backend):
+        if not isinstance(backend, str):
+            raise TypeError("'backend' muss einer der Strings 'eig', 'eigh', 'eigh_partial' oder callable sein.")
+        if backend not in BACKENDS:
+            raise ValueError("'backend' muss einer der Strings 'eig', 'eigh', 'eigh_partial' oder callable sein.")
+    _backend = backend
+
+
+def get_gramian_backend():
+    """
+    Gibt das global voreingestellte Backend zurück.
+    @return: str oder callable
+    """
+    return _backend
+
+
+def left_svd_gramian(x, k=None):
     """
     Berechnet die linken Singulärvektoren und zugehörigen Singulärwerte einer Matrix A, wobei das übergebene
     Argument 'x' AA^T entspricht. Die Berechnung basiert auf einer Eigenwertzerlegung von 'x'.
+    Mit 'k' kann angegeben werden, dass nur die k führenden Paare benötigt werden. Davon macht nur das Backend
+    "eigh_partial" Gebrauch (siehe 'svd_eigh_partial').
     @param x: 2-D np.ndarray
+    @param k: positiver int oder None
     @return: (2-D np.ndarray, 1-D np.ndarray)
     """
     # Argument checks
-    if not isinstance(x, np.ndarray):
-        raise TypeError("'x' muss ein symmetrischer 2-D np.ndarray sein.")
-    if not len(x.shape) == 2:
-        raise ValueError("'x' muss ein symmetrischer 2-D np.ndarray sein.")
-    if not x.shape[0] == x.shape[1]:
-        raise ValueError("'x' muss ein symmetrischer 2-D np.ndarray sein.")
-    if not np.allclose(x, x.T):
-        raise ValueError("'x' muss ein symmetrischer 2-D np.ndarray sein.")
+    if check_cheap():
+        if not isinstance(x, np.ndarray):
+            raise TypeError("'x' muss ein symmetrischer 2-D np.ndarray sein.")
+        if not len(x.shape) == 2:
+            raise ValueError("'x' muss ein symmetrischer 2-D np.ndarray sein.")
+        if not x.shape[0] == x.shape[1]:
+            raise ValueError("'x' muss ein symmetrischer 2-D np.ndarray sein.")
+        if k is not None:
+            if not np.issubdtype(type(k), np.integer):
+                raise TypeError("'k' muss ein positiver int sein.")
+            if not k >= 1:
+                raise ValueError("'k' muss ein positiver int sein.")
+    if check_full():
+        # Quadratischer Aufwand
+        if not np.allclose(x, x.T):
+            raise ValueError("'x' muss ein symmetrischer 2-D np.ndarray sein.")
+
+    return left_svd_gramian_unchecked(x, k)
+
+
+def left_svd_gramian_unchecked(x, k=None):
+    """
+    Wie 'left_svd_gramian', jedoch ohne Prüfung der Argumente. Für bibliotheksinterne Aufrufe, deren Gram'sche
+    Matrizen konstruktionsbedingt symmetrisch sind.
+    Die Eigenwertzerlegung wird unabhängig vom Datentyp von 'x' in np.float64 berechnet.
+    @param x: 2-D np.ndarray
+    @param k: positiver int oder None
+    @return: (2-D np.ndarray, 1-D np.ndarray)
+    """
+    x = to_accumulation(x)
+    backend = _backend
+    if callable(backend):
+        return backend(x, k)
+    if backend == "eig":
+        return svd_eig(x)
+    if backend == "eigh_partial" and k is not None and k < x.shape[0]:
+        return svd_eigh_partial(x, k)
+    u, s = svd_eigh(x[np.newaxis])
+    return u[0], s[0]
+
+
+def left_svd_gramian_batched(xs, k=None, executor=None):
+    """
+    Wendet 'left_svd_gramian_unchecked' auf alle Gram'schen Matrizen aus 'xs' an. Mit dem Backend "eigh" werden
+    gleich große Matrizen dabei in einem einzigen gestapelten Aufruf zerlegt. Ist 'executor' übergeben oder global
+    gesetzt (siehe tensor.utils.parallel), werden die Stapel bzw. Matrizen parallel zerlegt.
+    @param xs: list aus 2-D np.ndarrays
+    @param k: positiver int oder None
+    @param executor: concurrent.futures.Executor oder None
+    @return: list aus (2-D np.ndarray, 1-D np.ndarray)
+    """
+    if _backend != "eigh":
+        return map_nodes(lambda x: left_svd_gramian_unchecked(x, k), xs, executor)
+
+    # Gruppiere die Matrizen nach ihrer Größe
+    xs = [to_accumulation(x) for x in xs]
+    groups = {}
+    for ii, x in enumerate(xs):
+        groups.setdefault(x.shape, []).append(ii)
+    shapes = list(groups.keys())
+
+    results = [None] * len(xs)
+    decompositions = map_nodes(lambda shape: svd_eigh(np.stack([xs[ii] for ii in groups[shape]])), shapes, executor)
+    for shape, (u, s) in zip(shapes, decompositions):
+        for jj, ii in enumerate(groups[shape]):
+            results[ii] = (u[jj], s[jj])
+    return results
+
 
+# Backends
+
+def svd_eig(x):
+    """
+    Backend "eig": Allgemeine Eigenwertzerlegung von 'x'.
+    """
     # Eigenwertzerlegung
     s, u = np.linalg.eig(x)
 
@@ -36,3 +142,35 @@ def left_svd_gramian(x):
     u = u[:, idc]
 
     return u, s
+
+
+def svd_eigh(xs):
+    """
+    Backend "eigh": Symmetrische Eigenwertzerlegung eines Stapels 'xs' gleich großer Gram'scher Matrizen der Form
+    (Anzahl, n, n). Gibt die Stapel der linken Singulärvektoren und Singulärwerte zurück.
+    """
+    # Symmetrisieren entfernt Rundungsfehler, die Eigenwerte sind damit reell und bereits sortiert
+    xs = 0.5 * (xs + np.swapaxes(xs, 1, 2))
+    lam, u = np.linalg.eigh(xs)
+
+    # Absteigende Reihenfolge. Durch Rundungsfehler negative Eigenwerte werden auf 0 gesetzt
+    s = np.sqrt(np.maximum(lam[:, ::-1], 0))
+    u = np.ascontiguousarray(u[:, :, ::-1])
+    return u, s
+
+
+def svd_eigh_partial(x, k):
+    """
+    Backend "eigh_partial": Berechnet nur die k führenden Eigenpaare der Gram'schen Matrix 'x'.
+    Zurückgegeben werden die k führenden linken Singulärvektoren sowie k + 1 Singulärwerte. Der letzte Singulärwert
+    fasst die übrigen zusammen, er ergibt sich aus der Spur von 'x'. Damit bleibt die Summe der quadrierten
+    Singulärwerte erhalten und 'trunc_rank' bestimmt Rang und Fehler für alle Ränge bis k exakt.
+    """
+    n = x.shape[0]
+    x = 0.5 * (x + x.T)
+    lam, u = scipy.linalg.eigh(x, subset_by_index=[n - k, n - 1], driver="evr")
+    lam = np.maximum(lam[::-1], 0)
+    u = np.ascontiguousarray(u[:, ::-1])
+    rest = max(np.trace(x) - np.sum(lam), 0)
+    s = np.sqrt(np.append(lam, rest))
+    return u, s
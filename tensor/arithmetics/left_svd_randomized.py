@@ -0,0 +1,103 @@
+import numpy as np
+import scipy.fft
+from tensor.utils.validation import check_cheap
+
+# Verfügbare Skizzen zur Bestimmung des führenden Unterraums
+# "gaussian": Produkt mit einer Gauß'schen Zufallsmatrix
+# "srft":     Strukturierte Skizze aus zufälligen Vorzeichen, diskreter Kosinustransformation und zufälliger Auswahl
+#             von Spalten (subsampled randomized trigonometric transform)
+SKETCHES = ("gaussian", "srft")
+
+
+def left_svd_randomized(x, k, oversampling=10, power_iterations=1, sketch="gaussian", seed=None):
+    """
+    Berechnet näherungsweise die k + 'oversampling' führenden linken Singulärvektoren samt zugehöriger Singulärwerte
+    von 'x' (randomisierter Range-Finder nach Halko, Martinsson und Tropp). Der Bildraum von 'x' wird dazu mit einer
+    Skizze aus k + 'oversampling' Spalten erfasst und mit 'power_iterations' Potenziterationen verfeinert. Die
+    Singulärwertzerlegung wird anschließend nur auf der Projektion von 'x' auf diesen Unterraum berechnet. Der
+    Aufwand sinkt damit von O(m n min(m, n)) auf O(m n k).
+    Wie beim Backend "eigh_partial" (siehe 'left_svd_gramian') wird ein zusätzlicher letzter Singulärwert
+    zurückgegeben, der den nicht erfassten Anteil zusammenfasst. Er entspricht exakt der Frobeniusnorm des Fehlers der
+    Projektion, sodass 'trunc_rank' weiterhin gültige Fehlerschranken bestimmt.
+    Ist k + 'oversampling' nicht kleiner als min(m, n), wird direkt zerlegt.
+    @param x: 2-D np.ndarray
+    @param k: positiver int
+    @param oversampling: nicht-negativer int
+    @param power_iterations: nicht-negativer int
+    @param sketch: "gaussian" oder "srft"
+    @param seed: int, np.random.Generator oder None
+    @return: (2-D np.ndarray, 1-D np.ndarray)
+    """
+    # Argument checks
+    if check_cheap():
+        if not isinstance(x, np.ndarray):
+            raise TypeError("'x' muss ein 2-D np.ndarray sein.")
+        if not len(x.shape) == 2:
+            raise ValueError("'x' muss ein 2-D np.ndarray sein.")
+        check_randomized(k, oversampling, power_iterations, sketch)
+
+    return left_svd_randomized_unchecked(x, k, oversampling, power_iterations, sketch, np.random.default_rng(seed))
+
+
+def left_svd_randomized_unchecked(x, k, oversampling, power_iterations, sketch, rng):
+    """
+    Wie 'left_svd_randomized', jedoch ohne Prüfung der Argumente und mit dem Zufallszahlengenerator 'rng'.
+    @param x: 2-D np.ndarray
+    @param k: positiver int
+    @param oversampling: nicht-negativer int
+    @param power_iterations: nicht-negativer int
+    @param sketch: "gaussian" oder "srft"
+    @param rng: np.random.Generator
+    @return: (2-D np.ndarray, 1-D np.ndarray)
+    """
+    m, n = x.shape
+    l = k + oversampling
+    if l >= min(m, n):
+        u, s, _ = np.linalg.svd(x, full_matrices=False)
+        return u, s
+
+    # Skizze des Bildraums
+    if sketch == "gaussian":
+        Y = x @ rng.standard_normal((n, l))
+    else:
+        signs = rng.choice([-1., 1.], size=n)
+        columns = rng.choice(n, size=l, replace=False)
+        Y = scipy.fft.dct(x * signs, axis=1, norm="ortho")[:, columns]
+    q, _ = np.linalg.qr(Y, mode="reduced")
+
+    # Potenziteration. Die Reorthogonalisierung in jedem Schritt verhindert Auslöschung
+    for _ in range(power_iterations):
+        z, _ = np.linalg.qr(x.T @ q, mode="reduced")
+        q, _ = np.linalg.qr(x @ z, mode="reduced")
+
+    # Singulärwertzerlegung der Projektion
+    projected = q.T @ x
+    u, s, _ = np.linalg.svd(projected, full_matrices=False)
+    u = q @ u
+
+    # Der letzte Singulärwert fasst den nicht erfassten Anteil zusammen. Er wird direkt aus dem Residuum berechnet,
+    # die Differenz ||x||^2 - ||s||^2 wäre durch Auslöschung nur bis auf etwa sqrt(eps) * ||x|| genau
+    rest = np.linalg.norm(x - q @ projected)
+    return u, np.append(s, rest)
+
+
+def check_randomized(k, oversampling, power_iterations, sketch):
+    """
+    Helferfunktion: Prüft die Parameter des randomisierten Range-Finders.
+    """
+    if not np.issubdtype(type(k), np.integer):
+        raise TypeError("'k' muss ein positiver int sein.")
+    if not k >= 1:
+        raise ValueError("'k' muss ein positiver int sein.")
+    if not np.issubdtype(type(oversampling), np.integer):
+        raise TypeError("'oversampling' muss ein nicht-negativer int sein.")
+    if not oversampling >= 0:
+        raise ValueError("'oversampling' muss ein nicht-negativer int sein.")
+    if not np.issubdtype(type(power_iterations), np.integer):
+        raise TypeError("'power_iterations' muss ein nicht-negativer int sein.")
+    if not power_iterations >= 0:
+        raise ValueError("'power_iterations' muss ein nicht-negativer int sein.")
+    if not isinstance(sketch, str):
+        raise TypeError("'sketch' muss einer der Strings 'gaussian', 'srft' sein.")
+    if sketch not in SKETCHES:
+        raise ValueError("'sketch' muss einer der Strings 'gaussian', 'srft' sein.")
@@ -1,4 +1,5 @@
 import numpy as np
+from tensor.utils.validation import check_cheap
 
 
 def mode_multiplication(U, A, mu):
@@ -10,21 +11,35 @@ def mode_multiplication(U, A, mu):
     @return: np.ndarray
     """
     # Argument checks
-    if not isinstance(U, np.ndarray):
-        raise TypeError("'U' muss ein 2D-np.ndarray sein.")
-    if not len(U.shape) == 2:
-        raise ValueError("'U' muss ein 2D-np.ndarray sein.")
-    if not isinstance(A, np.ndarray):
-        raise TypeError("'A' muss ein ND-np.array mit N >= 1 sein.")
-    if not len(A.shape) >= 1:
-        raise ValueError("'A' muss ein ND-np.array mit N >= 1 sein.")
-    if not np.issubdtype(type(mu), np.integer):
-        raise TypeError("'mu' muss ein int mit 0 <= mu < len(A.shape) sein.")
-    if not (0 <= mu < len(A.shape)):
-        raise ValueError("'mu' muss ein int mit 0 <= mu < len(A.shape) sein.")
-    if not U.shape[1] == A.shape[mu]:
-        raise ValueError("U.shape[1] und A.shape[mu] müssen übereinstimmen.")
+    # Sämtliche Prüfungen haben konstanten Aufwand
+    if check_cheap():
+        if not isinstance(U, np.ndarray):
+            raise TypeError("'U' muss ein 2D-np.ndarray sein.")
+        if not len(U.shape) == 2:
+            raise ValueError("'U' muss ein 2D-np.ndarray sein.")
+        if not isinstance(A, np.ndarray):
+            raise TypeError("'A' muss ein ND-np.array mit N >= 1 sein.")
+        if not len(A.shape) >= 1:
+            raise ValueError("'A' muss ein ND-np.array mit N >= 1 sein.")
+        if not np.issubdtype(type(mu), np.integer):
+            raise TypeError("'mu' muss ein int mit 0 <= mu < len(A.shape) sein.")
+        if not (0 <= mu < len(A.shape)):
+            raise ValueError("'mu' muss ein int mit 0 <= mu < len(A.shape) sein.")
+        if not U.shape[1] == A.shape[mu]:
+            raise ValueError("U.shape[1] und A.shape[mu] müssen übereinstimmen.")
 
+    return mode_multiplication_unchecked(U, A, mu)
+
+
+def mode_multiplication_unchecked(U, A, mu):
+    """
+    Berechnet die Modusmultiplikation U o_{mu} A ohne Prüfung der Argumente. Für bibliotheksinterne Aufrufe mit
+    bereits konsistenten Operanden.
+    @param U: 2-D np.ndarray
+    @param A: N-D np.ndarray
+    @param mu: nicht-negativer int
+    @return: np.ndarray
+    """
     # Multiplizieren
     product = np.tensordot(U, A, axes=(1, mu))
     # Permutieren der Modi, sodass die vorherige Reihenfolge wiederhergestellt wird
@@ -1,4 +1,5 @@
 import numpy as np
+from tensor.utils.validation import check_cheap, check_full
 
 
 def multi_mul(x, U, modes):
@@ -10,29 +11,30 @@ def multi_mul(x, U, modes):
     @return: ND-np.ndarray
     """
     # Argument checks
-    if not isinstance(x, np.ndarray):
-        raise ValueError("'x' muss ein ND-np.ndarray mit N >= 1 sein.")
-    if not len(x.shape) >= 1:
-        raise ValueError("'x' muss ein ND-np.ndarray mit N >= 1 sein.")
-    if not isinstance(U, list):
-        raise ValueError("'U' muss eine list bestehnd aus 2D-np.ndarrays sein.")
-    if not all(isinstance(item, np.ndarray) for item in U):
-        raise ValueError("'U' muss eine list bestehnd aus 2D-np.ndarrays sein.")
-    if not all(len(item.shape) == 2 for item in U):
-        raise ValueError("'U' muss eine list bestehnd aus 2D-np.ndarrays sein.")
-    if not isinstance(modes, list):
-        raise ValueError("'modes' muss eine list nicht-negativer ints ohne Duplikate sein.")
-    if not all(np.issubdtype(type(item), np.integer) for item in modes):
-        raise ValueError("'modes' muss eine list nicht-negativer ints ohne Duplikate sein.")
-    if not all(item >= 0 for item in modes):
-        raise ValueError("'modes' muss eine list nicht-negativer ints ohne Duplikate sein.")
-    if not len(modes) == len(set(modes)):
-        raise ValueError("'modes' muss eine list nicht-negativer ints ohne Duplikate sein.")
-    if not all(item < len(x.shape) for item in modes):
-        raise ValueError("'modes' und 'x' sind nicht kompatibel.")
-    if not all(U[item].shape[1] == x.shape[item] for item in modes):
-        raise ValueError("'x', 'U' und 'modes' sind nicht kompativel.")
+    if check_cheap():
+        if not isinstance(x, np.ndarray):
+            raise ValueError("'x' muss ein ND-np.ndarray mit N >= 1 sein.")
+        if not len(x.shape) >= 1:
+            raise ValueError("'x' muss ein ND-np.ndarray mit N >= 1 sein.")
+        if not isinstance(U, list):
+            raise ValueError("'U' muss eine list bestehnd aus 2D-np.ndarrays sein.")
+        if not isinstance(modes, list):
+            raise ValueError("'modes' muss eine list nicht-negativer ints ohne Duplikate sein.")
+    if check_full():
+        check_multi_mul(x, U, modes)
 
+    return multi_mul_unchecked(x, U, modes)
+
+
+def multi_mul_unchecked(x, U, modes):
+    """
+    Berechnet die multilineare Multiplikation U o x ohne Prüfung der Argumente. Für bibliotheksinterne Aufrufe mit
+    bereits konsistenten Operanden.
+    @param x: ND-np.ndarray
+    @param U: list of 2D-np.ndarrays
+    @param modes: list nicht-negativer ints
+    @return: ND-np.ndarray
+    """
     product = None
     for i in range(len(U)):
         if product is None:
@@ -47,5 +49,21 @@ def multi_mul(x, U, modes):
     return product
 
 
-
-
+def check_multi_mul(x, U, modes):
+    """
+    Helferfunktion: Prüft die Einträge von 'U' und 'modes' sowie deren Kompatibilität mit 'x'.
+    """
+    if not all(isinstance(item, np.ndarray) for item in U):
+        raise ValueError("'U' muss eine list bestehnd aus 2D-np.ndarrays sein.")
+    if not all(len(item.shape) == 2 for item in U):
+        raise ValueError("'U' muss eine list bestehnd aus 2D-np.ndarrays sein.")
+    if not all(np.issubdtype(type(item), np.integer) for item in modes):
+        raise ValueError("'modes' muss eine list nicht-negativer ints ohne Duplikate sein.")
+    if not all(item >= 0 for item in modes):
+        raise ValueError("'modes' muss eine list nicht-negativer ints ohne Duplikate sein.")
+    if not len(modes) == len(set(modes)):
+        raise ValueError("'modes' muss eine list nicht-negativer ints ohne Duplikate sein.")
+    if not all(item < len(x.shape) for item in modes):
+        raise ValueError("'modes' und 'x' sind nicht kompatibel.")
+    if not all(U[item].shape[1] == x.shape[item] for item in modes):
+        raise ValueError("'x', 'U' und 'modes' sind nicht kompativel.")
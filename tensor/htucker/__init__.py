@@ -1,16 +1,30 @@
 import numpy as np
 
 from tensor.utils.dimtree import dimtree
+from tensor.utils.validation import check_cheap, check_full
+from ._lazy import LazyHTucker
+from ._contraction_plan import ContractionPlan
 
 
 class HTucker:
     """
     Implementierung des hierarchischen Tuckerformats.
+    Blattmatrizen und Transfertensoren, die eine Operation nicht verändert, werden zwischen Eingabe und Ergebnis
+    geteilt. Sie sind daher als unveränderlich zu behandeln und dürfen nicht in-place modifiziert werden.
     """
+    __slots__ = ("U", "B", "dtree", "shape", "order", "rank", "is_orthog", "_buffer", "_layout")
+    # Verhindert, dass numpy Skalare (z.B. np.float64) die Operatoren elementweise auf ein Objektarray anwenden
+    __array_ufunc__ = None
+
     # Imported instance methods
-    from ._rebuild import full, rebuild_tensor_helper
+    from ._rebuild import full, rebuild_restricted, rebuild_tensor_helper
     from ._size import get_size
     from ._getitem import get
+    from ._gather import gather, fiber, slice
+    from ._reduce import reduce
+    from ._astype import astype
+    from ._compact import compact, is_compact, to_buffer, copy, __getstate__, __setstate__
+    from ._lazy import lazy, __add__, __radd__, __sub__, __rsub__, __neg__, __mul__, __rmul__
 
     # Imported static methods
     from ._trunc_rank import trunc_rank
@@ -21,11 +35,13 @@ class HTucker:
     from ._orthogonalize import orthogonalize
     from ._add import add
     from ._inner_product import inner_product
+    from ._inner_product_dense import inner_product_dense, distance_to_dense
     from ._mode_multiplication import mode_multiplication
     from ._ews_mode_multiplication import ews_mode_multiplication
     from ._norm import norm
     from ._gramians_orthog import gramians_orthog
     from ._contraction import contract
+    from ._contraction_plan import contraction_plan
     from ._change_root import change_root
     from ._change_dimtree import change_dimtree
     from ._squeeze import squeeze
@@ -35,15 +51,23 @@ class HTucker:
     from ._scalar_multiplication import scalar_mul
     from ._add_and_truncate import add_and_truncate
     from ._gramians_sum import gramians_sum
+    from ._compact import from_buffer
+    from ._from_function import from_function
+    from ._constructors import from_rank1, from_cp, from_kronecker
+    from ._truncate_out_of_core import truncate_out_of_core
+    from ._bug_step import bug_step
     truncate = classmethod(truncate)
     orthogonalize = classmethod(orthogonalize)
     add = classmethod(add)
     inner_product = classmethod(inner_product)
+    inner_product_dense = classmethod(inner_product_dense)
+    distance_to_dense = classmethod(distance_to_dense)
     mode_multiplication = classmethod(mode_multiplication)
     ews_mode_multiplication = classmethod(ews_mode_multiplication)
     norm = classmethod(norm)
     gramians_orthog = classmethod(gramians_orthog)
     contract = classmethod(contract)
+    contraction_plan = classmethod(contraction_plan)
     change_root = classmethod(change_root)
     change_dimtree = classmethod(change_dimtree)
     squeeze = classmethod(squeeze)
@@ -53,6 +77,13 @@ class HTucker:
     scalar_mul = classmethod(scalar_mul)
     add_and_truncate = classmethod(add_and_truncate)
     gramians_sum = classmethod(gramians_sum)
+    from_buffer = classmethod(from_buffer)
+    from_function = classmethod(from_function)
+    from_rank1 = classmethod(from_rank1)
+    from_cp = classmethod(from_cp)
+    from_kronecker = classmethod(from_kronecker)
+    truncate_out_of_core = classmethod(truncate_out_of_core)
+    bug_step = classmethod(bug_step)
 
     def __init__(self, U, B, dtree, is_orthog=False):
         """
@@ -64,31 +95,63 @@ class HTucker:
         @param dtree: tensor.utils.dimtree.dimtree
         @param is_orthog: bool
         """
-        if not isinstance(U, dict):
-            raise TypeError("'U' muss ein dict mit nicht-negativen ints als keys und 2D-np.ndarrays als values sein.")
+        if check_cheap():
+            if not isinstance(U, dict):
+                raise TypeError("'U' muss ein dict mit nicht-negativen ints als keys und 2D-np.ndarrays als values "
+                                "sein.")
+            if not isinstance(B, dict):
+                raise TypeError("'B' muss ein dict mit nicht-negativen ints als keys und 3D-np.ndarrays als values "
+                                "sein.")
+            if not isinstance(dtree, dimtree):
+                raise TypeError("'dtree' muss vom Typ tensor.utils.dimtree.dimtree sein.")
+            if not isinstance(is_orthog, bool):
+                raise TypeError("Falls übergeben, muss 'if_orthog vom Typ bool sein.")
+        if check_full():
+            self.check_entries(U, B, dtree)
+
+        self.assign(U, B, dtree, is_orthog)
+
+    @classmethod
+    def unchecked(cls, U, B, dtree, is_orthog=False):
+        """
+        Erzeugt eine neue HTucker Instanz ohne Prüfung der Argumente. Für bibliotheksinterne Aufrufe, deren Operanden
+        bereits konsistent sind.
+        @param U: dict. keys: nicht-negative ints, values: 2D-np.ndarrays
+        @param B: dict. keys: nicht-negative ints, values: 3D-np.ndarrays
+        @param dtree: tensor.utils.dimtree.dimtree
+        @param is_orthog: bool
+        @return: htucker.HTucker
+        """
+        z = cls.__new__(cls)
+        z.assign(U, B, dtree, is_orthog)
+        return z
+
+    @staticmethod
+    def check_entries(U, B, dtree):
+        """
+        Helferfunktion: Prüft sämtliche Einträge von 'U' und 'B' sowie deren Konsistenz mit 'dtree'.
+        """
         if not all(isinstance(v, np.ndarray) for v in U.values()):
             raise ValueError("'U' muss ein dict mit nicht-negativen ints als keys und 2D-np.ndarrays als values sein.")
         if not all(np.issubdtype(type(k), np.integer) for k in U.keys()):
             raise ValueError("'U' muss ein dict mit nicht-negativen ints als keys und 2D-np.ndarrays als values sein.")
         if not all(len(v.shape) == 2 for v in U.values()):
             raise ValueError("'U' muss ein dict mit nicht-negativen ints als keys und 2D-np.ndarrays als values sein.")
-        if not isinstance(B, dict):
-            raise TypeError("'B' muss ein dict mit nicht-negativen ints als keys und 3D-np.ndarrays als values sein.")
         if not all(isinstance(v, np.ndarray) for v in B.values()):
             raise ValueError("'B' muss ein dict mit nicht-negativen ints als keys und 3D-np.ndarrays als values sein.")
         if not all(np.issubdtype(type(k), np.integer) for k in B.keys()):
             raise ValueError("'B' muss ein dict mit nicht-negativen ints als keys und 3D-np.ndarrays als values sein.")
         if not all(len(v.shape) == 3 for v in B.values()):
             raise ValueError("'B' muss ein dict mit nicht-negativen ints als keys und 3D-np.ndarrays als values sein.")
-        if not isinstance(dtree, dimtree):
-            raise TypeError("'dtree' muss vom Typ tensor.utils.dimtree.dimtree sein.")
-        if not isinstance(is_orthog, bool):
-            raise TypeError("Falls übergeben, muss 'if_orthog vom Typ bool sein.")
         if not all(ind in U.keys() for ind in dtree.get_leaves()):
             raise ValueError("'U' und 'dtree' sind nicht konsistent.")
         if not all(ind in B.keys() for ind in dtree.get_inner_nodes()):
             raise ValueError("'B' und 'dtree' sind nicht konsistent.")
 
+    def assign(self, U, B, dtree, is_orthog):
+        """
+        Helferfunktion: Setzt die Attribute der Instanz.
+        """
         self.U = U
         self.B = B
         self.dtree = dtree
@@ -96,6 +159,9 @@ class HTucker:
         self.order = len(self.shape)
         self.rank = self.helper_get_rank()
         self.is_orthog = is_orthog
+        # Zusammenhängender Puffer samt Offset- und Shape-Tabelle (siehe 'compact')
+        self._buffer = None
+        self._layout = None
 
     def helper_get_shape(self):
         shape = []
@@ -113,6 +179,14 @@ class HTucker:
             rank[k] = v.shape[2]
         return rank
 
+    @property
+    def dtype(self):
+        """
+        Gemeinsamer Datentyp der Blattmatrizen und Transfertensoren.
+        @return: np.dtype
+        """
+        return np.result_type(*self.U.values(), *self.B.values())
+
     def update_shape(self):
         self.shape = self.helper_get_shape()
 
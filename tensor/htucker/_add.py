@@ -44,7 +44,7 @@ def add(cls, x, y):
         k_tl = kx[tl] + ky[tl]
         k_tr = kx[tr] + ky[tr]
         # Konstruiere Transfertensor
-        Bt = np.zeros((k_tl, k_tr, k_t))
+        Bt = np.zeros((k_tl, k_tr, k_t), dtype=np.result_type(x.B[t], y.B[t]))
         Bt[:kx[tl], :kx[tr], :kx[t]] = x.B[t]
         Bt[kx[tl]:, kx[tr]:, kx[t]:] = y.B[t]
         B[t] = Bt
@@ -57,11 +57,11 @@ def add(cls, x, y):
     k_tl = kx[tl] + ky[tl]
     k_tr = kx[tr] + ky[tr]
     # Konstruiere Transfertensor
-    Bt = np.zeros((k_tl, k_tr, k_t))
+    Bt = np.zeros((k_tl, k_tr, k_t), dtype=np.result_type(x.B[0], y.B[0]))
     Bt[:kx[tl], :kx[tr]] = x.B[0]
     Bt[kx[tl]:, kx[tr]:] = y.B[0]
     B[0] = Bt
 
     # Erstelle darauf aufbauend resultierenden HTucker Tensor
-    z = cls(U=U, B=B, dtree=dtree, is_orthog=False)
+    z = cls.unchecked(U=U, B=B, dtree=dtree, is_orthog=False)
     return z
@@ -1,21 +1,28 @@
 import numpy as np
 from tensor.utils.dimtree import equal
-from tensor.arithmetics.multilinear_mul import multi_mul
-from tensor.arithmetics.left_svd_gramian import left_svd_gramian
-from copy import deepcopy
-from tensor.transformation.matricise import matricise
+from tensor.arithmetics.multilinear_mul import multi_mul_unchecked as multi_mul
+from tensor.arithmetics.left_svd_gramian import left_svd_gramian_batched
+from tensor.transformation.matricise import matricise_unchecked as matricise
+from tensor.utils.parallel import map_nodes, check_executor
+from tensor.utils.precision import to_storage, to_accumulation
+from ._trunc_rank import trunc_rank_unchecked as trunc_rank
 
 
-def add_and_truncate(cls, summanden, max_rank, abs_err=None, rel_err=None, copy=True):
+def add_and_truncate(cls, summanden, max_rank, abs_err=None, rel_err=None, copy=True, executor=None):
     """
     Addiert die hierarchischen Tuckertensoren aus 'summanden' und kürzt gleichzeitig
     den hierarchischen Rang gemäß 'max_rank' und den übergebenen Fehlertoleranzen.
     Hinweis: Die zu addierenden hierarchischen Tuckertensoren müssen über identische Dimensionsbäume verfügen.
+    Ist 'executor' übergeben oder global gesetzt (siehe tensor.utils.parallel), werden die Knoten eines Levels parallel
+    bearbeitet.
+    QR-Zerlegungen und Gram'sche Matrizen werden in np.float64 berechnet, Blattmatrizen und Transfertensoren des
+    Ergebnisses liegen im Speicherdatentyp vor (siehe tensor.utils.precision).
     @param summanden: list aus htucker.HTucker Objekten
     @param max_rank: positiver int
     @param abs_err: positiver float
     @param rel_err: positiver float
-    @param copy: bool
+    @param copy: bool. Aus Kompatibilitätsgründen erhalten, die Summanden werden in keinem Fall verändert
+    @param executor: concurrent.futures.Executor oder None
     @return: htucker.HTucker
     """
 
@@ -44,9 +51,10 @@ def add_and_truncate(cls, summanden, max_rank, abs_err=None, rel_err=None, copy=
             raise ValueError("'rel_err' muss ein float > 0 sein.")
     if not isinstance(copy, bool):
         raise TypeError("'copy' muss ein bool sein.")
+    check_executor(executor)
 
-    if copy:
-        summanden = deepcopy(summanden)
+    # Die Summanden werden nur gelesen. Unabhängig von 'copy' genügt daher eine flache Kopie der Liste
+    summanden = list(summanden)
 
     # Variablen des resultierenden Htucker Tensors
     dtreez = summanden[0].dtree
@@ -63,76 +71,96 @@ def add_and_truncate(cls, summanden, max_rank, abs_err=None, rel_err=None, copy=
     if rel_err is not None:
         rel_err = rel_err / np.sqrt(2 * summanden[0].order - 2)
 
-    # Berechne QR-Zerlegung für jede Blattmatrix
-    for t in dtreez.get_leaves():
+    def qr_leaf(t):
         # Konkatenieren der t-Blattmatrizen aller Summanden
-        Uz[t] = np.hstack([htensor.U[t] for htensor in summanden])
+        Ut = to_accumulation(np.hstack([htensor.U[t] for htensor in summanden]))
         # QR Zerlegung
-        Q[t], R[t] = np.linalg.qr(Uz[t], mode="reduced")
-        Uz[t] = R[t]
+        return np.linalg.qr(Ut, mode="reduced")
+
+    # Berechne QR-Zerlegung für jede Blattmatrix
+    leaves = dtreez.get_leaves()
+    for t, (q, r) in zip(leaves, map_nodes(qr_leaf, leaves, executor)):
+        Q[t], R[t] = q, r
+        Uz[t] = r
 
     # Berechnung der reduzierten Gram'schen Matrizen der (impliziten) Summe
-    G = cls.gramians_sum(summanden)
+    G = cls.gramians_sum(summanden, executor=executor)
 
     # Knotenweise Fehler und Singulärwerte
     err = {}
     sv = {}
 
-    # Durchschreiten des Dimensionsbaums von unten nach oben
-    for level in range(dtreez.get_depth(), 0, -1):
-        for t in dtreez.get_nodes_of_level(level):
+    def reduce_node(t):
+        # Die Knoten eines Levels sind unabhängig voneinander, sie lesen nur die R-Faktoren ihrer Kinder
+        if dtreez.is_leaf(t):
+            core = Q[t]
+            Rt = R[t]
 
-            if dtreez.is_leaf(t):
-                Uz[t] = Q[t]
+        else:
+            # Kinder
+            l, r = dtreez.get_left(t), dtreez.get_right(t)
+            # Teilt R[l] und. R[r] auf in [R[l]_1, R[l]_2,...,R[l]_d]
+            # bzw. [R[r]_1, R[r]_2,...,R[r]_d], wobei d die Anzahl
+            # an Summanden ist
+            R_left = np.split(R[l], np.cumsum([htensor.rank[l] for htensor in summanden[:-1]]), axis=1)
+            R_right = np.split(R[r], np.cumsum([htensor.rank[r] for htensor in summanden[:-1]]), axis=1)
 
-            else:
-                # Kinder
-                l, r = dtreez.get_left(t), dtreez.get_right(t)
-                # Teilt R[l] und. R[r] auf in [R[l]_1, R[l]_2,...,R[l]_d]
-                # bzw. [R[r]_1, R[r]_2,...,R[r]_d], wobei d die Anzahl
-                # an Summanden ist
-                R_left = np.split(R[l], np.cumsum([htensor.rank[l] for htensor in summanden[:-1]]), axis=1)
-                R_right = np.split(R[r], np.cumsum([htensor.rank[r] for htensor in summanden[:-1]]), axis=1)
+            Bt = []
+            for jj in range(len(summanden)):
+                Bzt = np.tensordot(R_right[jj], summanden[jj].B[t], axes=[1, 1])
+                Bt += [np.tensordot(R_left[jj], Bzt, axes=[1, 1])]
+
+            Bt = np.concatenate(Bt, axis=2)
+
+            # Matriziere Bt
+            B_mat = matricise(Bt, t=[0, 1])
 
-                Bz[t] = []
-                for jj in range(len(summanden)):
-                    Bzt = np.tensordot(R_right[jj], summanden[jj].B[t], axes=[1, 1])
-                    Bz[t] += [np.tensordot(R_left[jj], Bzt, axes=[1, 1])]
+            # Berechne QR-Zerlegung
+            q, Rt = np.linalg.qr(B_mat, mode="reduced")
 
-                Bz[t] = np.concatenate(Bz[t], axis=2)
+            # Berechne shape des 'tensors' q
+            shape_new = np.array(Bt.shape)
+            shape_new[2] = q.shape[1]
 
-                # Matriziere Bz[t]
-                B_mat = matricise(Bz[t], t=[0, 1])
+            # Dematriziere Q zu Bt
+            core = q.reshape(shape_new, order="F")
 
-                # Berechne QR-Zerlegung
-                q, r = np.linalg.qr(B_mat, mode="reduced")
-                R[t] = r
+        # Update reduzierte Grammatrix
+        Gt = Rt @ G[t] @ Rt.T
+        return core, Rt, Gt
 
-                # Berechne shape des 'tensors' q
-                shape_new = np.array(Bz[t].shape)
-                shape_new[2] = q.shape[1]
+    def truncate_node(t, core, Rt, u, svt):
+        # Berechne den Rang, auf den gekürzt werden soll
+        k, errt, sat = trunc_rank(s=svt, max_rank=max_rank,
+                                  abs_err=abs_err, rel_err=rel_err)
 
-                # Dematriziere Q zu Bz[t]
-                Bz[t] = q.reshape(shape_new, order="F")
+        # Nehme entsprechend nur die k ersten Spalten mit
+        u = u[:, :k]
+        if dtreez.is_leaf(t):
+            core = core @ u
+        else:
+            core = np.tensordot(core, u.T, axes=[2, 1])
 
-            # Update reduzierte Grammatrix
-            G[t] = R[t] @ G[t] @ R[t].T
+        return to_storage(core), u.T @ Rt, errt
 
-            # Berechne linke Singulärvektoren samt Singulärwerten
-            u, sv[t] = left_svd_gramian(G[t])
+    # Durchschreiten des Dimensionsbaums von unten nach oben
+    for level in range(dtreez.get_depth(), 0, -1):
+        nodes = dtreez.get_nodes_of_level(level)
+        reduced = map_nodes(reduce_node, nodes, executor)
 
-            # Berechne den Rang, auf den gekürzt werden soll
-            k, err[t], sat = cls.trunc_rank(s=sv[t], max_rank=max_rank,
-                                            abs_err=abs_err, rel_err=rel_err)
+        # Die Eigenwertzerlegungen eines Levels werden gemeinsam berechnet, gleich große gestapelt
+        decompositions = left_svd_gramian_batched([Gt for _, _, Gt in reduced], k=max_rank, executor=executor)
 
-            # Nehme entsprechend nur die k ersten Spalten mit
-            u = u[:, :k]
+        for t, (core, Rt, Gt), (u, svt) in zip(nodes, reduced, decompositions):
+            core, R_new, err_t = truncate_node(t, core, Rt, u, svt)
             if dtreez.is_leaf(t):
-                Uz[t] = Uz[t] @ u
+                Uz[t] = core
             else:
-                Bz[t] = np.tensordot(Bz[t], u.T, axes=[2, 1])
-
-            R[t] = u.T @ R[t]
+                Bz[t] = core
+            R[t] = R_new
+            G[t] = Gt
+            sv[t] = svt
+            err[t] = err_t
 
     # Anwendung von R auf die Wurzel
     # Kinder
@@ -147,5 +175,6 @@ def add_and_truncate(cls, summanden, max_rank, abs_err=None, rel_err=None, copy=
     for jj in range(1, len(summanden)):
         Bz[0] += multi_mul(x=summanden[jj].B[0], U=[R_left[jj], R_right[jj]], modes=[0, 1])
 
-    z = cls(U=Uz, B=Bz, dtree=dtreez, is_orthog=True)
+    Bz[0] = to_storage(Bz[0])
+    z = cls.unchecked(U=Uz, B=Bz, dtree=dtreez, is_orthog=True)
     return z, err, sv
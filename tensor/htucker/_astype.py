@@ -0,0 +1,14 @@
+from tensor.utils.precision import check_dtype
+
+
+def astype(self, dtype):
+    """
+    Gibt einen neuen hierarchischen Tuckertensor zurück, dessen Blattmatrizen und Transfertensoren im Datentyp
+    'dtype' vorliegen. Bereits passende Blattmatrizen und Transfertensoren werden nicht kopiert, sondern geteilt.
+    @param dtype: np.float64, np.float32 oder entsprechender String bzw. np.dtype
+    @return: htucker.HTucker
+    """
+    dtype = check_dtype(dtype)
+    U = {t: u.astype(dtype, copy=False) for t, u in self.U.items()}
+    B = {t: b.astype(dtype, copy=False) for t, b in self.B.items()}
+    return type(self).unchecked(U=U, B=B, dtree=self.dtree, is_orthog=self.is_orthog)
@@ -0,0 +1,160 @@
+import numpy as np
+from tensor.utils.dimtree import equal
+from tensor.utils.precision import to_accumulation
+
+# Neue Richtungen, deren Singulärwerte höchstens diesen Anteil der Norm der Richtungen ausmachen, werden bei der
+# Erweiterung der Basen verworfen
+AUGMENTATION_TOL = 1e-10
+
+
+def bug_step(cls, x, f, tau, max_rank, abs_err=None, rel_err=None):
+    """
+    Berechnet einen Schritt x + tau * f des rangadaptiven Basis-Update-&-Galerkin-Integrators (BUG, nach Ceruti,
+    Kusch und Lubich) auf der Mannigfaltigkeit hierarchischer Tuckertensoren. Die Teilprobleme werden dabei mit dem
+    expliziten Eulerverfahren gelöst.
+    1. Basis-Update: Für jeden Knoten t (außer der Wurzel) wird die Basis U_t des orthogonalisierten 'x' um die
+       Richtung f_(t) W_t des K-Schritts erweitert, wobei x_(t) = U_t W_t^T. Die Richtungen werden über
+       gemischte Gram'sche Matrizen von f und 'x' (siehe HTucker.gramians_orthog) berechnet, ohne f_(t) zu bilden.
+       Die erweiterten Basen sind geschachtelt, die der inneren Knoten ergeben sich von den Blättern zur Wurzel in der
+       Basis der bereits erweiterten Kinder.
+    2. Galerkin-Schritt: x + tau * f wird auf die erweiterten Basen projiziert. Da diese die Basen von 'x' enthalten,
+       ist die Projektion von 'x' exakt. Dafür sind nur Kontraktionen der Transfertensoren mit Matrizen der Größe der
+       Ränge notwendig.
+    Das Ergebnis ist orthogonal und hat höchstens den doppelten Rang. Es wird abschließend mit
+    HTucker.truncate_htucker gemäß 'max_rank', 'abs_err' und 'rel_err' gekürzt. Summen mit aufgeblähtem Rang werden
+    dabei weder gebildet noch orthogonalisiert.
+    @param x: htucker.HTucker
+    @param f: htucker.HTucker, list aus htucker.HTucker Objekten (Summanden) oder LazyHTucker
+    @param tau: float
+    @param max_rank: positiver int
+    @param abs_err: positiver float oder None
+    @param rel_err: positiver float oder None
+    @return: htucker.HTucker, dict, dict
+    """
+    # Argument checks
+    if not isinstance(x, cls):
+        raise TypeError("'x' ist kein hierarchischer Tuckertensor.")
+    if isinstance(f, cls):
+        f = [f]
+    elif hasattr(f, "summands"):
+        f = f.summands(max_rank, abs_err)
+    if not isinstance(f, list) or not all(isinstance(z, cls) for z in f) or len(f) == 0:
+        raise TypeError("'f' muss ein hierarchischer Tuckertensor, eine nicht-leere Liste hierarchischer "
+                        "Tuckertensoren oder ein LazyHTucker sein.")
+    if not all(z.shape == x.shape for z in f):
+        raise ValueError("Die Summanden aus 'f' und 'x' müssen dieselbe Form haben.")
+    if not np.issubdtype(type(tau), np.floating):
+        raise TypeError("'tau' muss ein float sein.")
+
+    if not all(equal(z.dtree, x.dtree) for z in f):
+        raise ValueError("Die Dimensionsbäume der Summanden aus 'f' und von 'x' sind nicht identisch.")
+
+    y = cls.orthogonalize(x)
+    dt = y.dtree
+    inner = [t for level in range(dt.get_depth() - 1, -1, -1) for t in dt.get_nodes_of_level(level)
+             if not dt.is_leaf(t)]
+
+    # Gemischte Gram'sche Matrizen von unten nach oben: M_t = U_t(z)^T U_t(y)
+    M = [mixed_frames(z, y) for z in f]
+
+    # Gemischte Gram'sche Matrizen von oben nach unten: H_t = W_t(z)^T W_t(y)
+    H = [mixed_gramians(z, y, Mz) for z, Mz in zip(f, M)]
+
+    # Basis-Update von den Blättern zur Wurzel
+    # P_t bzw. Q_t enthalten die Koeffizienten der Basen von 'y' bzw. der Summanden in der erweiterten Basis
+    U, B = {}, {}
+    P, Q = {}, [dict() for _ in f]
+    for t in dt.get_leaves():
+        Uy = to_accumulation(y.U[t])
+        direction = sum(to_accumulation(z.U[t]) @ Hz[t] for z, Hz in zip(f, H))
+        U[t] = augment(Uy, direction)
+        P[t] = U[t].T @ Uy
+        for z, Qz in zip(f, Q):
+            Qz[t] = U[t].T @ to_accumulation(z.U[t])
+    for t in inner:
+        left, right = dt.get_left(t), dt.get_right(t)
+        By = project(y.B[t], P[left], P[right])
+        Bz = [project(z.B[t], Qz[left], Qz[right]) for z, Qz in zip(f, Q)]
+        if t == 0:
+            # Galerkin-Schritt: Projektion von y + tau * f
+            B[0] = By + tau * sum(Bz)
+            break
+        shape = By.shape
+        By_mat = By.reshape((shape[0] * shape[1], -1), order="F")
+        direction = sum(np.tensordot(Bzk, Hz[t], axes=[2, 0]) for Bzk, Hz in zip(Bz, H))
+        B_mat = augment(By_mat, direction.reshape((shape[0] * shape[1], -1), order="F"))
+        B[t] = B_mat.reshape((shape[0], shape[1], -1), order="F")
+        P[t] = B_mat.T @ By_mat
+        for Bzk, Qz in zip(Bz, Q):
+            Qz[t] = B_mat.T @ Bzk.reshape((shape[0] * shape[1], -1), order="F")
+
+    z = cls.unchecked(U=U, B=B, dtree=dt.copy(), is_orthog=True)
+    return cls.truncate_htucker(z, max_rank, abs_err=abs_err, rel_err=rel_err)
+
+
+def mixed_frames(z, y):
+    """
+    Helferfunktion: Berechnet von den Blättern zur Wurzel M_t = U_t(z)^T U_t(y) für alle Knoten t (siehe
+    HTucker.inner_product).
+    """
+    dt = y.dtree
+    M = {}
+    for t in dt.get_leaves():
+        M[t] = to_accumulation(z.U[t]).T @ to_accumulation(y.U[t])
+    for level in range(dt.get_depth() - 1, 0, -1):
+        for t in dt.get_nodes_of_level(level):
+            if dt.is_leaf(t):
+                continue
+            left, right = dt.get_left(t), dt.get_right(t)
+            Mt = np.tensordot(M[left], y.B[t], axes=[1, 0])
+            Mt = np.tensordot(M[right], Mt, axes=[1, 1])
+            M[t] = np.tensordot(z.B[t], Mt, axes=[[0, 1], [1, 0]])
+    return M
+
+
+def mixed_gramians(z, y, M):
+    """
+    Helferfunktion: Berechnet von der Wurzel zu den Blättern H_t = W_t(z)^T W_t(y) für alle Knoten t, wobei
+    x_(t) = U_t W_t^T. Für z = y entspricht dies HTucker.gramians_orthog.
+    """
+    dt = y.dtree
+    H = {0: np.ones((1, 1))}
+    for level in range(0, dt.get_depth()):
+        for t in dt.get_nodes_of_level(level):
+            if dt.is_leaf(t):
+                continue
+            left, right = dt.get_left(t), dt.get_right(t)
+            # By_mod[a', b', c] = sum_c' B_t(y)[a', b', c'] H_t[c, c']
+            By_mod = np.tensordot(y.B[t], H[t], axes=[2, 1])
+            # Linkes Kind: Kontraktion über den rechten Modus mit M_r
+            By_left = np.tensordot(By_mod, M[right], axes=[1, 1])
+            H[left] = np.tensordot(z.B[t], By_left, axes=[[1, 2], [2, 1]])
+            # Rechtes Kind: Kontraktion über den linken Modus mit M_l
+            By_right = np.tensordot(By_mod, M[left], axes=[0, 1])
+            H[right] = np.tensordot(z.B[t], By_right, axes=[[0, 2], [2, 1]])
+    return H
+
+
+def project(Bt, Pl, Pr):
+    """
+    Helferfunktion: Stellt den Transfertensor 'Bt' in den erweiterten Basen der Kinder dar, d.h. Bt x_1 Pl x_2 Pr.
+    """
+    Bt = np.tensordot(Pl, Bt, axes=[1, 0])
+    Bt = np.tensordot(Pr, Bt, axes=[1, 1])
+    return np.swapaxes(Bt, 0, 1)
+
+
+def augment(basis, direction):
+    """
+    Helferfunktion: Erweitert die orthonormale Basis 'basis' um die zu ihr orthogonalen Anteile von 'direction'.
+    Die Spalten von 'basis' bleiben als erste Spalten erhalten.
+    """
+    # Zweifache Orthogonalisierung gegen die bisherige Basis
+    rest = direction - basis @ (basis.T @ direction)
+    rest = rest - basis @ (basis.T @ rest)
+    if rest.shape[1] == 0:
+        return basis
+    u, s, _ = np.linalg.svd(rest, full_matrices=False)
+    scale = max(np.linalg.norm(direction), np.finfo(float).tiny)
+    k = min(int(np.sum(s > AUGMENTATION_TOL * scale)), basis.shape[0] - basis.shape[1])
+    return np.hstack((basis, u[:, :k]))
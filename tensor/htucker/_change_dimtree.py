@@ -1,7 +1,6 @@
 import numpy as np
-from tensor.arithmetics.mode_multiplication import mode_multiplication
+from tensor.arithmetics.mode_multiplication import mode_multiplication_unchecked as mode_multiplication
 from tensor.utils.dimtree import dimtree
-from copy import deepcopy
 
 
 def change_dimtree(cls, x, children, dim2ind):
@@ -51,8 +50,9 @@ def change_dimtree(cls, x, children, dim2ind):
     dt = x.dtree
     root = 0
     ind = dt.get_right(root)
-    xB = deepcopy(x.B)
-    xU = deepcopy(x.U)
+    # Es werden nur Einträge der dicts ersetzt, die Blattmatrizen und Transfertensoren selbst werden geteilt
+    xB = dict(x.B)
+    xU = dict(x.U)
 
     # Eliminiere Matrix im Wurzelknoten
     # Reshape root tensor zu matrix
@@ -201,7 +201,7 @@ def change_dimtree(cls, x, children, dim2ind):
         B[0] = B[0].reshape((shape[0], shape[1], 1), order="F")
 
     new_dtree = dimtree(children=children, dim2ind=dim2ind)
-    new_htucker = cls(U=U, B=B, dtree=new_dtree, is_orthog=False)
+    new_htucker = cls.unchecked(U=U, B=B, dtree=new_dtree, is_orthog=False)
     return new_htucker
 
 
@@ -1,6 +1,5 @@
 import numpy as np
 from tensor.utils.dimtree import dimtree
-from copy import deepcopy
 
 
 def change_root(cls, x, ind, lr_subtree="right"):
@@ -30,7 +29,7 @@ def change_root(cls, x, ind, lr_subtree="right"):
     dt = x.dtree.copy()
     if ind > 0:
         # copy children list
-        children = dt.get_children()
+        children = np.array(dt.get_children())
         # copy parents list
         ind_par = dt.get_parent(ind)
 
@@ -100,7 +99,7 @@ def change_root(cls, x, ind, lr_subtree="right"):
         # Damit der ursprüngliche Wurzelknoten zum Kind werden kann, muss ein neues Level über
         # dem ursprünglichen Wurzelknoten erzeugt werden. Entsprechend gibt es eine neue Wurzel
         dt = x.dtree.copy()
-        children = dt.get_children()
+        children = np.array(dt.get_children())
         ind = np.where(children > -1)
         children[ind] = children[ind] + 2
 
@@ -115,15 +114,13 @@ def change_root(cls, x, ind, lr_subtree="right"):
         new_dim = np.array([1])
         dim2ind = np.hstack((new_dim, dim2ind))
 
-        # Kopieren von x.U und x.B
-        xU = deepcopy(x.U)
-        xB = deepcopy(x.B)
-        U = {(k+2): v for k, v in xU.items()}
+        # Neue dicts, die die Blattmatrizen und Transfertensoren mit x teilen
+        U = {(k+2): v for k, v in x.U.items()}
         U[1] = np.array([1]).reshape((1, 1))
 
-        B = {(k+2): v for k, v in xB.items()}
+        B = {(k+2): v for k, v in x.B.items()}
         B[0] = np.array([1]).reshape((1, 1, 1))
 
         new_dtree = dimtree(children=children, dim2ind=dim2ind)
-        new_htucker = cls(U=U, B=B, dtree=new_dtree, is_orthog=False)
+        new_htucker = cls.unchecked(U=U, B=B, dtree=new_dtree, is_orthog=False)
         return new_htucker
@@ -0,0 +1,179 @@
+import numpy as np
+
+
+def compact(self):
+    """
+    Legt die Blattmatrizen und Transfertensoren in einem einzigen zusammenhängenden Puffer ab. Anschließend enthalten
+    die dicts 'U' und 'B' nur noch Views auf diesen Puffer. Die Instanz wird verändert und zurückgegeben.
+    @return: htucker.HTucker
+    """
+    if not self.is_compact():
+        buffer, layout = pack(self.U, self.B)
+        self.U, self.B = unpack(buffer, layout)
+        self._buffer = buffer
+        self._layout = layout
+    return self
+
+
+def is_compact(self):
+    """
+    Gibt zurück, ob sämtliche Blattmatrizen und Transfertensoren Views auf den zusammenhängenden Puffer sind.
+    Wurde seit dem letzten Aufruf von 'compact' ein Eintrag aus 'U' oder 'B' ersetzt, ist dies nicht mehr der Fall.
+    @return: bool
+    """
+    buffer = self._buffer
+    layout = self._layout
+    if buffer is None or len(layout) != len(self.U) + len(self.B):
+        return False
+    address = buffer.__array_interface__["data"][0]
+    for node, ndim, offset, n0, n1, n2 in layout:
+        arrays = self.U if ndim == 2 else self.B
+        if node not in arrays:
+            return False
+        v = arrays[node]
+        if v.dtype != buffer.dtype or not v.flags.c_contiguous:
+            return False
+        if v.shape != entry_shape(ndim, n0, n1, n2):
+            return False
+        if v.__array_interface__["data"][0] != address + offset * buffer.itemsize:
+            return False
+    return True
+
+
+def to_buffer(self):
+    """
+    Gibt den zusammenhängenden Puffer samt Offset- und Shape-Tabelle zurück. Zusammen mit dem Dimensionsbaum genügen
+    diese, um den hierarchischen Tuckertensor mittels 'from_buffer' ohne Kopie zu rekonstruieren (z.B. in Shared
+    Memory).
+    @return: (1-D np.ndarray, 2-D np.ndarray)
+    """
+    self.compact()
+    return self._buffer, self._layout
+
+
+def from_buffer(cls, buffer, layout, dtree, is_orthog=False):
+    """
+    Erzeugt einen hierarchischen Tuckertensor, dessen Blattmatrizen und Transfertensoren Views auf 'buffer' sind.
+    'buffer' wird dabei nicht kopiert.
+    @param buffer: 1-D np.ndarray
+    @param layout: 2-D np.ndarray, wie von 'to_buffer' zurückgegeben
+    @param dtree: tensor.utils.dimtree.dimtree
+    @param is_orthog: bool
+    @return: htucker.HTucker
+    """
+    if not isinstance(buffer, np.ndarray):
+        raise TypeError("'buffer' muss ein 1D-np.ndarray sein.")
+    if len(buffer.shape) != 1 or not buffer.flags.c_contiguous:
+        raise ValueError("'buffer' muss ein zusammenhängender 1D-np.ndarray sein.")
+    if not isinstance(layout, np.ndarray):
+        raise TypeError("'layout' muss ein 2D-np.ndarray mit 6 Spalten sein.")
+    if len(layout.shape) != 2 or layout.shape[1] != 6:
+        raise ValueError("'layout' muss ein 2D-np.ndarray mit 6 Spalten sein.")
+
+    U, B = unpack(buffer, layout)
+    z = cls(U=U, B=B, dtree=dtree, is_orthog=is_orthog)
+    z._buffer = buffer
+    z._layout = layout
+    return z
+
+
+def copy(self):
+    """
+    Gibt eine Kopie des hierarchischen Tuckertensors zurück. Die Blattmatrizen und Transfertensoren der Kopie liegen
+    in einem zusammenhängenden Puffer. Ist der Tensor bereits kompakt, entspricht dies einer einzigen Speicherkopie.
+    @return: htucker.HTucker
+    """
+    if self.is_compact():
+        buffer, layout = self._buffer.copy(), self._layout
+    else:
+        buffer, layout = pack(self.U, self.B)
+    z = self.from_buffer(buffer, layout, self.dtree.copy(), self.is_orthog)
+    return z
+
+
+def __getstate__(self):
+    """
+    Pickle Zustand: Der zusammenhängende Puffer ersetzt die dicts 'U' und 'B'.
+    """
+    if self.is_compact():
+        buffer, layout = self._buffer, self._layout
+    else:
+        buffer, layout = pack(self.U, self.B)
+    return {"buffer": buffer, "layout": layout, "dtree": self.dtree, "is_orthog": self.is_orthog}
+
+
+def __setstate__(self, state):
+    """
+    Stellt den Zustand aus '__getstate__' wieder her. Mit älteren Versionen gepickelte Objekte, deren Zustand noch
+    die dicts 'U' und 'B' enthält, werden ebenfalls unterstützt.
+    """
+    if "buffer" in state:
+        buffer, layout = state["buffer"], state["layout"]
+        U, B = unpack(buffer, layout)
+    else:
+        buffer, layout = None, None
+        U, B = state["U"], state["B"]
+    self.U = U
+    self.B = B
+    self.dtree = state["dtree"]
+    self.is_orthog = state["is_orthog"]
+    self._buffer = buffer
+    self._layout = layout
+    self.shape = self.helper_get_shape()
+    self.order = len(self.shape)
+    self.rank = self.helper_get_rank()
+
+
+# Helferfunktionen
+
+def pack(U, B):
+    """
+    Helferfunktion: Kopiert die Blattmatrizen aus 'U' und die Transfertensoren aus 'B' in einen neuen
+    zusammenhängenden Puffer. Die Tabelle 'layout' enthält pro Eintrag eine Zeile der Form
+    [Knotenindex, Anzahl Modi, Offset, Shape[0], Shape[1], Shape[2]]. Für Blattmatrizen ist Shape[2] = -1.
+    """
+    entries = [(k, v) for k, v in U.items()] + [(k, v) for k, v in B.items()]
+    dtype = np.result_type(*[v.dtype for _, v in entries])
+    if not np.issubdtype(dtype, np.inexact):
+        dtype = np.dtype(float)
+
+    layout = np.zeros((len(entries), 6), dtype=np.int64)
+    offset = 0
+    for ii, (k, v) in enumerate(entries):
+        layout[ii, 0] = k
+        layout[ii, 1] = v.ndim
+        layout[ii, 2] = offset
+        layout[ii, 3:3 + v.ndim] = v.shape
+        if v.ndim == 2:
+            layout[ii, 5] = -1
+        offset += v.size
+
+    buffer = np.empty(offset, dtype=dtype)
+    for (_, v), (_, _, o, _, _, _) in zip(entries, layout):
+        buffer[o:o + v.size].reshape(v.shape)[...] = v
+    return buffer, layout
+
+
+def unpack(buffer, layout):
+    """
+    Helferfunktion: Erzeugt die dicts 'U' und 'B' als Views auf 'buffer' gemäß 'layout'.
+    """
+    U = {}
+    B = {}
+    for node, ndim, offset, n0, n1, n2 in layout:
+        shape = entry_shape(ndim, n0, n1, n2)
+        view = buffer[offset:offset + int(np.prod(shape))].reshape(shape)
+        if ndim == 2:
+            U[int(node)] = view
+        else:
+            B[int(node)] = view
+    return U, B
+
+
+def entry_shape(ndim, n0, n1, n2):
+    """
+    Helferfunktion: Shape eines Eintrags der Tabelle 'layout'.
+    """
+    if ndim == 2:
+        return int(n0), int(n1)
+    return int(n0), int(n1), int(n2)
@@ -0,0 +1,132 @@
+import numpy as np
+from tensor.utils.dimtree import dimtree
+from tensor.utils.precision import to_storage
+
+
+def from_rank1(cls, vectors):
+    """
+    Erzeugt den hierarchischen Tuckertensor des Rang-1-Tensors v_0 o v_1 o ... o v_{d-1} mit den Vektoren aus
+    'vectors'. Sämtliche hierarchischen Ränge sind 1.
+    @param vectors: list oder tuple aus mindestens zwei 1-D np.ndarrays
+    @return: htucker.HTucker
+    """
+    if not isinstance(vectors, list) and not isinstance(vectors, tuple):
+        raise TypeError("'vectors' muss eine list oder ein tuple aus 1-D np.ndarrays sein.")
+    if not all(isinstance(v, np.ndarray) for v in vectors):
+        raise TypeError("'vectors' muss eine list oder ein tuple aus 1-D np.ndarrays sein.")
+    if not all(len(v.shape) == 1 for v in vectors):
+        raise ValueError("'vectors' muss eine list oder ein tuple aus 1-D np.ndarrays sein.")
+    return cls.from_cp([v.reshape((-1, 1)) for v in vectors])
+
+
+def from_cp(cls, factors, weights=None):
+    """
+    Erzeugt den hierarchischen Tuckertensor des Tensors im CP-Format
+        sum_k weights[k] * factors[0][:, k] o factors[1][:, k] o ... o factors[d-1][:, k]
+    im kanonischen Dimensionsbaum. Die Blattmatrizen entsprechen den Faktormatrizen, die Transfertensoren der inneren
+    Knoten sind superdiagonal und der Transfertensor der Wurzel enthält die Gewichte auf der Diagonalen. Alle
+    hierarchischen Ränge (außer dem der Wurzel) entsprechen damit dem CP-Rang R.
+    @param factors: list oder tuple aus mindestens zwei 2-D np.ndarrays mit je R Spalten
+    @param weights: 1-D np.ndarray der Länge R oder None (alle Gewichte 1)
+    @return: htucker.HTucker
+    """
+    if not isinstance(factors, list) and not isinstance(factors, tuple):
+        raise TypeError("'factors' muss eine list oder ein tuple aus 2-D np.ndarrays sein.")
+    if not all(isinstance(f, np.ndarray) for f in factors):
+        raise TypeError("'factors' muss eine list oder ein tuple aus 2-D np.ndarrays sein.")
+    if not len(factors) >= 2 or not all(len(f.shape) == 2 for f in factors):
+        raise ValueError("'factors' muss mindestens zwei 2-D np.ndarrays enthalten.")
+    R = factors[0].shape[1]
+    if not R >= 1 or not all(f.shape[1] == R for f in factors):
+        raise ValueError("Alle Elemente aus 'factors' müssen dieselbe positive Anzahl an Spalten haben.")
+    if weights is not None:
+        if not isinstance(weights, np.ndarray):
+            raise TypeError("'weights' muss None oder ein 1-D np.ndarray sein.")
+        if not weights.shape == (R,):
+            raise ValueError("'weights' muss die Länge {} haben.".format(R))
+    else:
+        weights = np.ones(R)
+
+    dtree = dimtree.get_canonic_dimtree(len(factors))
+    U = {t: to_storage(factors[mode]) for mode, t in enumerate(dtree.get_dim2ind())}
+
+    # Superdiagonaler Transfertensor: B[k, k, k] = 1
+    superdiagonal = np.zeros((R, R, R))
+    superdiagonal[np.arange(R), np.arange(R), np.arange(R)] = 1
+    B = {t: to_storage(superdiagonal) for t in dtree.get_inner_nodes() if t != 0}
+    B[0] = to_storage(np.diag(weights).reshape((R, R, 1)))
+    return cls.unchecked(U=U, B=B, dtree=dtree, is_orthog=False)
+
+
+def from_kronecker(cls, A, B, split):
+    """
+    Erzeugt den hierarchischen Tuckertensor des Tensorprodukts C = A o B der dichten Tensoren 'A' und 'B', deren
+    Modi im Ergebnis verschränkt sein dürfen: 'split' gibt die Modi von C an, die der Reihe nach zu den Modi von 'A'
+    gehören, die übrigen Modi von C gehören in aufsteigender Reihenfolge zu 'B'. Es gilt also
+        C[i_0, ..., i_{d-1}] = A[i_split] * B[i_rest].
+    Beispiel: lamda[a, b, a', b'] = kappa[a, a'] * beta[b, b'] entspricht from_kronecker(kappa, beta, [0, 2]).
+    'A' und 'B' werden dazu, um Modi der Größe 1 erweitert, einzeln exakt ins hierarchische Tuckerformat überführt.
+    Der Aufwand hängt damit nur von der Größe der Faktoren ab. Anschließend werden beide Faktoren exakt elementweise
+    multipliziert, wobei die Modi der Größe 1 konstant fortgesetzt werden. Da die Matrizierungen von C
+    Kroneckerprodukte der Matrizierungen von 'A' und 'B' sind, multiplizieren sich dabei die (minimalen) Ränge.
+    @param A: np.ndarray mit mindestens einem Modus
+    @param B: np.ndarray mit mindestens einem Modus
+    @param split: list, tuple oder np.ndarray aus paarweise verschiedenen nicht-negativen ints
+    @return: htucker.HTucker
+    """
+    if not isinstance(A, np.ndarray) or not isinstance(B, np.ndarray):
+        raise TypeError("'A' und 'B' müssen np.ndarrays sein.")
+    if not len(A.shape) >= 1 or not len(B.shape) >= 1:
+        raise ValueError("'A' und 'B' müssen mindestens einen Modus haben.")
+    if not isinstance(split, list) and not isinstance(split, tuple) and not isinstance(split, np.ndarray):
+        raise TypeError("'split' muss vom Typ list, tuple oder numpy.ndarray sein.")
+    d = len(A.shape) + len(B.shape)
+    if not len(split) == len(A.shape):
+        raise ValueError("'split' muss für jeden Modus von 'A' einen Modus des Ergebnisses enthalten.")
+    if not all(np.issubdtype(type(m), np.integer) for m in split) or not all(0 <= m < d for m in split) \
+            or len(set(split)) < len(split):
+        raise ValueError("'split' muss paarweise verschiedene Modi aus 0, ..., {} enthalten.".format(d - 1))
+
+    split = [int(m) for m in split]
+    rest = [m for m in range(d) if m not in split]
+    x = embed(cls, A, split, d)
+    y = embed(cls, B, rest, d)
+    return hadamard(cls, x, y)
+
+
+def embed(cls, A, modes, d):
+    """
+    Helferfunktion: Gibt den hierarchischen Tuckertensor des Tensors der Ordnung 'd' zurück, der in den Modi 'modes'
+    mit 'A' übereinstimmt und in allen übrigen Modi konstant ist.
+    """
+    # Ordne die Modi von 'A' aufsteigend an und ergänze Modi der Größe 1
+    order = np.argsort(modes)
+    shape = np.ones(d, dtype=int)
+    shape[np.array(modes)[order]] = np.array(A.shape)[order]
+    A_ext = np.transpose(A, order).reshape(shape)
+
+    # Exakte Darstellung. Nur numerisch verschwindende Singulärwerte werden verworfen
+    x, _, _ = cls.truncate(A_ext, max_rank=max(A.size, 1), rel_err=1e-14)
+    return x
+
+
+def hadamard(cls, x, y):
+    """
+    Helferfunktion: Exaktes elementweises Produkt der über 'embed' erzeugten Faktoren 'x' und 'y' (ohne Kürzung).
+    Blattmatrizen mit nur einer Zeile (Modi der Größe 1) werden dabei auf die Größe des jeweils anderen Faktors
+    fortgesetzt. Die Blattmatrizen ergeben sich zeilenweise als Kroneckerprodukte, die Transfertensoren als
+    Kroneckerprodukte der Transfertensoren.
+    """
+    dtree = x.dtree
+    U = {}
+    for t in dtree.get_dim2ind():
+        n = max(x.U[t].shape[0], y.U[t].shape[0])
+        ux = np.broadcast_to(x.U[t], (n, x.U[t].shape[1]))
+        uy = np.broadcast_to(y.U[t], (n, y.U[t].shape[1]))
+        U[t] = to_storage((ux[:, :, np.newaxis] * uy[:, np.newaxis, :]).reshape((n, -1)))
+    B = {}
+    for t in dtree.get_inner_nodes():
+        bx, by = x.B[t], y.B[t]
+        Bt = np.einsum("ikm,jln->ijklmn", bx, by)
+        B[t] = to_storage(Bt.reshape((bx.shape[0] * by.shape[0], bx.shape[1] * by.shape[1], -1)))
+    return cls.unchecked(U=U, B=B, dtree=dtree, is_orthog=False)
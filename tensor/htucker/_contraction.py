@@ -1,6 +1,6 @@
 import numpy as np
 from tensor.utils.dimtree import dimtree
-from tensor.arithmetics.mode_multiplication import mode_multiplication
+from tensor.arithmetics.mode_multiplication import mode_multiplication_unchecked as mode_multiplication
 from copy import deepcopy
 
 
@@ -221,77 +221,98 @@ def one_node(cls, x, y, dims_x, dims_y, node_x, node_y, compl_x, compl_y):
     für 'x' und 'y' gilt.
     """
     # Austausch der Wurzel, sodass der rechte subtree alle Modi aus 'dims_x' enthält
-    if not compl_x:
-        x_hat = cls.change_root(x, ind=node_x, lr_subtree="right")
-    else:
-        x_hat = cls.change_root(x, ind=node_x, lr_subtree="left")
-
+    x_hat = reroot(cls, x, node_x, compl_x)
     # Das Gleiche für 'y'
-    if not compl_y:
-        y_hat = cls.change_root(y, ind=node_y, lr_subtree="right")
-    else:
-        y_hat = cls.change_root(y, ind=node_y, lr_subtree="left")
-
-    # Falls entweder alle Knoten oder kein Knoten ausgewählt wurden, ist node_x gleich 0. Ob dies der Fall ist, wird von
-    # compl_x angezeigt. Ist also node_x gleich 0, so fügt change_root einen neuen Knoten ein, was dazu führt, dass die
-    # Indizes aller weiteren Knoten um 1 verschoben werden und der neue 0 Modus die Größe 1 hat. An diese Tatsache
-    # wird 'dims_x' angepasst.
-    squeeze_left = False
-    if node_x == 0:
-        if compl_x:
-            dims_x = 0
-        else:
-            dims_x = [item + 1 for item in dims_x]
-            squeeze_left = True
-
-    # Das Gleiche wird erneut für 'y' durchgeführt
-    squeeze_right = False
-    if node_y == 0:
-        if compl_y:
-            dims_y = 0
+    y_hat = reroot(cls, y, node_y, compl_y)
+
+    dims_x, squeeze_left = adjust_dims(dims_x, node_x, compl_x)
+    dims_y, squeeze_right = adjust_dims(dims_y, node_y, compl_y)
+
+    M = apply_elim_steps(elim_steps(x_hat.dtree, y_hat.dtree, dims_x, dims_y), x_hat, y_hat)
+
+    structure = one_node_structure(x_hat.dtree, y_hat.dtree)
+    return one_node_assemble(cls, structure, x_hat, y_hat, M, squeeze_left, squeeze_right)
+
+
+def reroot(cls, x, node, compl):
+    """
+    Helferfunktion: Tauscht die Wurzel von 'x' so aus, dass der rechte subtree (compl == False) bzw. der linke subtree
+    (compl == True) dem subtree von 'node' entspricht.
+    """
+    if not compl:
+        return cls.change_root(x, ind=node, lr_subtree="right")
+    return cls.change_root(x, ind=node, lr_subtree="left")
+
+
+def adjust_dims(dims, node, compl):
+    """
+    Helferfunktion: Falls entweder alle Knoten oder kein Knoten ausgewählt wurden, ist 'node' gleich 0. Ob dies der
+    Fall ist, wird von 'compl' angezeigt. Ist also 'node' gleich 0, so fügt change_root einen neuen Knoten ein, was dazu
+    führt, dass die Indizes aller weiteren Knoten um 1 verschoben werden und der neue 0 Modus die Größe 1 hat. An diese
+    Tatsache wird 'dims' angepasst. Zusätzlich wird zurückgegeben, ob der Modus der Größe 1 später entfernt werden muss.
+    """
+    squeeze = False
+    if node == 0:
+        if compl:
+            dims = 0
         else:
-            dims_y = [item + 1 for item in dims_y]
-            squeeze_right = True
+            dims = [item + 1 for item in dims]
+            squeeze = True
+    return dims, squeeze
 
-    M = elim_matrix(x_hat, y_hat, dims_x, dims_y)
 
+def one_node_structure(dtree_x, dtree_y):
+    """
+    Helferfunktion: Bestimmt den Dimensionsbaum, der entsteht, wenn die Bäume 'dtree_x' und 'dtree_y' der umgewurzelten
+    Tensoren über eine neue Wurzel verbunden und die ungenutzten Knoten eliminiert werden. Die Struktur hängt nur von
+    den Dimensionsbäumen ab und kann daher wiederverwendet werden.
+    @return: (tensor.utils.dimtree.dimtree, 1-D np.ndarray, int, int)
+    """
     # Kombiniere 'x' und 'y' in einen großen Baum
     offset_x = 1
-    offset_y = x_hat.dtree.get_nr_nodes() + 1
+    offset_y = dtree_x.get_nr_nodes() + 1
 
-    new_root_x = x_hat.dtree.get_left(0)
-    new_root_y = y_hat.dtree.get_left(0)
+    new_root_x = dtree_x.get_left(0)
+    new_root_y = dtree_y.get_left(0)
 
     # Konstruiere den kombinierten children array des neuen Dimensionsbaums
-    ind = np.where(x_hat.dtree.get_children() > -1)
-    xchildren = np.array(x_hat.dtree.get_children())
+    ind = np.where(dtree_x.get_children() > -1)
+    xchildren = np.array(dtree_x.get_children())
     xchildren[ind] = xchildren[ind] + offset_x
-    ind = np.where(y_hat.dtree.get_children() > 1 - 1)
-    ychildren = np.array(y_hat.dtree.get_children())
+    ind = np.where(dtree_y.get_children() > 1 - 1)
+    ychildren = np.array(dtree_y.get_children())
     ychildren[ind] = ychildren[ind] + offset_y
     children = [[offset_x + new_root_x, offset_y + new_root_y]] + list(xchildren) + list(ychildren)
     children = np.array(children)
 
-    # Konstruiere die kombinierten Transfertensoren
-    B = {0: M.reshape((M.shape[0], M.shape[1], 1), order="F")}
-    Bx = {(k + offset_x): v for k, v in x_hat.B.items()}
-    By = {(k + offset_y): v for k, v in y_hat.B.items()}
-    B.update(Bx)
-    B.update(By)
-
-    # Konstruiere die kombinierten Blattmatrizen
-    U = {}
-    Ux = {(k + offset_x): v for k, v in x_hat.U.items()}
-    Uy = {(k + offset_y): v for k, v in y_hat.U.items()}
-    U.update(Ux)
-    U.update(Uy)
-
     # Konstruiere die kombinierte Dimensionen
-    dim2ind = list(x_hat.dtree.get_dim2ind() + offset_x) + list(y_hat.dtree.get_dim2ind() + offset_y)
+    dim2ind = list(dtree_x.get_dim2ind() + offset_x) + list(dtree_y.get_dim2ind() + offset_y)
     dim2ind = np.array(dim2ind)
 
     # Eliminiere alle ungenutzten Knoten und passe die Modusnummerierung entsprechend an
-    prod = adjust_tree(cls, children, dim2ind, U, B, x_hat.is_orthog and y_hat.is_orthog)
+    dtree, old2new, _ = adjust_structure(children, dim2ind)
+    return dtree, old2new, offset_x, offset_y
+
+
+def one_node_assemble(cls, structure, x_hat, y_hat, M, squeeze_left, squeeze_right):
+    """
+    Helferfunktion: Setzt das Ergebnis der Kontraktion aus den umgewurzelten Tensoren 'x_hat' und 'y_hat', der
+    Eliminationsmatrix 'M' und der von 'one_node_structure' bestimmten Struktur zusammen.
+    """
+    dtree, old2new, offset_x, offset_y = structure
+
+    # Konstruiere die kombinierten Transfertensoren und Blattmatrizen. Ungenutzte Knoten entfallen dabei
+    B = {0: M.reshape((M.shape[0], M.shape[1], 1), order="F")}
+    U = {}
+    for offset, z in [(offset_x, x_hat), (offset_y, y_hat)]:
+        for k, v in z.B.items():
+            if old2new[k + offset] > 0:
+                B[old2new[k + offset]] = v
+        for k, v in z.U.items():
+            if old2new[k + offset] > 0:
+                U[old2new[k + offset]] = v
+
+    prod = cls.unchecked(U=U, B=B, dtree=dtree, is_orthog=x_hat.is_orthog and y_hat.is_orthog)
 
     if squeeze_left and squeeze_right:
         prod = cls.squeeze(prod, copy=False)
@@ -335,10 +356,21 @@ def adjust_tree(cls, children, dim2ind, U, B, is_orthog):
     Helferfunktion: Elimiert alle ungenutzten Knoten des subtrees von 0. Die übrigbleibenden Modi werden 1,...,d
     benannt.
     """
+    dtree, old2new, new2old = adjust_structure(children, dim2ind)
+
+    xU = {old2new[i]: U[i] for i in new2old if i in U.keys()}
+    xB = {old2new[i]: B[i] for i in new2old if i in B.keys()}
+
+    new_htucker = cls.unchecked(U=xU, B=xB, dtree=dtree, is_orthog=is_orthog)
+    return new_htucker
 
-    xU = U
-    xB = B
 
+def adjust_structure(children, dim2ind):
+    """
+    Helferfunktion: Bestimmt den Dimensionsbaum nach Elimination aller ungenutzten Knoten des subtrees von 0 sowie die
+    Mappings zwischen alten und neuen Knotenindizes. Ungenutzte Knoten werden auf -1 abgebildet.
+    @return: (tensor.utils.dimtree.dimtree, 1-D np.ndarray, 1-D np.ndarray)
+    """
     dtree = dimtree(children=children, dim2ind=dim2ind)
     new2old = np.array((dtree.get_subtree(0)))
 
@@ -350,15 +382,11 @@ def adjust_tree(cls, children, dim2ind, U, B, is_orthog):
     no_leaf = np.where(children != [-1, -1])
     children[no_leaf] = old2new[children[no_leaf]]
 
-    xU = {old2new[i]: xU[i] for i in new2old if i in xU.keys()}
-    xB = {old2new[i]: xB[i] for i in new2old if i in xB.keys()}
-
     dim2ind = old2new[dim2ind]
     dim2ind = dim2ind[dim2ind != -1]
 
     dtree = dimtree(children=children, dim2ind=dim2ind)
-    new_htucker = cls(U=xU, B=xB, dtree=dtree, is_orthog=is_orthog)
-    return new_htucker
+    return dtree, old2new, new2old
 
 
 def elim_matrix(x, y, dims_x, dims_y):
@@ -366,47 +394,65 @@ def elim_matrix(x, y, dims_x, dims_y):
     Helferfunktion: Bestimmt die Eliminationsmatrix des rechten subtrees von 'x' und des zugehörigen subtrees von 'y'
     mit dem dieser verbunden ist.
     """
+    return apply_elim_steps(elim_steps(x.dtree, y.dtree, dims_x, dims_y), x, y)
 
-    # Initialisiere Mappings zwischen den Knoten von 'x' und 'y'
-    ix_leaves = x.dtree.get_dim2ind()[dims_x]
-    iy_leaves = y.dtree.get_dim2ind()[dims_y]
 
-    ix2iy = np.zeros(x.dtree.get_nr_nodes()).astype(int)
-    iy2ix = np.zeros(y.dtree.get_nr_nodes()).astype(int)
+def elim_steps(dtree_x, dtree_y, dims_x, dims_y):
+    """
+    Helferfunktion: Bestimmt die Schritte zur Berechnung der Eliminationsmatrix des rechten subtrees von 'dtree_x' und
+    des zugehörigen subtrees von 'dtree_y'. Diese hängen nur von den Dimensionsbäumen ab. Jeder Schritt ist ein Tupel
+    (ix, iy, ix_left, ix_right, y_left) in bottom-up Reihenfolge. Für Blätter sind ix_left und ix_right gleich -1.
+    """
 
+    # Initialisiere Mappings zwischen den Knoten von 'x' und 'y'
+    ix_leaves = dtree_x.get_dim2ind()[dims_x]
+    iy_leaves = dtree_y.get_dim2ind()[dims_y]
+
+    ix2iy = np.zeros(dtree_x.get_nr_nodes()).astype(int)
     ix2iy[ix_leaves] = iy_leaves
-    iy2ix[iy_leaves] = ix_leaves
 
     # Indizes des rechten subtrees von 'x'
     root_x = 0
-    root_x_right = x.dtree.get_right(root_x)
-    inds_x = x.dtree.get_subtree(root_x_right)
+    root_x_right = dtree_x.get_right(root_x)
+    inds_x = dtree_x.get_subtree(root_x_right)
 
-    M = {}
+    steps = []
 
     # Traversiere botttom up
     for ix in inds_x[::-1]:
-        if x.dtree.is_leaf(ix):
-            iy = ix2iy[ix]
-            # M_t = U1_t.T @ U2_t
-            M[ix] = x.U[ix].T @ y.U[iy]
+        if dtree_x.is_leaf(ix):
+            steps += [(ix, ix2iy[ix], -1, -1, False)]
 
         else:
-            ix_left = x.dtree.get_left(ix)
-            ix_right = x.dtree.get_right(ix)
+            ix_left = dtree_x.get_left(ix)
+            ix_right = dtree_x.get_right(ix)
 
             iy_left = ix2iy[ix_left]
             iy_right = ix2iy[ix_right]
 
-            if np.all(y.dtree.get_parent(iy_left) != y.dtree.get_parent(iy_right)):
+            if np.all(dtree_y.get_parent(iy_left) != dtree_y.get_parent(iy_right)):
                 raise ValueError("Dimensionsbäume von 'x' und 'y' sind inkompatibel.")
 
-            iy = y.dtree.get_parent(iy_left)
-
+            iy = dtree_y.get_parent(iy_left)
             ix2iy[ix] = iy
-            iy2ix[iy] = ix
 
-            if y.dtree.is_left(iy_left):
+            steps += [(ix, iy, ix_left, ix_right, dtree_y.is_left(iy_left))]
+
+    return steps
+
+
+def apply_elim_steps(steps, x, y):
+    """
+    Helferfunktion: Berechnet die Eliminationsmatrix gemäß der von 'elim_steps' bestimmten Schritte.
+    """
+    M = {}
+    for ix, iy, ix_left, ix_right, y_left in steps:
+        if ix_left == -1:
+            # M_t = U1_t.T @ U2_t
+            M[ix] = x.U[ix].T @ y.U[iy]
+
+        else:
+            if y_left:
                 M_t = np.tensordot(M[ix_left], y.B[iy], axes=[1, 0])
             else:
                 M_t = np.tensordot(M[ix_left], y.B[iy], axes=[1, 1])
@@ -417,4 +463,4 @@ def elim_matrix(x, y, dims_x, dims_y):
             del M[ix_left]
             del M[ix_right]
 
-    return M[x.dtree.get_right(0)]
+    return M[steps[-1][0]]
@@ -0,0 +1,125 @@
+import numpy as np
+from ._contraction import get_subtree_by_dims, reroot, adjust_dims, elim_steps, apply_elim_steps, \
+    one_node_structure, one_node_assemble
+
+
+class ContractionPlan:
+    """
+    Vorbereitete Kontraktion eines festen hierarchischen Tuckertensors 'x' mit wechselnden Tensoren 'y'
+    (siehe HTucker.contract).
+    Alles, was nur von 'x' und den Dimensionsbäumen abhängt, wird einmal pro Dimensionsbaum von 'y' bestimmt und
+    zwischengespeichert: Fallunterscheidung, das umgewurzelte 'x', die Schritte zur Berechnung der
+    Eliminationsmatrix sowie der Dimensionsbaum des Ergebnisses. 'apply' führt dann nur noch die von 'y' abhängigen
+    Rechnungen aus.
+    Kontraktionen, die nicht über einen einzelnen Knoten berechnet werden können, werden unverändert an
+    HTucker.contract weitergereicht.
+    """
+
+    def __init__(self, cls, x, dims_x, dims_y):
+        """
+        Konstruktor: 'x' ist der feste linke Operand, 'dims_x' und 'dims_y' sind die zu kontrahierenden Modi.
+        @param cls: Klasse der hierarchischen Tuckertensoren
+        @param x: htucker.HTucker
+        @param dims_x: list, tuple oder np.ndarray
+        @param dims_y: list, tuple oder np.ndarray
+        """
+        self.cls = cls
+        self.x = x
+        self.dims_x = np.array(dims_x).astype(int)
+        self.dims_y = np.array(dims_y).astype(int)
+        # Zwischengespeicherte Pläne, indiziert über die Dimensionsbäume von 'y'
+        self.plans = {}
+
+    def apply(self, y):
+        """
+        Kontrahiert den festen Tensor 'x' mit 'y'.
+        @param y: htucker.HTucker
+        @return: htucker.HTucker
+        """
+        cls = self.cls
+        if not isinstance(y, cls):
+            raise TypeError("'y' ist kein hierarchischer Tuckertensor.")
+        if len(self.dims_y) > 0 and max(self.dims_y) >= y.order:
+            raise ValueError("'dims_y' und 'y' sind nicht kompatibel.")
+        if not np.all(np.array(self.x.shape)[self.dims_x] == np.array(y.shape)[self.dims_y]):
+            raise ValueError("Die zu kontrahierenden Dimensionen von 'x' und 'y' müssen übereinstimmen.")
+
+        plan = self.plans.get(y.dtree)
+        if plan is None:
+            plan = self.build(y)
+            self.plans[y.dtree] = plan
+
+        if plan is False:
+            return cls.contract(self.x, y, self.dims_x, self.dims_y)
+
+        x_hat, node_y, compl_y, steps, structure, squeeze_left, squeeze_right = plan
+        y_hat = reroot(cls, y, node_y, compl_y)
+        M = apply_elim_steps(steps, x_hat, y_hat)
+        return one_node_assemble(cls, structure, x_hat, y_hat, M, squeeze_left, squeeze_right)
+
+    def __call__(self, y):
+        return self.apply(y)
+
+    def build(self, y):
+        """
+        Helferfunktion: Bestimmt den Plan für den Dimensionsbaum von 'y'. Ist die Kontraktion nicht über einen
+        einzelnen Knoten möglich, wird False zurückgegeben.
+        """
+        cls = self.cls
+        x = self.x
+        dims_x, dims_y = self.dims_x, self.dims_y
+
+        compl_dims_x = np.array(sorted(set(range(x.order)) - set(dims_x))).astype(int)
+        compl_dims_y = np.array(sorted(set(range(y.order)) - set(dims_y))).astype(int)
+
+        roots_x = get_subtree_by_dims(x.dtree, dims_x)
+        compl_roots_x = get_subtree_by_dims(x.dtree, compl_dims_x)
+        roots_y = get_subtree_by_dims(y.dtree, dims_y)
+        compl_roots_y = get_subtree_by_dims(y.dtree, compl_dims_y)
+
+        if 1 not in [len(roots_x), len(compl_roots_x)] or 1 not in [len(roots_y), len(compl_roots_y)]:
+            return False
+
+        compl_x = len(roots_x) != 1
+        node_x = compl_roots_x[0] if compl_x else roots_x[0]
+        compl_y = len(roots_y) != 1
+        node_y = compl_roots_y[0] if compl_y else roots_y[0]
+
+        # Das umgewurzelte 'x' wird einmalig berechnet. Für die Struktur genügt ein umgewurzeltes 'y'
+        x_hat = reroot(cls, x, node_x, compl_x)
+        y_hat = reroot(cls, y, node_y, compl_y)
+
+        dims_x, squeeze_left = adjust_dims(dims_x, node_x, compl_x)
+        dims_y, squeeze_right = adjust_dims(dims_y, node_y, compl_y)
+
+        steps = elim_steps(x_hat.dtree, y_hat.dtree, dims_x, dims_y)
+        structure = one_node_structure(x_hat.dtree, y_hat.dtree)
+        return x_hat, node_y, compl_y, steps, structure, squeeze_left, squeeze_right
+
+
+def contraction_plan(cls, x, dims_x, dims_y):
+    """
+    Gibt einen ContractionPlan zurück, der den festen hierarchischen Tuckertensor 'x' wiederholt mit wechselnden
+    Tensoren 'y' über die Modi 'dims_x' bzw. 'dims_y' kontrahiert. Das Ergebnis von plan.apply(y) entspricht
+    HTucker.contract(x, y, dims_x, dims_y).
+    @param x: htucker.HTucker
+    @param dims_x: list, tuple oder np.ndarray
+    @param dims_y: list, tuple oder np.ndarray
+    @return: ContractionPlan
+    """
+    if not isinstance(x, cls):
+        raise TypeError("'x' ist kein hierarchischer Tuckertensor.")
+    for dims in [dims_x, dims_y]:
+        if not isinstance(dims, list) and not isinstance(dims, tuple) and not isinstance(dims, np.ndarray):
+            raise TypeError("'dims_x' und 'dims_y' müssen vom Typ list, tuple oder numpy.ndarray sein.")
+        if not all(np.issubdtype(type(n), np.integer) for n in dims) or not all(n >= 0 for n in dims):
+            raise ValueError("Alle Elemente aus 'dims_x' und 'dims_y' müssen nicht-negative ints sein. Außerdem dürfen"
+                             " keine Duplikate vorhanden sein.")
+        if len(set(dims)) < len(dims):
+            raise ValueError("Alle Elemente aus 'dims_x' und 'dims_y' müssen nicht-negative ints sein. Außerdem dürfen"
+                             " keine Duplikate vorhanden sein.")
+    if len(dims_x) != len(dims_y):
+        raise ValueError("'dims_x' und 'dims_y' müssen gleich viele Modi enthalten.")
+    if len(dims_x) > 0 and max(dims_x) >= x.order:
+        raise ValueError("'dims_x' und 'x' sind nicht kompatibel.")
+    return ContractionPlan(cls, x, dims_x, dims_y)
@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 
 def ews_mode_multiplication(cls, x, vec, mu):
@@ -25,14 +24,15 @@ def ews_mode_multiplication(cls, x, vec, mu):
     if x.shape[mu] != vec.shape[0]:
         raise ValueError("'x', 'vec' und 'mode' passen nicht zusammen.")
 
+    # Nur die Blattmatrix des Modus 'mu' wird neu berechnet, alle übrigen Knoten werden mit 'x' geteilt
     dt = x.dtree.copy()
-    U = deepcopy(x.U)
-    B = deepcopy(x.B)
+    U = dict(x.U)
+    B = dict(x.B)
 
     # Multipliziere vec elementweise zu der Blattmatrix U[mu]
     leaf_index = dt.get_ind(mu)
     U[leaf_index] = U[leaf_index] * vec[:, None]
 
     # Konstruiere resultierenden neuen hierarchischen Tuckertensor
-    z = cls(U=U, B=B, dtree=dt, is_orthog=False)
+    z = cls.unchecked(U=U, B=B, dtree=dt, is_orthog=False)
     return z
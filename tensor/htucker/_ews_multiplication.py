@@ -1,19 +1,29 @@
-from tensor.arithmetics.multilinear_mul import multi_mul
-from tensor.arithmetics.left_svd_gramian import left_svd_gramian
+from tensor.arithmetics.multilinear_mul import multi_mul_unchecked as multi_mul
+from tensor.arithmetics.left_svd_gramian import left_svd_gramian_batched
 from tensor.utils.dimtree import equal
+from tensor.utils.precision import to_storage
 from copy import deepcopy
+import heapq
 import numpy as np
 
 
-def ews_multiplication(cls, x, y, max_rank, abs_err=None):
+def ews_multiplication(cls, x, y, max_rank, abs_err=None, oversampling=None):
     """
     Elementweise Multiplikation zweier hierarchischer Tuckertensoren 'x' und 'y'.
     Dies ist nur möglich, falls 'x' und 'y' identische Dimensionsbäume aufweisen.
     Während der Berechnung wird parallel eine Kürzung entsprechend 'max_rank' und 'abs_err' durchgeführt.
+    Dazu werden pro Knoten die führenden Paare linker Singulärvektoren von 'x' und 'y' ausgewählt, ohne sämtliche
+    Produkte der Singulärwerte zu bilden. Aufwand und Speicherbedarf wachsen daher mit dem Zielrang und nicht mit dem
+    Produkt der Ränge von 'x' und 'y'. Die zurückgegebenen Singulärwerte umfassen nur die ausgewählten Produkte.
+    Ist 'oversampling' übergeben, werden zunächst 'max_rank' + 'oversampling' Paare ausgewählt und das Produkt
+    anschließend mittels truncate_htucker auf 'max_rank' und 'abs_err' gekürzt. Das ist genauer als die reine
+    Paarauswahl und ersetzt die Kombination aus ews_multiplication mit dem Produkt der Ränge und anschließendem
+    truncate_htucker.
     @param x: tensor.htucker.htucker
     @param y: tensor.htucker.htucker
     @param max_rank: positive integer
     @param abs_err: positive float
+    @param oversampling: nicht-negativer int oder None
     @return: tensor.htucker.htucker, dict, dict
     """
     # Check arguments
@@ -34,6 +44,15 @@ def ews_multiplication(cls, x, y, max_rank, abs_err=None):
             raise TypeError("'abs_err' ist kein float.")
         if not abs_err > 0:
             raise ValueError("'abs_err' ist kein positiver float.")
+    if oversampling is not None:
+        if not np.issubdtype(type(oversampling), np.integer):
+            raise TypeError("'oversampling' ist kein integer.")
+        if not oversampling >= 0:
+            raise ValueError("'oversampling' ist kein nicht-negativer integer.")
+        z, err_pairs, _ = cls.ews_multiplication(x, y, max_rank=max_rank + oversampling, abs_err=abs_err)
+        z, err, sv = cls.truncate_htucker(z, max_rank=max_rank, abs_err=abs_err)
+        err = {t: np.sqrt(err[t] ** 2 + err_pairs[t] ** 2) for t in err}
+        return z, err, sv
 
     # Orthogonalisiere 'x' und 'y'
     x = cls.orthogonalize(x)
@@ -60,21 +79,17 @@ def ews_multiplication(cls, x, y, max_rank, abs_err=None):
     U_x = {}
     U_y = {}
 
-    for t in range(1, dtree_z.get_nr_nodes()):
-        # Berechne linke Singulärvektoren und Singulärwerte
-        ux, sx = left_svd_gramian(Gx[t])
-        uy, sy = left_svd_gramian(Gy[t])
+    # Berechne linke Singulärvektoren und Singulärwerte
+    # Gleich große Gram'sche Matrizen beider Faktoren werden gestapelt zerlegt
+    nodes = list(range(1, dtree_z.get_nr_nodes()))
+    decompositions = left_svd_gramian_batched([Gx[t] for t in nodes] + [Gy[t] for t in nodes])
 
-        # Berechne alle Kombinationen an Singulärwerten
-        sz = sx.reshape((-1,1)) @ sy.reshape((-1,1)).T
-        idcz = np.argsort(sz.ravel(order="F"))[::-1]
-        sv[t] = sz.ravel(order="F")[idcz]
+    for ii, t in enumerate(nodes):
+        ux, sx = decompositions[ii]
+        uy, sy = decompositions[len(nodes) + ii]
 
-        # Bestimme erforderlichen Rang
-        k, err[t], _ = cls.trunc_rank(sv[t], max_rank=max_rank, abs_err=abs_err, rel_err=None)
-
-        # Berechne die Indizes der entsprechenden linken Singulärvektoren
-        ind_x, ind_y = np.unravel_index(indices=idcz[:k], shape=sz.shape, order="F")
+        # Bestimme die führenden Paare an Singulärwerten und damit den erforderlichen Rang
+        ind_x, ind_y, sv[t], err[t] = select_pairs(sx, sy, max_rank=max_rank, abs_err=abs_err)
 
         # Behalte die ausgewählten linken Singulärvektoren
         U_x[t] = ux[:, ind_x]
@@ -85,25 +100,57 @@ def ews_multiplication(cls, x, y, max_rank, abs_err=None):
             # neue Blattmatrix ist elementweises Produkt der gekürzten Blattmatrizen
             Ux = x.U[t] @ U_x[t]
             Uy = y.U[t] @ U_y[t]
-            Uz[t] = Ux * Uy
+            Uz[t] = to_storage(Ux * Uy)
         else:
             # Neuer Transfertensor ist elementweises Produkt der gekürzten Transfertensoren
             ii_left = dtree_z.get_left(t)
             ii_right = dtree_z.get_right(t)
             Bx = multi_mul(x.B[t], [U_x[ii_left].T, U_x[ii_right].T, U_x[t].T], [0,1,2])
             By = multi_mul(y.B[t], [U_y[ii_left].T, U_y[ii_right].T, U_y[t].T], [0, 1, 2])
-            Bz[t] = Bx * By
+            Bz[t] = to_storage(Bx * By)
 
     # Wurzelfall
     ii_left = dtree_z.get_left(0)
     ii_right = dtree_z.get_right(0)
     Bx = multi_mul(x.B[0], [U_x[ii_left].T, U_x[ii_right].T], [0, 1])
     By = multi_mul(y.B[0], [U_y[ii_left].T, U_y[ii_right].T], [0, 1])
-    Bz[0] = Bx * By
+    Bz[0] = to_storage(Bx * By)
 
     # Erzeuge resultierenden HTucker Tensor
-    z = cls(U=Uz, B=Bz, dtree=dtree_z, is_orthog=False)
+    z = cls.unchecked(U=Uz, B=Bz, dtree=dtree_z, is_orthog=False)
     return z, err, sv
 
 
-
+def select_pairs(sx, sy, max_rank, abs_err=None):
+    """
+    Helferfunktion: Wählt die Paare (i, j) mit den größten Produkten sx[i] * sy[j] in absteigender Reihenfolge aus,
+    bis entweder 'max_rank' Paare ausgewählt sind oder der Fehler der übrigen Paare kleiner als 'abs_err' ist.
+    'sx' und 'sy' müssen absteigend sortiert sein. Der Heap enthält pro Index i nur den nächsten Kandidaten (i, j),
+    sodass höchstens len(sx) Einträge gleichzeitig vorliegen und die ausgewählten j pro i stets ein Präfix bilden.
+    Der Fehler ergibt sich daher ohne Auslöschung aus den Suffixsummen von sy ** 2.
+    @return: (1-D np.ndarray, 1-D np.ndarray, 1-D np.ndarray, float)
+    """
+    sx2 = sx ** 2
+    # tail_y[c] = sum(sy[c:] ** 2)
+    tail_y = np.append(np.cumsum((sy ** 2)[::-1])[::-1], 0)
+    # Anzahl ausgewählter Paare pro Index i
+    count = np.zeros(len(sx), dtype=int)
+
+    n_max = min(max_rank, len(sx) * len(sy))
+    ind_x, ind_y, s = [], [], []
+    heap = [(-sx[0] * sy[0], 0, 0)]
+    while len(s) < n_max:
+        v, i, j = heapq.heappop(heap)
+        ind_x += [i]
+        ind_y += [j]
+        s += [-v]
+        count[i] += 1
+        if j + 1 < len(sy):
+            heapq.heappush(heap, (-sx[i] * sy[j + 1], i, j + 1))
+        if j == 0 and i + 1 < len(sx):
+            heapq.heappush(heap, (-sx[i + 1] * sy[0], i + 1, 0))
+        if abs_err is not None and np.sqrt(sx2 @ tail_y[count]) < abs_err:
+            break
+
+    err = np.sqrt(sx2 @ tail_y[count])
+    return np.array(ind_x, dtype=int), np.array(ind_y, dtype=int), np.array(s), err
@@ -0,0 +1,162 @@
+import numpy as np
+from tensor.utils.dimtree import dimtree
+
+
+def from_function(cls, f, shape, max_rank, tol=1e-8, sweeps=2, samples=None, seed=None):
+    """
+    Erzeugt einen hierarchischen Tuckertensor aus der Eintragsfunktion 'f', ohne den vollen Tensor zu bilden
+    (hierarchische Kreuzapproximation).
+    'f' wird vektorisiert aufgerufen: Sie erhält einen 2-D np.ndarray der Form (N, d) aus Multiindizes und gibt die
+    N zugehörigen Einträge als 1-D np.ndarray zurück.
+    Für jeden Knoten t (außer der Wurzel) werden Zeilenpivots P_t, d.h. Multiindizes über den Modi von t, sowie
+    Spaltenpivots Q_t über den übrigen Modi bestimmt. Die Zeilenpivots sind geschachtelt, P_t ist eine Teilmenge von
+    P_l x P_r. Dazu wird von den Blättern zur Wurzel auf einer Stichprobe der t-Matrizierung eine Kreuzapproximation
+    mit vollständiger Pivotsuche berechnet. Die Kandidaten für die Spalten bestehen aus 'samples' zufälligen
+    Multiindizes sowie ab dem zweiten Durchlauf aus den geschachtelten Spalten P_s x Q_p (Geschwisterknoten s,
+    Elternknoten p) des vorherigen Durchlaufs.
+    Blattmatrizen und Transfertensoren ergeben sich anschließend aus den Einträgen A(P_l x P_r, Q_t) A(P_t, Q_t)^-1,
+    die Wurzel aus A(P_l x P_r). Abschließend wird das Ergebnis mit HTucker.truncate_htucker orthogonalisiert und
+    gemäß 'max_rank' und 'tol' gekürzt.
+    Hinweis: Wie jede Kreuzapproximation setzt das Verfahren voraus, dass die Stichproben die wesentlichen Anteile
+    des Tensors erfassen. Stark lokalisierte Tensoren (z.B. einzelne Punktmassen) werden ggf. nicht gefunden.
+    @param f: callable. Vektorisierte Eintragsfunktion
+    @param shape: tuple aus positiven ints mit mindestens zwei Modi
+    @param max_rank: positiver int
+    @param tol: positiver float. Relative Fehlertoleranz
+    @param sweeps: positiver int. Anzahl der Durchläufe
+    @param samples: positiver int oder None. Anzahl zufälliger Spaltenkandidaten je Knoten, standardmäßig 2 * max_rank
+    @param seed: int oder None. Seed des Zufallszahlengenerators
+    @return: htucker.HTucker
+    """
+    # Argument checks
+    if not callable(f):
+        raise TypeError("'f' muss eine Funktion sein.")
+    if not isinstance(shape, tuple):
+        raise TypeError("'shape' muss ein tuple aus positiven ints sein.")
+    if not len(shape) >= 2 or not all(np.issubdtype(type(n), np.integer) and n >= 1 for n in shape):
+        raise ValueError("'shape' muss ein tuple aus mindestens zwei positiven ints sein.")
+    if not np.issubdtype(type(max_rank), np.integer):
+        raise TypeError("'max_rank' muss ein positiver int sein.")
+    if not max_rank >= 1:
+        raise ValueError("'max_rank' muss ein positiver int sein.")
+    if not np.issubdtype(type(tol), np.floating):
+        raise TypeError("'tol' muss ein positiver float sein.")
+    if not tol > 0:
+        raise ValueError("'tol' muss ein positiver float sein.")
+    # HTucker.truncate_htucker akzeptiert nur Python-floats bzw. np.float64
+    tol = float(tol)
+    if not np.issubdtype(type(sweeps), np.integer):
+        raise TypeError("'sweeps' muss ein positiver int sein.")
+    if not sweeps >= 1:
+        raise ValueError("'sweeps' muss ein positiver int sein.")
+    if samples is None:
+        samples = 2 * max_rank
+    if not np.issubdtype(type(samples), np.integer):
+        raise TypeError("'samples' muss None oder ein positiver int sein.")
+    if not samples >= 1:
+        raise ValueError("'samples' muss None oder ein positiver int sein.")
+
+    rng = np.random.default_rng(seed)
+    d = len(shape)
+    dtree = dimtree.get_canonic_dimtree(d)
+
+    # Multiindizes werden stets über alle d Modi gespeichert, nicht festgelegte Modi sind mit -1 markiert
+    mask = {t: np.isin(np.arange(d), dtree.get_dim(t)) for t in dtree.get_nodes()}
+
+    def evaluate(rows, cols, t):
+        # Einträge der t-Matrizierung zu den Zeilen 'rows' und Spalten 'cols'
+        indices = np.where(mask[t], rows[:, np.newaxis, :], cols[np.newaxis, :, :]).reshape((-1, d))
+        values = np.asarray(f(indices))
+        return values.reshape((len(rows), len(cols)))
+
+    def candidate_rows(t):
+        if dtree.is_leaf(t):
+            mode = dtree.get_dim(t)[0]
+            rows = -np.ones((shape[mode], d), dtype=int)
+            rows[:, mode] = np.arange(shape[mode])
+            return rows
+        return combine(P[dtree.get_left(t)], P[dtree.get_right(t)])
+
+    def candidate_cols(t):
+        cols = -np.ones((samples, d), dtype=int)
+        for mode in np.where(~mask[t])[0]:
+            cols[:, mode] = rng.integers(0, shape[mode], samples)
+        if t in nested:
+            cols = np.vstack((nested[t], cols))
+        return np.unique(cols, axis=0)
+
+    nested = {}
+    nodes = [t for level in range(dtree.get_depth(), 0, -1) for t in dtree.get_nodes_of_level(level)]
+    for _ in range(sweeps):
+        P, Q, C, pivots = {}, {}, {}, {}
+
+        # Von den Blättern zur Wurzel: Geschachtelte Zeilenpivots
+        for t in nodes:
+            rows = candidate_rows(t)
+            cols = candidate_cols(t)
+            C[t] = evaluate(rows, cols, t)
+            ii, jj = cross(C[t], max_rank, tol)
+            P[t], Q[t] = rows[ii], cols[jj]
+            pivots[t] = ii, jj
+
+        # Von der Wurzel zu den Blättern: Geschachtelte Spaltenkandidaten für den nächsten Durchlauf
+        left, right = dtree.get_left(0), dtree.get_right(0)
+        nested = {left: P[right], right: P[left]}
+        for t in reversed(nodes):
+            if dtree.is_leaf(t):
+                continue
+            left, right = dtree.get_left(t), dtree.get_right(t)
+            nested[left] = combine(P[right], Q[t])
+            nested[right] = combine(P[left], Q[t])
+
+    # Blattmatrizen und Transfertensoren: A(P_l x P_r, Q_t) A(P_t, Q_t)^-1
+    U = {}
+    B = {}
+    for t in nodes:
+        ii, jj = pivots[t]
+        basis = C[t][:, jj] @ np.linalg.pinv(C[t][np.ix_(ii, jj)])
+        if dtree.is_leaf(t):
+            U[t] = basis
+        else:
+            B[t] = basis.reshape((len(P[dtree.get_left(t)]), len(P[dtree.get_right(t)]), -1), order="F")
+
+    # Wurzel: A(P_l x P_r)
+    left, right = dtree.get_left(0), dtree.get_right(0)
+    root = np.asarray(f(combine(P[left], P[right])))
+    B[0] = root.reshape((len(P[left]), len(P[right]), 1), order="F")
+
+    x = cls.unchecked(U=U, B=B, dtree=dtree, is_orthog=False)
+    x, _, _ = cls.truncate_htucker(x, max_rank=max_rank, rel_err=tol)
+    return x
+
+
+def combine(a, b):
+    """
+    Helferfunktion: Bildet alle Paare der Multiindizes aus 'a' und 'b', die auf disjunkten Modi festgelegt sind.
+    Der Index von 'a' läuft dabei am schnellsten, passend zur Matrizierung der Transfertensoren.
+    """
+    merged = np.where(a[np.newaxis, :, :] >= 0, a[np.newaxis, :, :], b[:, np.newaxis, :])
+    return merged.reshape((-1, a.shape[1]))
+
+
+def cross(C, max_rank, tol):
+    """
+    Helferfunktion: Kreuzapproximation der Matrix 'C' mit vollständiger Pivotsuche. Gibt die Zeilen- und
+    Spaltenindizes der höchstens 'max_rank' Pivotelemente zurück. Abgebrochen wird, sobald das betragsgrößte Element
+    des Residuums höchstens 'tol' mal dem betragsgrößten Element von 'C' entspricht.
+    """
+    R = np.array(C, dtype=float)
+    scale = np.max(np.abs(R))
+    rows, cols = [], []
+    for _ in range(min(max_rank, R.shape[0], R.shape[1])):
+        i, j = np.unravel_index(np.argmax(np.abs(R)), R.shape)
+        pivot = R[i, j]
+        if len(rows) > 0 and abs(pivot) <= tol * scale:
+            break
+        rows.append(i)
+        cols.append(j)
+        if pivot == 0:
+            # 'C' ist die Nullmatrix
+            break
+        R -= np.outer(R[:, j], R[i, :]) / pivot
+    return np.array(rows), np.array(cols)
@@ -0,0 +1,103 @@
+import numpy as np
+from tensor.utils.validation import check_cheap
+
+
+def gather(self, indices):
+    """
+    Wertet den hierarchischen Tuckertensor an N Multiindizes gleichzeitig aus. Zeile n von 'indices' enthält den
+    Multiindex (i_0, ..., i_{d-1}) des n-ten Eintrags.
+    Die Blattmatrizen werden dazu zeilenweise indiziert und die Transfertensoren in einem einzigen Durchlauf von den
+    Blättern zur Wurzel für alle N Einträge gleichzeitig kontrahiert. Der Tensor wird weder kopiert noch
+    rekonstruiert.
+    @param indices: 2-D np.ndarray aus nicht-negativen ints der Form (N, d)
+    @return: 1-D np.ndarray der Länge N
+    """
+    indices = np.asarray(indices)
+    if check_cheap():
+        if not np.issubdtype(indices.dtype, np.integer):
+            raise TypeError("'indices' muss ein 2-D np.ndarray aus nicht-negativen ints sein.")
+        if not len(indices.shape) == 2 or not indices.shape[1] == self.order:
+            raise ValueError("'indices' muss ein 2-D np.ndarray der Form (N, {}) sein.".format(self.order))
+        if indices.size > 0:
+            if not np.all(indices >= 0):
+                raise ValueError("Ungültiger Index. Jeder Index muss ein nicht-negativer int sein.")
+            if not np.all(indices < np.array(self.shape)):
+                raise ValueError("Ungültiger Index. Mindestens ein Index ist zu groß für seinen Modus.")
+
+    dt = self.dtree
+    V = {}
+
+    # Blätter: Zeilen der Blattmatrizen zu den jeweiligen Indizes
+    for mode, t in enumerate(dt.get_dim2ind()):
+        V[t] = self.U[t][indices[:, mode], :]
+
+    # Innere Knoten: V[t][n, k] = sum_ij V[l][n, i] * V[r][n, j] * B[t][i, j, k]
+    for level in range(dt.get_depth() - 1, -1, -1):
+        for t in dt.get_nodes_of_level(level):
+            if dt.is_leaf(t):
+                continue
+            left, right = dt.get_left(t), dt.get_right(t)
+            B = self.B[t]
+            prod = (V[left] @ B.reshape((B.shape[0], -1))).reshape((-1, B.shape[1], B.shape[2]))
+            V[t] = np.einsum("nj,njk->nk", V[right], prod)
+            # Die Werte der Kinder werden nicht mehr benötigt
+            del V[left], V[right]
+    return V[0][:, 0]
+
+
+def slice(self, modes, fixed_index):
+    """
+    Gibt den dichten Teiltensor zurück, der entsteht, wenn alle Modi außer 'modes' auf die Indizes aus
+    'fixed_index' festgelegt werden. 'fixed_index' enthält diese Indizes in aufsteigender Reihenfolge der Modi. Die
+    Modi des Ergebnisses sind wie in 'modes' angeordnet.
+    Rekonstruiert wird dabei nur der Teiltensor, die Blattmatrizen der festgelegten Modi bestehen jeweils aus einer
+    einzigen Zeile.
+    @param modes: list, tuple oder np.ndarray aus nicht-negativen ints
+    @param fixed_index: list, tuple oder np.ndarray aus nicht-negativen ints
+    @return: np.ndarray
+    """
+    if check_cheap():
+        for arg, name in [(modes, "modes"), (fixed_index, "fixed_index")]:
+            if not isinstance(arg, list) and not isinstance(arg, tuple) and not isinstance(arg, np.ndarray):
+                raise TypeError("'{}' muss vom Typ list, tuple oder numpy.ndarray sein.".format(name))
+            if not all(np.issubdtype(type(n), np.integer) for n in arg) or not all(n >= 0 for n in arg):
+                raise ValueError("Alle Elemente aus '{}' müssen nicht-negative ints sein.".format(name))
+        if len(set(modes)) < len(modes) or any(m >= self.order for m in modes):
+            raise ValueError("'modes' muss paarweise verschiedene Modi des hierarchischen Tuckertensors enthalten.")
+        if not len(modes) + len(fixed_index) == self.order:
+            raise ValueError("'fixed_index' muss für jeden nicht in 'modes' enthaltenen Modus einen Index enthalten.")
+
+    modes = [int(m) for m in modes]
+    fixed_modes = [m for m in range(self.order) if m not in modes]
+    if check_cheap():
+        for m, ind in zip(fixed_modes, fixed_index):
+            if ind >= self.shape[m]:
+                raise ValueError("Ungültiger Index. Index {} zu groß für Modus {} der Größe {}.".format(
+                    ind, m, self.shape[m]))
+
+    # Schränke die Blattmatrizen der festgelegten Modi auf eine Zeile ein. Alle übrigen werden geteilt.
+    dim2ind = self.dtree.get_dim2ind()
+    U = dict(self.U)
+    for m, ind in zip(fixed_modes, fixed_index):
+        U[dim2ind[m]] = self.U[dim2ind[m]][ind:ind + 1, :]
+
+    shape = np.array(self.shape)
+    reshaped_to_tensor = self.rebuild_restricted(U)
+    # Ordne die verbleibenden Modi wie in 'modes' an und entferne die festgelegten
+    return np.transpose(reshaped_to_tensor, axes=modes + fixed_modes).reshape(shape[modes])
+
+
+def fiber(self, mode, fixed_index):
+    """
+    Gibt die Faser des hierarchischen Tuckertensors im Modus 'mode' als dichten Vektor zurück. 'fixed_index' enthält
+    die Indizes aller übrigen Modi in aufsteigender Reihenfolge.
+    @param mode: nicht-negativer int
+    @param fixed_index: list, tuple oder np.ndarray aus nicht-negativen ints
+    @return: 1-D np.ndarray
+    """
+    if check_cheap():
+        if not np.issubdtype(type(mode), np.integer):
+            raise TypeError("'mode' muss ein nicht-negativer int sein.")
+        if not 0 <= mode < self.order:
+            raise ValueError("'mode' muss ein Modus des hierarchischen Tuckertensors sein.")
+    return self.slice([mode], fixed_index)
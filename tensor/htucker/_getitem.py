@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 
 def get(self, key):
@@ -23,8 +22,15 @@ def get(self, key):
             raise ValueError("Der hierarchische Tuckertensor umfasst {} Dimensions. Für jede davon muss ein index/slice"
                              " angegeben werden.".format(self.order))
 
-        # Kopiere den zugrundeliegenden hierarchischen Tuckertensor, um ein Korrumpieren zu verhindern
-        z = deepcopy(self)
+        if all(np.issubdtype(type(ind_t), np.integer) for ind_t in key):
+            # Einzelnes Element: Auswertung ohne neuen hierarchischen Tuckertensor (siehe 'gather')
+            for dim_t, ind_t in enumerate(key):
+                check_index(ind_t, dim_t, self.shape)
+            return self.gather(np.array([key]))[0]
+
+        # Neuer hierarchischer Tuckertensor, der sich die Transfertensoren mit dem zugrundeliegenden teilt
+        # Nur die Blattmatrizen werden im Folgenden ersetzt
+        z = type(self).unchecked(U=dict(self.U), B=dict(self.B), dtree=self.dtree.copy(), is_orthog=False)
 
         ind = key
         for t in z.dtree.get_leaves():
@@ -1,16 +1,23 @@
 import numpy as np
-from tensor.arithmetics.mode_multiplication import mode_multiplication
+from tensor.arithmetics.mode_multiplication import mode_multiplication_unchecked as mode_multiplication
+from tensor.utils.parallel import map_nodes, check_executor
+from tensor.utils.precision import ACCUMULATION_DTYPE
 
 
-def gramians_orthog(cls, x):
+def gramians_orthog(cls, x, executor=None):
     """
     Berechnet die Gram'schen Matrizen für einen orthogonalen hierarchischen Tuckertensor.
+    Die Gram'schen Matrizen werden unabhängig vom Datentyp von 'x' in np.float64 akkumuliert.
+    Ist 'executor' übergeben oder global gesetzt (siehe tensor.utils.parallel), werden die Knoten eines Levels parallel
+    bearbeitet.
     @param x: tensor.htucker.htucker
+    @param executor: concurrent.futures.Executor oder None
     @return: dict bestehend aus 2-D np.ndarrays
     """
     # Argument check
     if not isinstance(x, cls):
         raise TypeError("'x' ist kein hierarchischer Tuckertensor.")
+    check_executor(executor)
 
     # Prüfe ob x orthogonal ist
     if not x.is_orthog:
@@ -18,21 +25,21 @@ def gramians_orthog(cls, x):
 
     # Memorize gramians in dict
     # The roots gramian is 1
-    G = {0: np.ones((1, 1))}
+    G = {0: np.ones((1, 1), dtype=ACCUMULATION_DTYPE)}
+
+    def gramians_children(t):
+        B_mod = mode_multiplication(U=G[t], A=x.B[t], mu=2)
+        G_left = np.tensordot(x.B[t], B_mod, axes=[[1, 2], [1, 2]])
+        G_right = np.tensordot(x.B[t], B_mod, axes=[[0, 2], [0, 2]])
+        return G_left, G_right
 
     # Traverse tree top down
     for level in range(0, x.dtree.get_depth(), 1):
-        for t in x.dtree.get_nodes_of_level(level):
-            if x.dtree.is_leaf(t):
-                continue
+        nodes = [t for t in x.dtree.get_nodes_of_level(level) if not x.dtree.is_leaf(t)]
+        for t, (G_left, G_right) in zip(nodes, map_nodes(gramians_children, nodes, executor)):
             # Children
-            t_left = x.dtree.get_left(t)
-            t_right = x.dtree.get_right(t)
-
-            B_mod = mode_multiplication(U=G[t], A=x.B[t], mu=2)
-
-            G[t_left] = np.tensordot(x.B[t], B_mod, axes=[[1, 2], [1, 2]])
-            G[t_right] = np.tensordot(x.B[t], B_mod, axes=[[0, 2], [0, 2]])
+            G[x.dtree.get_left(t)] = G_left
+            G[x.dtree.get_right(t)] = G_right
 
     return G
 
@@ -0,0 +1,100 @@
+import numpy as np
+from tensor.utils.validation import check_cheap
+from ._rebuild import chunk_blocks, check_chunks
+
+
+def inner_product_dense(cls, x, A, chunk_modes=None, chunk_size=1):
+    """
+    Berechnet das innere Produkt des hierarchischen Tuckertensors 'x' mit dem dichten Tensor 'A', ohne 'x' zu
+    rekonstruieren. 'A' wird dazu auf die Blattmatrizen von 'x' projiziert und das Ergebnis anschließend von den
+    Blättern zur Wurzel mit den Transfertensoren kontrahiert.
+    Mit 'chunk_modes' und 'chunk_size' wird 'A' blockweise gelesen (siehe HTucker.full), sodass 'A' auch ein
+    np.memmap sein kann, der nicht vollständig in den Speicher passt.
+    @param x: htucker.HTucker
+    @param A: np.ndarray
+    @param chunk_modes: list, tuple oder np.ndarray aus nicht-negativen ints oder None
+    @param chunk_size: positiver int
+    @return: float
+    """
+    check_dense(cls, x, A, chunk_modes, chunk_size)
+    ip, _ = dense_products(x, A, chunk_modes, chunk_size)
+    return ip
+
+
+def distance_to_dense(cls, x, A, chunk_modes=None, chunk_size=1):
+    """
+    Berechnet die Frobeniusnorm ||A - x|| des Abstands zwischen dem hierarchischen Tuckertensor 'x' und dem dichten
+    Tensor 'A' über ||A - x||^2 = ||A||^2 - 2 <A, x> + ||x||^2. ||A||^2 und <A, x> werden in einem gemeinsamen
+    blockweisen Durchlauf über 'A' bestimmt (siehe 'inner_product_dense'), ||x|| mit HTucker.norm.
+    Hinweis: Durch Auslöschung ist das Ergebnis nur bis auf etwa sqrt(eps) * ||A|| genau.
+    @param x: htucker.HTucker
+    @param A: np.ndarray
+    @param chunk_modes: list, tuple oder np.ndarray aus nicht-negativen ints oder None
+    @param chunk_size: positiver int
+    @return: float
+    """
+    check_dense(cls, x, A, chunk_modes, chunk_size)
+    ip, norm_A_sq = dense_products(x, A, chunk_modes, chunk_size)
+    norm_x = cls.norm(x)
+    return float(np.sqrt(max(norm_A_sq - 2 * ip + norm_x ** 2, 0)))
+
+
+def dense_products(x, A, chunk_modes, chunk_size):
+    """
+    Helferfunktion: Gibt <A, x> und ||A||^2 zurück. 'A' wird dabei blockweise gelesen.
+    """
+    if chunk_modes is None or len(chunk_modes) == 0:
+        blocks = [(tuple([slice(None)] * x.order), x.U)]
+    else:
+        blocks = chunk_blocks(x, chunk_modes, chunk_size)
+
+    ip = 0.
+    norm_A_sq = 0.
+    for key, U in blocks:
+        A_block = np.asarray(A[key])
+        norm_A_sq += np.sum(A_block * A_block)
+        ip += project_and_contract(x, A_block, U)
+    return float(ip), float(norm_A_sq)
+
+
+def project_and_contract(x, A, U):
+    """
+    Helferfunktion: Berechnet <A, x>, wobei anstelle von x.U die Blattmatrizen aus 'U' verwendet werden.
+    """
+    dt = x.dtree
+    # 'labels' ordnet jeder Achse des aktuellen Tensors 'C' den zugehörigen Knoten des Dimensionsbaums zu
+    C = A
+    labels = list(dt.get_dim2ind())
+
+    # Projektion auf die Blattmatrizen. Die größten Modi werden zuerst verkleinert
+    for mode in np.argsort(A.shape)[::-1]:
+        t = dt.get_dim2ind()[mode]
+        ax = labels.index(t)
+        C = np.tensordot(C, U[t], axes=[ax, 0])
+        labels = labels[:ax] + labels[ax + 1:] + [t]
+
+    # Kontraktion mit den Transfertensoren von den Blättern zur Wurzel
+    for level in range(dt.get_depth() - 1, -1, -1):
+        for t in dt.get_nodes_of_level(level):
+            if dt.is_leaf(t):
+                continue
+            left, right = dt.get_left(t), dt.get_right(t)
+            ax_l, ax_r = labels.index(left), labels.index(right)
+            C = np.tensordot(C, x.B[t], axes=[[ax_l, ax_r], [0, 1]])
+            labels = [s for s in labels if s not in (left, right)] + [t]
+    return C.reshape(-1)[0]
+
+
+def check_dense(cls, x, A, chunk_modes, chunk_size):
+    """
+    Helferfunktion: Prüft die Argumente von 'inner_product_dense' und 'distance_to_dense'.
+    """
+    if not check_cheap():
+        return
+    if not isinstance(x, cls):
+        raise TypeError("'x' ist kein hierarchischer Tuckertensor.")
+    if not isinstance(A, np.ndarray):
+        raise TypeError("'A' muss ein np.ndarray sein.")
+    if not A.shape == x.shape:
+        raise ValueError("'A' und 'x' müssen dieselbe Form haben.")
+    check_chunks(x, chunk_modes, chunk_size)
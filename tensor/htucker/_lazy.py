@@ -0,0 +1,188 @@
+import numpy as np
+
+
+class LazyHTucker:
+    """
+    Verzögert ausgewertete Linearkombination hierarchischer Tuckertensoren.
+    Summen, Differenzen, Skalarmultiplikationen, Modusmultiplikationen und elementweise Produkte werden zunächst nur
+    vermerkt. Erst 'evaluate' berechnet die gesamte Linearkombination mit einem einzigen Aufruf von
+    HTucker.add_and_truncate. Zwischensummen mit aufgeblähtem Rang werden dabei weder gebildet noch orthogonalisiert.
+    """
+    # Verhindert, dass numpy Skalare (z.B. np.float64) die Multiplikation elementweise auf ein Objektarray anwenden
+    __array_ufunc__ = None
+
+    def __init__(self, terms, cls):
+        """
+        Konstruktor: Jeder Summand in 'terms' ist ein Tupel (a, x, ops). Dabei ist 'a' der Koeffizient, 'x' ein
+        hierarchischer Tuckertensor oder ein Tupel (y, z) zweier LazyHTucker Objekte, das deren elementweises Produkt
+        repräsentiert, und 'ops' eine Liste von Modusmultiplikationen, die auf 'x' anzuwenden sind.
+        @param terms: list aus tuples (float, htucker.HTucker oder tuple, list)
+        @param cls: Klasse der hierarchischen Tuckertensoren
+        """
+        self.terms = terms
+        self.cls = cls
+
+    @staticmethod
+    def wrap(x):
+        """
+        Gibt 'x' als LazyHTucker zurück. Ist 'x' weder LazyHTucker noch hierarchischer Tuckertensor, wird None
+        zurückgegeben.
+        """
+        from tensor.htucker import HTucker
+        if isinstance(x, LazyHTucker):
+            return x
+        if isinstance(x, HTucker):
+            return LazyHTucker([(1., x, [])], type(x))
+        return None
+
+    def __add__(self, other):
+        other = LazyHTucker.wrap(other)
+        if other is None:
+            return NotImplemented
+        return LazyHTucker(self.terms + other.terms, self.cls)
+
+    def __radd__(self, other):
+        # Ermöglicht sum(...) mit dem Startwert 0
+        if np.issubdtype(type(other), np.number) and other == 0:
+            return self
+        return self.__add__(other)
+
+    def __neg__(self):
+        return self * -1.
+
+    def __sub__(self, other):
+        other = LazyHTucker.wrap(other)
+        if other is None:
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other):
+        other = LazyHTucker.wrap(other)
+        if other is None:
+            return NotImplemented
+        return other + (-self)
+
+    def __mul__(self, other):
+        if np.issubdtype(type(other), np.integer) or np.issubdtype(type(other), np.floating):
+            # Skalarmultiplikation: Nur die Koeffizienten werden angepasst
+            return LazyHTucker([(a * other, x, ops) for a, x, ops in self.terms], self.cls)
+        other = LazyHTucker.wrap(other)
+        if other is None:
+            return NotImplemented
+        # Elementweises Produkt
+        return LazyHTucker([(1., (self, other), [])], self.cls)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def mode_mul(self, A, mu):
+        """
+        Verzögerte Modusmultiplikation A o_mu self. Diese wird bei der Auswertung auf jeden Summanden angewendet.
+        @param A: 2D np.ndarray
+        @param mu: nicht-negativer integer
+        @return: LazyHTucker
+        """
+        return LazyHTucker([(a, x, ops + [("mode", A, mu)]) for a, x, ops in self.terms], self.cls)
+
+    def ews_mode_mul(self, vec, mu):
+        """
+        Verzögerte elementweise Modusmultiplikation vec *_mu self. Diese wird bei der Auswertung auf jeden Summanden
+        angewendet.
+        @param vec: 1D np.ndarray
+        @param mu: nicht-negativer integer
+        @return: LazyHTucker
+        """
+        return LazyHTucker([(a, x, ops + [("ews_mode", vec, mu)]) for a, x, ops in self.terms], self.cls)
+
+    def summands(self, max_rank, abs_err=None):
+        """
+        Gibt die Summanden der Linearkombination als Liste hierarchischer Tuckertensoren zurück, ohne diese
+        aufzuaddieren. Elementweise Produkte werden dabei gemäß 'max_rank' und 'abs_err' gekürzt ausgewertet.
+        @param max_rank: positiver int
+        @param abs_err: positiver float
+        @return: list aus htucker.HTucker Objekten
+        """
+        return [self.lower(term, max_rank, abs_err) for term in self.terms]
+
+    def evaluate(self, max_rank, abs_err=None, rel_err=None):
+        """
+        Wertet die Linearkombination aus und kürzt sie in einem einzigen Durchlauf entsprechend 'max_rank',
+        'abs_err' und 'rel_err'.
+        Elementweise Produkte werden vorab mittels HTucker.ews_multiplication mit derselben Rangschranke und
+        absoluten Fehlertoleranz gebildet.
+        @param max_rank: positiver int
+        @param abs_err: positiver float
+        @param rel_err: positiver float
+        @return: htucker.HTucker, dict, dict
+        """
+        summanden = self.summands(max_rank, abs_err)
+        return self.cls.add_and_truncate(summanden=summanden, max_rank=max_rank, abs_err=abs_err, rel_err=rel_err,
+                                         copy=False)
+
+    def lower(self, term, max_rank, abs_err):
+        """
+        Helferfunktion: Überführt einen einzelnen Summanden in einen hierarchischen Tuckertensor.
+        """
+        cls = self.cls
+        a, x, ops = term
+        if isinstance(x, tuple):
+            y = x[0].materialize(max_rank, abs_err)
+            z = x[1].materialize(max_rank, abs_err)
+            x, _, _ = cls.ews_multiplication(x=y, y=z, max_rank=max_rank, abs_err=abs_err)
+        for kind, M, mu in ops:
+            if kind == "mode":
+                x = cls.mode_multiplication(x, M, mu)
+            else:
+                x = cls.ews_mode_multiplication(x, M, mu)
+        if a != 1:
+            x = cls.scalar_mul(x, a)
+        return x
+
+    def materialize(self, max_rank, abs_err):
+        """
+        Helferfunktion: Gibt den repräsentierten hierarchischen Tuckertensor zurück. Besteht die Linearkombination aus
+        nur einem Summanden ohne elementweises Produkt, ist dies ohne Kürzung exakt möglich.
+        """
+        if len(self.terms) == 1 and not isinstance(self.terms[0][1], tuple):
+            return self.lower(self.terms[0], max_rank, abs_err)
+        z, _, _ = self.evaluate(max_rank, abs_err)
+        return z
+
+
+# Operatoren von htucker.HTucker
+# Diese geben jeweils ein LazyHTucker Objekt zurück
+
+def lazy(self):
+    """
+    Gibt den hierarchischen Tuckertensor als verzögert ausgewertete Linearkombination zurück.
+    @return: LazyHTucker
+    """
+    return LazyHTucker.wrap(self)
+
+
+def __add__(self, other):
+    return LazyHTucker.wrap(self).__add__(other)
+
+
+def __radd__(self, other):
+    return LazyHTucker.wrap(self).__radd__(other)
+
+
+def __sub__(self, other):
+    return LazyHTucker.wrap(self).__sub__(other)
+
+
+def __rsub__(self, other):
+    return LazyHTucker.wrap(self).__rsub__(other)
+
+
+def __neg__(self):
+    return LazyHTucker.wrap(self).__neg__()
+
+
+def __mul__(self, other):
+    return LazyHTucker.wrap(self).__mul__(other)
+
+
+def __rmul__(self, other):
+    return LazyHTucker.wrap(self).__rmul__(other)
@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 
 def mode_multiplication(cls, x, A, mu):
@@ -26,9 +25,10 @@ def mode_multiplication(cls, x, A, mu):
     if not x.shape[mu] == A.shape[1]:
         raise ValueError("'x', 'A' und 'mu' passen nicht zusammen.")
 
+    # Nur die Blattmatrix des Modus 'mu' wird neu berechnet, alle übrigen Knoten werden mit 'x' geteilt
     dt = x.dtree.copy()
-    U = deepcopy(x.U)
-    B = deepcopy(x.B)
+    U = dict(x.U)
+    B = dict(x.B)
 
     # Index des Modus 'mu'
     ind = dt.get_ind(mu)
@@ -37,5 +37,5 @@ def mode_multiplication(cls, x, A, mu):
     U[ind] = np.dot(A, U[ind])
 
     # Resultierender hierarchischer Tuckertensor
-    z = cls(U=U, B=B, dtree=dt, is_orthog=False)
+    z = cls.unchecked(U=U, B=B, dtree=dt, is_orthog=False)
     return z
@@ -1,19 +1,27 @@
 import numpy as np
-from copy import deepcopy
+from tensor.utils.parallel import map_nodes, check_executor
+from tensor.utils.precision import to_accumulation
 
 
-def orthogonalize(cls, x):
+def orthogonalize(cls, x, executor=None):
     """
     Orthogonalisiert eine Kopie von 'x'.
+    Die QR-Zerlegungen und R-Faktoren werden in np.float64 berechnet, die orthogonalen Faktoren behalten den
+    Datentyp der jeweiligen Blattmatrix bzw. des Transfertensors von 'x'.
+    Ist 'executor' übergeben oder global gesetzt (siehe tensor.utils.parallel), werden die Knoten eines Levels parallel
+    bearbeitet.
     @param x: htucker.HTucker
+    @param executor: concurrent.futures.Executor oder None
     @return: htucker.HTucker
     """
     if not isinstance(x, cls):
         raise TypeError("'x' ist kein hierarchischer Tuckertensor.")
+    check_executor(executor)
 
-    # Falls 'x' bereits orthogonal ist, gebe eine Kopie zurück
+    # Falls 'x' bereits orthogonal ist, gebe einen neuen hierarchischen Tuckertensor zurück, der sämtliche
+    # Blattmatrizen und Transfertensoren mit 'x' teilt
     if x.is_orthog:
-        return deepcopy(x)
+        return cls.unchecked(U=dict(x.U), B=dict(x.B), dtree=x.dtree.copy(), is_orthog=True)
 
     # Initialisiere Dimensionsbaum, Blattmatrizen und Transfertensoren des neuen hierarchischen Tuckertensors
     dt = x.dtree.copy()
@@ -22,33 +30,36 @@ def orthogonalize(cls, x):
     R = {}
 
     # Anpassen der Blattmatrizen
-    for leaf in dt.get_leaves():
-        Ut = x.U[leaf]
-        Ut_orthog, Rt = np.linalg.qr(Ut)
-        U_upd[leaf] = Ut_orthog
+    leaves = dt.get_leaves()
+    for leaf, (Ut_orthog, Rt) in zip(leaves, map_nodes(lambda t: np.linalg.qr(to_accumulation(x.U[t])), leaves,
+                                                         executor)):
+        U_upd[leaf] = Ut_orthog.astype(x.U[leaf].dtype, copy=False)
         R[leaf] = Rt
 
+    def orthogonalize_node(node):
+        # Die Knoten eines Levels sind unabhängig voneinander, sie lesen nur die R-Faktoren ihrer Kinder
+        right = dt.get_right(node)
+        left = dt.get_left(node)
+        Rtr = R[right]
+        Rtl = R[left]
+        Bt_hat = np.tensordot(Rtr, x.B[node], axes=[1, 1])
+        Bt_hat = np.tensordot(Rtl, Bt_hat, axes=[1, 1])
+        if node == 0:
+            return Bt_hat.astype(x.B[node].dtype, copy=False), None
+        Bt_hat = Bt_hat.reshape((Bt_hat.shape[0] * Bt_hat.shape[1], -1), order="F")
+        Bt_upd, Rt = np.linalg.qr(Bt_hat)
+        Bt_upd = Bt_upd.reshape((Rtl.shape[0], Rtr.shape[0], -1), order="F").astype(x.B[node].dtype, copy=False)
+        return Bt_upd, Rt
+
     # Anpassen der Transfertensoren
     depth = dt.get_depth()
     for level in range(depth - 1, -1, -1):
-        for node in dt.get_nodes_of_level(level):
-            if dt.is_leaf(node):
-                continue
-            right = dt.get_right(node)
-            left = dt.get_left(node)
-            Rtr = R[right]
-            Rtl = R[left]
-            Bt_hat = np.tensordot(Rtr, x.B[node], axes=[1, 1])
-            Bt_hat = np.tensordot(Rtl, Bt_hat, axes=[1, 1])
-            if node == 0:
-                B_upd[node] = Bt_hat
-            else:
-                Bt_hat = Bt_hat.reshape((Bt_hat.shape[0] * Bt_hat.shape[1], -1), order="F")
-                Bt_upd, Rt = np.linalg.qr(Bt_hat)
-                Bt_upd = Bt_upd.reshape((Rtl.shape[0], Rtr.shape[0], -1), order="F")
-                B_upd[node] = Bt_upd
+        nodes = [node for node in dt.get_nodes_of_level(level) if not dt.is_leaf(node)]
+        for node, (Bt_upd, Rt) in zip(nodes, map_nodes(orthogonalize_node, nodes, executor)):
+            B_upd[node] = Bt_upd
+            if Rt is not None:
                 R[node] = Rt
-            del R[right]
-            del R[left]
-    orthog_htucker = cls(U=U_upd, B=B_upd, dtree=dt, is_orthog=True)
+            del R[dt.get_right(node)]
+            del R[dt.get_left(node)]
+    orthog_htucker = cls.unchecked(U=U_upd, B=B_upd, dtree=dt, is_orthog=True)
     return orthog_htucker
@@ -1,33 +1,123 @@
+import itertools
 import numpy as np
+from tensor.utils.validation import check_cheap
 
 
-def full(self):
+def full(self, out=None, chunk_modes=None, chunk_size=1):
     """
     Rekonstruiert aus dem gegebenen hierarchischen Tuckertensor den expliziten vollen Tensor.
+    Ist 'out' übergeben, wird der Tensor in diesen np.ndarray (z.B. einen np.memmap) geschrieben und 'out'
+    zurückgegeben.
+    Mit 'chunk_modes' wird blockweise rekonstruiert: Die Modi aus 'chunk_modes' werden in Blöcken von je 'chunk_size'
+    Indizes durchlaufen und jeder Block wird für sich rekonstruiert und nach 'out' geschrieben. Im Speicher liegen
+    dabei nur die Zwischenergebnisse eines einzelnen Blocks.
+    @param out: np.ndarray oder None
+    @param chunk_modes: list, tuple oder np.ndarray aus nicht-negativen ints oder None
+    @param chunk_size: positiver int
+    @return: np.ndarray
     """
-    rebuilt_as_vector = self.rebuild_tensor_helper(0)
-    root_dim = self.dtree.get_dim(0)
-    root_shape = np.array(self.shape)[root_dim]
-    reshaped_to_tensor = rebuilt_as_vector.reshape(root_shape, order="F")
+    if check_cheap():
+        if out is not None:
+            if not isinstance(out, np.ndarray):
+                raise TypeError("'out' muss None oder ein np.ndarray sein.")
+            if not out.shape == self.shape:
+                raise ValueError("'out' muss die Form {} haben.".format(self.shape))
+        check_chunks(self, chunk_modes, chunk_size)
+
+    if chunk_modes is None or len(chunk_modes) == 0:
+        rebuilt = self.rebuild_restricted(self.U)
+        if out is None:
+            return rebuilt
+        out[...] = rebuilt
+        return out
+
+    if out is None:
+        out = np.empty(self.shape, dtype=np.result_type(*self.U.values(), *self.B.values()))
+
+    # Durchlaufe alle Blöcke der Modi aus 'chunk_modes'
+    for key, U in chunk_blocks(self, chunk_modes, chunk_size):
+        out[key] = self.rebuild_restricted(U)
+    return out
+
+
+def chunk_blocks(x, chunk_modes, chunk_size):
+    """
+    Helferfunktion: Durchläuft die Modi aus 'chunk_modes' in Blöcken von je 'chunk_size' Indizes. Für jeden Block
+    werden der Index 'key' des Blocks im vollen Tensor sowie die auf den Block eingeschränkten Blattmatrizen 'U'
+    zurückgegeben. Alle übrigen Blattmatrizen werden geteilt.
+    """
+    dim2ind = x.dtree.get_dim2ind()
+    for key in chunk_keys(x.shape, chunk_modes, chunk_size):
+        U = dict(x.U)
+        for m in chunk_modes:
+            U[dim2ind[m]] = x.U[dim2ind[m]][key[m], :]
+        yield key, U
+
+
+def chunk_keys(shape, chunk_modes, chunk_size):
+    """
+    Helferfunktion: Durchläuft die Modi aus 'chunk_modes' eines Tensors der Form 'shape' in Blöcken von je
+    'chunk_size' Indizes und gibt für jeden Block dessen Index 'key' im vollen Tensor zurück.
+    """
+    starts = [range(0, shape[m], chunk_size) for m in chunk_modes]
+    for block in itertools.product(*starts):
+        key = [slice(None)] * len(shape)
+        for m, start in zip(chunk_modes, block):
+            key[m] = slice(start, min(start + chunk_size, shape[m]))
+        yield tuple(key)
+
+
+def check_chunks(x, chunk_modes, chunk_size):
+    """
+    Helferfunktion: Prüft die Argumente 'chunk_modes' und 'chunk_size' für blockweise Rechnungen mit 'x'.
+    """
+    if chunk_modes is not None:
+        if not isinstance(chunk_modes, list) and not isinstance(chunk_modes, tuple) \
+                and not isinstance(chunk_modes, np.ndarray):
+            raise TypeError("'chunk_modes' muss None oder vom Typ list, tuple oder numpy.ndarray sein.")
+        if not all(np.issubdtype(type(m), np.integer) for m in chunk_modes) \
+                or not all(0 <= m < x.order for m in chunk_modes) or len(set(chunk_modes)) < len(chunk_modes):
+            raise ValueError("'chunk_modes' muss paarweise verschiedene Modi des hierarchischen Tuckertensors "
+                             "enthalten.")
+    if not np.issubdtype(type(chunk_size), np.integer):
+        raise TypeError("'chunk_size' muss ein positiver int sein.")
+    if not chunk_size >= 1:
+        raise ValueError("'chunk_size' muss ein positiver int sein.")
+
+
+def rebuild_restricted(self, U):
+    """
+    Helferfunktion: Rekonstruiert den vollen Tensor, wobei anstelle von self.U die Blattmatrizen aus 'U' verwendet
+    werden. Deren Zeilenanzahl bestimmt die Form des Ergebnisses.
+    """
+    dt = self.dtree
+    shape = np.array([U[t].shape[0] for t in dt.get_dim2ind()])
+    rebuilt_as_vector = self.rebuild_tensor_helper(0, U)
+    root_dim = dt.get_dim(0)
+    reshaped_to_tensor = rebuilt_as_vector.reshape(shape[root_dim], order="F")
     moved_axes_tensor = np.moveaxis(reshaped_to_tensor, source=range(self.order), destination=root_dim)
     return moved_axes_tensor
 
 
-def rebuild_tensor_helper(self, node):
+def rebuild_tensor_helper(self, node, U=None):
     """
-    Helferfunktion
+    Helferfunktion. Mit 'U' können anstelle von self.U andere Blattmatrizen verwendet werden.
     """
     dt = self.dtree
+    if U is None:
+        U = self.U
     if dt.is_leaf(node):
         # Basisfall
         # Node ist ein Blatt
-        return self.U[node]
+        return U[node]
     # Rekursiver Fall
     right = dt.get_right(node)
     left = dt.get_left(node)
-    Ul = self.rebuild_tensor_helper(left)
-    Ur = self.rebuild_tensor_helper(right)
+    Ul = self.rebuild_tensor_helper(left, U)
+    Ur = self.rebuild_tensor_helper(right, U)
     B = self.B[node]
     prod = np.tensordot(Ul, B, axes=[1, 0])
+    # Das Zwischenergebnis des linken Kindes wird nicht mehr benötigt
+    del Ul
     prod = np.tensordot(Ur, prod, axes=[1, 1])
     return prod.reshape((-1, B.shape[2]))
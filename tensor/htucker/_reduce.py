@@ -0,0 +1,65 @@
+import numpy as np
+from tensor.utils.validation import check_cheap
+
+
+def reduce(self, modes, weights=None):
+    """
+    Summiert den hierarchischen Tuckertensor über die Modi aus 'modes', ohne den vollen Tensor zu rekonstruieren.
+    Mit 'weights' werden gewichtete Summen berechnet: 'weights' enthält für jeden Modus aus 'modes' einen 1-D
+    np.ndarray passender Länge oder None (ungewichtete Summe).
+    Dazu werden die Blattmatrizen der reduzierten Modi von links mit dem jeweiligen Gewichtsvektor multipliziert und
+    die entstehenden Modi der Größe 1 anschließend aus dem Dimensionsbaum entfernt (siehe 'squeeze').
+    Bleiben höchstens zwei Modi übrig, wird das Ergebnis als dichter np.ndarray zurückgegeben, werden alle Modi
+    reduziert, als float. Andernfalls ist das Ergebnis ein hierarchischer Tuckertensor. Die verbleibenden Modi
+    behalten ihre Reihenfolge.
+    Beispiel: x.reduce([0, 1]) entspricht np.sum(x.full(), axis=(0, 1)).
+    @param modes: list, tuple oder np.ndarray aus nicht-negativen ints
+    @param weights: list oder tuple aus 1-D np.ndarrays bzw. None, oder None
+    @return: htucker.HTucker, np.ndarray oder float
+    """
+    if check_cheap():
+        if not isinstance(modes, list) and not isinstance(modes, tuple) and not isinstance(modes, np.ndarray):
+            raise TypeError("'modes' muss vom Typ list, tuple oder numpy.ndarray sein.")
+        if not all(np.issubdtype(type(m), np.integer) for m in modes) or not all(0 <= m < self.order for m in modes):
+            raise ValueError("Alle Elemente aus 'modes' müssen Modi des hierarchischen Tuckertensors sein.")
+        if len(set(modes)) < len(modes):
+            raise ValueError("'modes' darf keine Duplikate enthalten.")
+        if weights is not None:
+            if not isinstance(weights, list) and not isinstance(weights, tuple):
+                raise TypeError("'weights' muss None oder eine list bzw. ein tuple sein.")
+            if not len(weights) == len(modes):
+                raise ValueError("'weights' muss für jeden Modus aus 'modes' einen Eintrag enthalten.")
+            for m, w in zip(modes, weights):
+                if w is None:
+                    continue
+                if not isinstance(w, np.ndarray):
+                    raise TypeError("Jedes Element aus 'weights' muss None oder ein 1-D np.ndarray sein.")
+                if not w.shape == (self.shape[m],):
+                    raise ValueError("Der Gewichtsvektor für Modus {} muss die Länge {} haben.".format(m,
+                                                                                                 self.shape[m]))
+
+    modes = [int(m) for m in modes]
+    if len(modes) == 0:
+        return self
+    if weights is None:
+        weights = [None] * len(modes)
+
+    # Blattmatrizen der reduzierten Modi werden zu Zeilenvektoren, alle übrigen werden geteilt
+    cls = type(self)
+    dim2ind = self.dtree.get_dim2ind()
+    U = dict(self.U)
+    for m, w in zip(modes, weights):
+        Ut = self.U[dim2ind[m]]
+        if w is None:
+            U[dim2ind[m]] = np.sum(Ut, axis=0, keepdims=True)
+        else:
+            U[dim2ind[m]] = (w @ Ut).reshape((1, -1))
+    z = cls.unchecked(U=U, B=self.B, dtree=self.dtree, is_orthog=False)
+
+    remaining = [m for m in range(self.order) if m not in modes]
+    if len(remaining) == 0:
+        return float(z.gather(np.zeros((1, self.order), dtype=int))[0])
+    if len(remaining) <= 2:
+        # Der dichte Teiltensor ist klein, er wird direkt rekonstruiert
+        return z.slice(remaining, [0] * len(modes))
+    return cls.squeeze(z, modes)
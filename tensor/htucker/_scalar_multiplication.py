@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 
 def scalar_mul(cls,x, a):
@@ -16,6 +15,8 @@ def scalar_mul(cls,x, a):
     if not np.issubdtype(type(a), np.integer) and not np.issubdtype(type(a),np.float):
         raise TypeError("'a' ist weder int noch float.")
 
-    z = deepcopy(x)
-    z.B[0] = a * z.B[0]
+    # Nur der Transfertensor der Wurzel wird neu berechnet, alle übrigen Knoten werden mit 'x' geteilt
+    B = dict(x.B)
+    B[0] = a * x.B[0]
+    z = cls.unchecked(U=dict(x.U), B=B, dtree=x.dtree.copy(), is_orthog=x.is_orthog)
     return z
@@ -1,7 +1,6 @@
 import numpy as np
-from tensor.arithmetics.mode_multiplication import mode_multiplication
+from tensor.arithmetics.mode_multiplication import mode_multiplication_unchecked as mode_multiplication
 from tensor.utils.dimtree import dimtree
-from copy import deepcopy
 
 
 def squeeze(cls, x, dims=None, copy=True):
@@ -28,17 +27,19 @@ def squeeze(cls, x, dims=None, copy=True):
 
     # Vorbereitung der Variablen des neuen hierarchischen Tuckertensors
     # Dazu werden ggf. einige Variablen des alten hierarchischen Tuckertensors kopiert, um ein Korrumpieren eben jenes
-    # hierarchischen Tuckertensors zu verhindern
-    dtree = x.dtree.copy()
-    children = dtree.get_children()
-    dim2ind = dtree.get_dim2ind()
-    parent = dtree.get_parent()
+    # hierarchischen Tuckertensors zu verhindern. Der Dimensionsbaum ist unveränderlich, daher wird auf Kopien seiner
+    # Struktur gearbeitet
+    dtree = x.dtree
+    children = np.array(dtree.get_children())
+    dim2ind = np.array(dtree.get_dim2ind())
+    parent = np.array(dtree.get_parent())
     nr_nodes = dtree.get_nr_nodes()
     shape = np.array(x.shape)
     is_orthog = x.is_orthog
     if copy:
-        xU = deepcopy(x.U)
-        xB = deepcopy(x.B)
+        # Es werden nur Einträge der dicts ersetzt, die Blattmatrizen und Transfertensoren selbst werden geteilt
+        xU = dict(x.U)
+        xB = dict(x.B)
     else:
         xU = x.U
         xB = x.B
@@ -58,28 +59,26 @@ def squeeze(cls, x, dims=None, copy=True):
 
     while len(np.where(shape > -1)[0]) > 2:
         # Index des nächsten Blattknotens, der eliminiert wird
-        ind = next_single_node(dtree, shape, to_squeeze)
+        ind = next_single_node(children, dim2ind, parent, shape, to_squeeze)
 
         if ind == -1:
             # keine zu eliminierenden Knoten sind übrig
             break
-        ind_sibling = dtree.get_sibling(ind)
-        ind_par = dtree.get_parent(ind)
+        ind_par = parent[ind]
+        is_left = children[ind_par][0] == ind
+        ind_sibling = children[ind_par][1] if is_left else children[ind_par][0]
 
         # Der zu ind gehörige Modus
-        d_ind = dtree.get_dim(ind)
-        assert len(d_ind) == 1
-        d_ind = d_ind[0]
+        d_ind = np.argmax(dim2ind == ind)
 
         # Wende xU[ind] auf den Transfertensor xB des Elternknotens an und erhalte die Matrix tmp
-        if dtree.is_left(ind):
-            tmp = xU[ind] * xB[ind_par]
-            tmp = np.sum(tmp, axis=0)
+        # xU[ind] ist ein Zeilenvektor, er wird mit dem ersten bzw. zweiten Modus von xB[ind_par] kontrahiert
+        if is_left:
+            tmp = np.tensordot(xU[ind][0], xB[ind_par], axes=[0, 0])
         else:
-            tmp = xU[ind] * xB[ind_par]
-            tmp = np.sum(tmp, axis=1)
+            tmp = np.tensordot(xU[ind][0], xB[ind_par], axes=[0, 1])
 
-        if dtree.is_leaf(ind_sibling):
+        if np.all(children[ind_sibling] == -1):
             # Geschwisterknoten ist auch ein Blatt
             # Wende die Blattmatrix des Geschwisterknotens auf tmp an
             xU[ind_par] = xU[ind_sibling] @ tmp
@@ -126,18 +125,16 @@ def squeeze(cls, x, dims=None, copy=True):
 
     # Erzeuge den resultierenden hierarchischen Tuckertensor
     dtree = dimtree(children=children, dim2ind=dim2ind)
-    new_htucker = cls(dtree=dtree, U=xU, B=xB, is_orthog=is_orthog)
+    new_htucker = cls.unchecked(dtree=dtree, U=xU, B=xB, is_orthog=is_orthog)
     return new_htucker
 
 
-def next_single_node(dtree, shape, to_squeeze):
+def next_single_node(children, dim2ind, parent, shape, to_squeeze):
     """
-    Helferfunktion: Gibt die Knoten im Dimensionsbaum 'dtree' zurück, deren Größe 1 ist. Falls zwei benachbarte
-    Knoten Größe 1 haben, werden diese zuerst zurückgegeben.
+    Helferfunktion: Gibt die Knoten im durch 'children', 'dim2ind' und 'parent' gegebenen Dimensionsbaum zurück, deren
+    Größe 1 ist. Falls zwei benachbarte Knoten Größe 1 haben, werden diese zuerst zurückgegeben.
     """
 
-    dim2ind = dtree.get_dim2ind()
-    children = dtree.get_children()
     to_squeeze = np.array(to_squeeze)
 
     # All Blattknoten deren Modusgröße 1 ist
@@ -150,7 +147,7 @@ def next_single_node(dtree, shape, to_squeeze):
     single_nodes = dim2ind[single_dims]
 
     # Elternknoten deren beide Kinder jeweils Modusgröße 1 haben
-    single_node_par = [dtree.get_parent(ind) for ind in list(single_nodes)]
+    single_node_par = [parent[ind] for ind in list(single_nodes)]
     par_two_single_nodes = [ind for ind in single_node_par if single_node_par.count(ind) == 2]
     par_two_single_nodes = np.array(list(set(par_two_single_nodes))).astype(int)  # Entferne Duplikate
     sibling_singletons = children[par_two_single_nodes]
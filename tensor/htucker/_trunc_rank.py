@@ -1,4 +1,5 @@
 import numpy as np
+from tensor.utils.validation import check_cheap
 
 
 def trunc_rank(s, max_rank, abs_err=None, rel_err=None):
@@ -9,27 +10,36 @@ def trunc_rank(s, max_rank, abs_err=None, rel_err=None):
     """
 
     # Check arguments
-    if not isinstance(s, np.ndarray):
-        raise TypeError("'s' muss ein positiver 1D-np.ndarray mit mindestens einem Eintrag sein.")
-    if len(s.shape) != 1:
-        raise ValueError("'s' muss ein positiver 1D-np.ndarray mit mindestens einem Eintrag sein.")
-    if not all(s.shape[i] > 0 for i in range(len(s.shape))):
-        raise ValueError("'s' muss ein positiver 1D-np.ndarray mit mindestens einem Eintrag sein.")
-    if not np.issubdtype(type(max_rank), np.integer):
-        raise TypeError("'max_rank' muss ein int mit 'max_rank'>= 1 sein.")
-    if not max_rank >= 1:
-        raise ValueError("'max_rank' muss ein int mit 'max_rank'>= 1 sein.")
-    if abs_err is not None:
-        if not np.issubdtype(type(abs_err),np.float):
-            raise TypeError("'abs_err' muss ein positiver float sein.")
-        if not abs_err > 0:
-            raise ValueError("'abs_err' muss ein positiver float sein.")
-    if rel_err is not None:
-        if not np.issubdtype(type(rel_err),np.float):
-            raise TypeError("'rel_err' muss ein positiver float sein.")
-        if not rel_err > 0:
-            raise ValueError("'rel_err' muss ein positiver float sein.")
+    # Sämtliche Prüfungen haben konstanten Aufwand
+    if check_cheap():
+        if not isinstance(s, np.ndarray):
+            raise TypeError("'s' muss ein positiver 1D-np.ndarray mit mindestens einem Eintrag sein.")
+        if len(s.shape) != 1:
+            raise ValueError("'s' muss ein positiver 1D-np.ndarray mit mindestens einem Eintrag sein.")
+        if not all(s.shape[i] > 0 for i in range(len(s.shape))):
+            raise ValueError("'s' muss ein positiver 1D-np.ndarray mit mindestens einem Eintrag sein.")
+        if not np.issubdtype(type(max_rank), np.integer):
+            raise TypeError("'max_rank' muss ein int mit 'max_rank'>= 1 sein.")
+        if not max_rank >= 1:
+            raise ValueError("'max_rank' muss ein int mit 'max_rank'>= 1 sein.")
+        if abs_err is not None:
+            if not np.issubdtype(type(abs_err),np.float):
+                raise TypeError("'abs_err' muss ein positiver float sein.")
+            if not abs_err > 0:
+                raise ValueError("'abs_err' muss ein positiver float sein.")
+        if rel_err is not None:
+            if not np.issubdtype(type(rel_err),np.float):
+                raise TypeError("'rel_err' muss ein positiver float sein.")
+            if not rel_err > 0:
+                raise ValueError("'rel_err' muss ein positiver float sein.")
 
+    return trunc_rank_unchecked(s, max_rank, abs_err, rel_err)
+
+
+def trunc_rank_unchecked(s, max_rank, abs_err=None, rel_err=None):
+    """
+    Wie 'trunc_rank', jedoch ohne Prüfung der Argumente. Für bibliotheksinterne Aufrufe.
+    """
     max_rank = min(max_rank, len(s))
 
     # Werden die ersten k Singulärvektoren mitgenommen, ist der Fehler in Frobeniusnurm durch s_sum[k] gegeben
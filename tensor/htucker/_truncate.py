@@ -1,23 +1,69 @@
 import numpy as np
-from tensor.transformation.matricise import matricise
-from tensor.arithmetics.multilinear_mul import multi_mul
+from tensor.transformation.matricise import matricise_unchecked as matricise
+from tensor.arithmetics.multilinear_mul import multi_mul_unchecked as multi_mul
+from tensor.arithmetics.mode_multiplication import mode_multiplication_unchecked as mode_mul
+from tensor.arithmetics.left_svd import left_svd_unchecked as left_svd, select_left_svd, GRAMIAN_MIN_REL_TOL
+from tensor.arithmetics.left_svd_randomized import left_svd_randomized_unchecked as left_svd_randomized, \
+    check_randomized
 from tensor.utils.dimtree import dimtree
+from tensor.utils.parallel import map_nodes, check_executor
+from tensor.utils.precision import to_storage
+from ._trunc_rank import trunc_rank_unchecked as trunc_rank
 
-def truncate(cls, A, max_rank, abs_err=None, rel_err=None, dtree=None):
+def truncate(cls, A, max_rank, abs_err=None, rel_err=None, dtree=None, executor=None, sequential=False,
+             randomized=False, oversampling=10, power_iterations=1, sketch="gaussian", seed=None):
     """
     Berechnet das hierarchische Tuckerformat für den vollen Tensor 'A' unter Einhaltung des in 'max_rank' festgelegten
     maximalen hierarchischen Ranges und den in 'abs_err' und 'rel_err' definierten Fehlerschranken. Im Zweifel dominiert
     'max_rank' jedoch die Fehlerschranken.
     Zurückgegeben werden der resultierende hierarchische Tuckertensor, die knotenweisen Fehler und die knotenweisen
     Singulärwerte.
-    @param A: N-D np.ndarray with N >= 1
+    Ist 'executor' übergeben oder global gesetzt (siehe tensor.utils.parallel), werden die Singulärwertzerlegungen
+    der Knoten eines Levels parallel berechnet.
+    Mit 'sequential' wird sequentiell gekürzt: Nach jeder Blattmatrix wird 'A' sofort mit dieser projiziert, sodass
+    alle weiteren Zerlegungen bereits auf dem verkleinerten Tensor arbeiten. Die Blätter werden dazu absteigend nach
+    der Größe ihres Modus durchlaufen, die inneren Knoten eines Levels nacheinander. Für jeden Knoten wird außerdem
+    gemäß eines Kostenmodells (siehe tensor.arithmetics.left_svd) zwischen direkter Singulärwertzerlegung,
+    QR-Zerlegung und Gram'scher Matrix gewählt. Letztere nur, falls die Fehlerschranken dies zulassen. Die
+    Fehlerschranken gelten weiterhin, die Knoten werden dabei jedoch nicht parallel berechnet.
+    Mit 'randomized' wird der führende Unterraum jedes Knotens, dessen Matrizierung deutlich größer als
+    'max_rank' + 'oversampling' ist, randomisiert bestimmt (siehe tensor.arithmetics.left_svd_randomized). Für kleine
+    'max_rank' sinkt der Aufwand dadurch von O(n m min(n, m)) auf O(n m max_rank). Der nicht erfasste Anteil geht
+    exakt in die knotenweisen Fehler ein. Mit 'seed' sind die Ergebnisse reproduzierbar, auch bei paralleler
+    Berechnung.
+    Liegt 'A' bereits im hierarchischen Tuckerformat vor (z.B. über HTucker.from_cp oder HTucker.from_kronecker
+    erzeugt), wird an HTucker.truncate_htucker weitergereicht. So kann die dichte Zerlegung ganz entfallen.
+    'sequential', 'randomized', 'oversampling', 'power_iterations', 'sketch' und 'seed' betreffen nur die dichte
+    Zerlegung und haben in diesem Fall keine Wirkung.
+    Blattmatrizen und Transfertensoren des Ergebnisses liegen im Speicherdatentyp vor (siehe tensor.utils.precision).
+    @param A: N-D np.ndarray with N >= 1 oder htucker.HTucker
     @param dtree: tensor.utils.dimtree.dimtree
     @param max_rank: positive integer
     @param abs_err: positive float
     @param rel_err: positive float
+    @param executor: concurrent.futures.Executor oder None
+    @param sequential: bool
+    @param randomized: bool
+    @param oversampling: nicht-negativer int
+    @param power_iterations: nicht-negativer int
+    @param sketch: "gaussian" oder "srft"
+    @param seed: int oder None
     @return: tensor.htucker.htucker, dict, dict
     """
 
+    # Die Parameter der dichten Zerlegung werden auch für hierarchische Tuckertensoren 'A' geprüft
+    if not isinstance(sequential, bool):
+        raise TypeError("'sequential' muss vom Typ bool sein.")
+    if not isinstance(randomized, bool):
+        raise TypeError("'randomized' muss vom Typ bool sein.")
+    if randomized:
+        check_randomized(max_rank, oversampling, power_iterations, sketch)
+
+    if isinstance(A, cls):
+        if dtree is not None:
+            raise ValueError("Für hierarchische Tuckertensoren 'A' kann kein 'dtree' übergeben werden.")
+        return cls.truncate_htucker(A, max_rank, abs_err=abs_err, rel_err=rel_err, executor=executor)
+
     # Check arguments
     if not isinstance(A, np.ndarray):
         raise TypeError("'A' muss ein ND-np.ndarray mit N >= 1 sein.")
@@ -39,6 +85,7 @@ def truncate(cls, A, max_rank, abs_err=None, rel_err=None, dtree=None):
             raise ValueError("'rel_err' muss ein nicht-negativer float sein.")
     if dtree is not None:
         raise ValueError("Falls übergeben muss 'dtree' vom Typ tensor.utils.dimtree.dimtree sein.")
+    check_executor(executor)
 
     # Initialisiere Dimensionsbaum
     if dtree is None:
@@ -65,45 +112,103 @@ def truncate(cls, A, max_rank, abs_err=None, rel_err=None, dtree=None):
     error = {}               # Knotenweise eingehaltene Fehlerschranken
     sv = {}                  # Knotenweise Singulärwerte der entsprechenden Matrizierungen
 
-    for leaf in dtree.get_leaves():
+    # Jeder Knoten erhält einen eigenen, aus 'seed' abgeleiteten Zufallszahlengenerator
+    seed_sequence = np.random.SeedSequence(seed)
+
+    def left_svd_node(t, M, method):
+        # Randomisiert, sofern der gesuchte Unterraum kleiner als die Matrizierung ist
+        if randomized and max_rank + oversampling < min(M.shape):
+            rng = np.random.default_rng(np.random.SeedSequence(seed_sequence.entropy, spawn_key=(t,)))
+            return left_svd_randomized(M, max_rank, oversampling, power_iterations, sketch, rng)
+        return left_svd(M, method, max_rank)
+
+    def svd_leaf(leaf):
         # Blattmatrizen
         dim = dtree.get_dim(leaf)
         A_leaf = matricise(A, list(dim))
         # Singulärwertzerlegung
-        U_leaves[leaf], sv[leaf], _ = np.linalg.svd(A_leaf, full_matrices=False)
+        return left_svd_node(leaf, A_leaf, "svd")
+
+    if sequential:
+        # Das Verfahren "gramian" löst nur relative Fehler ab etwa sqrt(eps) auf. Ohne Fehlerschranke wird es daher
+        # nicht verwendet
+        norm_A = np.linalg.norm(A)
+        node_tol = [tol for tol in (rel_err, None if abs_err is None or norm_A == 0 else abs_err / norm_A)
+                    if tol is not None]
+        allow_gramian = len(node_tol) > 0 and max(node_tol) >= GRAMIAN_MIN_REL_TOL
+        C = A
+
+        def svd_leaf(leaf):
+            # Blattmatrizen aus dem bereits in den übrigen Modi gekürzten Tensor C
+            A_leaf = matricise(C, list(dtree.get_dim(leaf)))
+            method = select_left_svd(A_leaf.shape[0], A_leaf.shape[1], allow_gramian)
+            return left_svd_node(leaf, A_leaf, method)
+
+    # Die Singulärwertzerlegungen der Blätter sind unabhängig voneinander
+    # Sequentiell werden sie dagegen nacheinander, beginnend mit dem größten Modus, berechnet
+    leaves = dtree.get_leaves()
+    if sequential:
+        leaves = sorted(leaves, key=lambda t: A.shape[dtree.get_dim(t)[0]], reverse=True)
+        svds = (svd_leaf(leaf) for leaf in leaves)
+    else:
+        svds = map_nodes(svd_leaf, leaves, executor)
+    for leaf, (u, s) in zip(leaves, svds):
+        U_leaves[leaf], sv[leaf] = u, s
         # Bestimme notwendigen Rang, um die Fehlertoleranzen einzuhalten
-        rank[leaf], error[leaf], sat = cls.trunc_rank(sv[leaf], max_rank=max_rank, abs_err=abs_err, rel_err=rel_err)
+        rank[leaf], error[leaf], sat = trunc_rank(sv[leaf], max_rank=max_rank, abs_err=abs_err, rel_err=rel_err)
         # Behalte nur die ersten k Spalten mit
         U_leaves[leaf] = U_leaves[leaf][:, :rank[leaf]]
         # Aktualisieren des Knoten zu Dimension Mappings
         dims = dtree.get_dim(leaf)
         node_to_dim[leaf] = dims[0]
+        if sequential:
+            # Kürze C sofort im Modus des Blattes
+            C = mode_mul(U_leaves[leaf].T, C, dims[0])
+
+    if not sequential:
+        # Kürze 'A' auf den Kerntensor C
+        # Alle weiteren Berechnungen basieren auf C
+        U = [U_leaves[k].T for k in sorted(list(U_leaves.keys()), key=lambda x: dtree.get_dim(x)[0])]
+        modes = list(range(len(A.shape)))
+        C = multi_mul(x=A, U=U, modes=modes)
+
+    def svd_inner_node(t):
+        # Matriziere C mit den Modi aus t als Zeilen
+        # Die Modi, die t repräsentiert, sind wiederum durch ts Kinder gegeben
+        left = node_to_dim[dtree.get_left(t)]
+        right = node_to_dim[dtree.get_right(t)]
+        C_matricised = matricise(C, [left, right])
+        # Singulärwertzerlegung
+        return left_svd_node(t, C_matricised, "svd")
 
-    # Kürze 'A' auf den Kerntensor C
-    # Alle weiteren Berechnungen basieren auf C
-    U = [U_leaves[k].T for k in sorted(list(U_leaves.keys()), key=lambda x: dtree.get_dim(x)[0])]
-    modes = list(range(len(A.shape)))
-    C = multi_mul(x=A, U=U, modes=modes)
+    def svd_inner_node_sequential(t, Cl, node_to_dim_new):
+        # Wie 'svd_inner_node', jedoch auf dem bereits durch die vorherigen Knoten des Levels gekürzten Tensor Cl
+        left = node_to_dim_new[dtree.get_left(t)]
+        right = node_to_dim_new[dtree.get_right(t)]
+        C_matricised = matricise(Cl, [left, right])
+        method = select_left_svd(C_matricised.shape[0], C_matricised.shape[1], allow_gramian)
+        return left_svd_node(t, C_matricised, method)
 
     # Traversiere den Dimensionsbaum von unten nach oben
     for level in range(p - 1, 0, -1):
 
         Cl = np.array(C)
         node_to_dim_new = dict(node_to_dim)
-        for t in dtree.get_nodes_of_level(level):
-            # Berechne den Transfertensor des Knotens t
-            if dtree.is_leaf(t):
-                # t ist ein Blatt und die Blattmatrizen wurden bereits berechnet
-                continue
-            # Matriziere C mit den Modi aus t als Zeilen
-            # Die Modi, die t repräsentiert, sind wiederum durch ts Kinder gegeben
-            left = node_to_dim[dtree.get_left(t)]
-            right = node_to_dim[dtree.get_right(t)]
-            C_matricised = matricise(C, [left, right])
-            # Singulärwertzerlegung
-            u_t, sv[t], _ = np.linalg.svd(C_matricised, full_matrices=False)
+        # Berechne die Transfertensoren der Knoten t des Levels
+        # Blätter wurden bereits berechnet und werden übersprungen
+        nodes = [t for t in dtree.get_nodes_of_level(level) if not dtree.is_leaf(t)]
+        # Die Singulärwertzerlegungen eines Levels basieren alle auf C und sind unabhängig voneinander
+        # Sequentiell basiert jede Zerlegung dagegen auf dem bereits gekürzten Cl
+        if not sequential:
+            svds = map_nodes(svd_inner_node, nodes, executor)
+        for ii, t in enumerate(nodes):
+            if sequential:
+                u_t, s_t = svd_inner_node_sequential(t, Cl, node_to_dim_new)
+            else:
+                u_t, s_t = svds[ii]
+            sv[t] = s_t
             # Berechne notwendigen Rang k, um die Fehlertoleranzen einzuhalten
-            rank[t], error[t], sat = cls.trunc_rank(sv[t], max_rank=max_rank, abs_err=abs_err, rel_err=rel_err)
+            rank[t], error[t], sat = trunc_rank(sv[t], max_rank=max_rank, abs_err=abs_err, rel_err=rel_err)
             # Behalte die ersten k Spalten
             u_t = u_t[:, :rank[t]]
             # Der auf 3D umgeformte Tensor basierend auf u_t entspricht nun dem Transfertensor
@@ -140,5 +245,7 @@ def truncate(cls, A, max_rank, abs_err=None, rel_err=None, dtree=None):
     B[0] = C_root.reshape((k_l, k_r, 1), order="F")
 
     # Erzeuge darauf aufbauend den resultierenden hierarchischen Tuckertensor
-    Ah = cls(U=U_leaves, B=B, dtree=dtree, is_orthog=is_orthog)
+    U_leaves = {t: to_storage(u) for t, u in U_leaves.items()}
+    B = {t: to_storage(b) for t, b in B.items()}
+    Ah = cls.unchecked(U=U_leaves, B=B, dtree=dtree, is_orthog=is_orthog)
     return Ah, error, sv
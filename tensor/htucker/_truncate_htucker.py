@@ -1,11 +1,17 @@
-from tensor.arithmetics.left_svd_gramian import left_svd_gramian
+from tensor.arithmetics.left_svd_gramian import left_svd_gramian_batched
+from tensor.utils.parallel import map_nodes, check_executor
+from tensor.utils.precision import to_storage
 import numpy as np
+from ._trunc_rank import trunc_rank_unchecked as trunc_rank
 
-def truncate_htucker(cls,x, max_rank, abs_err=None, rel_err=None):
+def truncate_htucker(cls,x, max_rank, abs_err=None, rel_err=None, executor=None):
     """
     Kürzt einen gegebenen hierarchischen Tuckertensor 'x' auf einen gegebenen kleinerer hierarchischen
     Rang entsprechend 'max_rank', 'abs_err' und 'rel_err'.
     Hierbei dominiert 'max_rank' die beiden Fehlertoleranzen.
+    Ist 'executor' übergeben oder global gesetzt (siehe tensor.utils.parallel), werden unabhängige Knoten parallel
+    bearbeitet.
+    Blattmatrizen und Transfertensoren des Ergebnisses liegen im Speicherdatentyp vor (siehe tensor.utils.precision).
     """
     # Argument Checks
     if not isinstance(x, cls):
@@ -24,12 +30,13 @@ def truncate_htucker(cls,x, max_rank, abs_err=None, rel_err=None):
             raise TypeError("'rel_err' muss ein positiver float sein.")
         if not rel_err > 0:
             raise ValueError("'rel_err' muss ein positiver float sein.")
+    check_executor(executor)
 
     # Orthogonalisiere x
-    x = cls.orthogonalize(x)
+    x = cls.orthogonalize(x, executor=executor)
 
     # Berechne reduzierte Gram'sche Matrizen
-    G = cls.gramians_orthog(x)
+    G = cls.gramians_orthog(x, executor=executor)
 
     # Knotenweise Fehler und Singulärwerte
     err = {}
@@ -45,12 +52,14 @@ def truncate_htucker(cls,x, max_rank, abs_err=None, rel_err=None):
     rank = {}
 
     # Berechne die linken Singulärvektoren der reduzierten Gram'schen Matrizen
+    # Die Eigenwertzerlegungen aller Knoten sind unabhängig voneinander, gleich große werden gestapelt berechnet
     U = {}
-    for ii in range(1, x.dtree.get_nr_nodes()):
-        u, sv[ii] = left_svd_gramian(G[ii])
-        sv[ii] = sv[ii].reshape((-1))
+    nodes = list(range(1, x.dtree.get_nr_nodes()))
+    decompositions = left_svd_gramian_batched([G[t] for t in nodes], k=max_rank, executor=executor)
+    for ii, (u, s) in zip(nodes, decompositions):
+        sv[ii] = s.reshape((-1))
         # Berechne Rang in Abhängigkeit von max_rank und abs_err sowie rel_err
-        k, err[ii], sat = cls.trunc_rank(sv[ii], max_rank, abs_err=abs_err, rel_err=rel_err)
+        k, err[ii], sat = trunc_rank(sv[ii], max_rank, abs_err=abs_err, rel_err=rel_err)
         rank[ii] = k
         # Behalte nur die k dominaten Singulärvektoren
         U[ii] = u[:, :k]
@@ -58,13 +67,12 @@ def truncate_htucker(cls,x, max_rank, abs_err=None, rel_err=None):
     # Berechne die gekürzten Blattmatrizen
     U_new = {}
     for ii in x.dtree.get_leaves():
-        U_new[ii] = x.U[ii] @ U[ii]
+        U_new[ii] = to_storage(x.U[ii] @ U[ii])
 
     U[0] = np.ones((1, 1))
     rank[0] = 1
-    # Berechne die gekürzten Transfertensoren
-    B_new = {}
-    for ii in x.dtree.get_inner_nodes():
+
+    def truncate_transfer_tensor(ii):
         ii_left = x.dtree.get_left(ii)
         ii_right = x.dtree.get_right(ii)
         U_l = U[ii_left]
@@ -73,11 +81,17 @@ def truncate_htucker(cls,x, max_rank, abs_err=None, rel_err=None):
         product = np.tensordot(x.B[ii], U[ii], axes=[2, 0])
         product = np.tensordot(U_r.T, product, axes=[1, 1])
         product = np.tensordot(U_l.T, product, axes=[1, 1])
+        return to_storage(product)
+
+    # Berechne die gekürzten Transfertensoren
+    B_new = {}
+    inner_nodes = x.dtree.get_inner_nodes()
+    for ii, product in zip(inner_nodes, map_nodes(truncate_transfer_tensor, inner_nodes, executor)):
         B_new[ii] = product
 
     # Erzeuge den resultierenden gekürzten HTucker Tensor
     dtree = x.dtree.copy()
-    new_htucker = cls(U=U_new, B=B_new, dtree=dtree, is_orthog=False)
+    new_htucker = cls.unchecked(U=U_new, B=B_new, dtree=dtree, is_orthog=False)
 
     return new_htucker, err, sv
 
@@ -0,0 +1,145 @@
+import string
+import numpy as np
+from tensor.transformation.matricise import matricise_unchecked as matricise
+from tensor.arithmetics.mode_multiplication import mode_multiplication_unchecked as mode_mul
+from tensor.arithmetics.left_svd_gramian import left_svd_gramian_unchecked as left_svd_gramian
+from tensor.utils.dimtree import dimtree
+from tensor.utils.precision import to_accumulation, to_storage
+from ._trunc_rank import trunc_rank_unchecked as trunc_rank
+from ._rebuild import chunk_keys
+
+
+def truncate_out_of_core(cls, A, max_rank, abs_err=None, rel_err=None, chunk_modes=None, chunk_size=1, shape=None):
+    """
+    Berechnet wie HTucker.truncate das hierarchische Tuckerformat des vollen Tensors 'A', ohne 'A' vollständig in den
+    Speicher zu laden. 'A' wird dazu in Blöcken gelesen, die die Modi aus 'chunk_modes' in je 'chunk_size' Indizes
+    zerlegen und alle übrigen Modi vollständig enthalten (siehe HTucker.full).
+    Im ersten Durchlauf über 'A' werden die Gram'schen Matrizen der Blätter aller übrigen Modi blockweise
+    akkumuliert und daraus deren Blattmatrizen bestimmt. Im zweiten Durchlauf wird jeder Block auf diese
+    Blattmatrizen projiziert. Der so entstehende Tensor enthält die Modi aus 'chunk_modes' in voller Größe und alle
+    übrigen Modi nur noch im jeweiligen Rang. Er wird abschließend im Speicher mit HTucker.truncate (sequentiell)
+    gekürzt. Der Speicherbedarf ist damit durch die Blockgröße und die Größe dieses Tensors beschränkt.
+    Die Fehlerschranken werden auf beide Schritte aufgeteilt und gelten für das Gesamtergebnis. Da die Gram'schen
+    Matrizen die Kondition quadrieren, werden Fehler unterhalb von etwa sqrt(eps) * ||A|| nicht aufgelöst.
+    'A' kann ein np.ndarray (insbesondere ein np.memmap) oder eine Funktion sein, die bei jedem Aufruf einen
+    Iterator über Paare (key, block) liefert. 'key' ist dabei ein tuple aus slices, der die Lage von 'block' im
+    vollen Tensor angibt. Im zweiten Fall müssen 'shape' und 'chunk_modes' übergeben werden, 'chunk_size' wird
+    ignoriert. Im ersten Fall wird ohne 'chunk_modes' der größte Modus von 'A' zerlegt.
+    @param A: np.ndarray oder callable
+    @param max_rank: positiver int
+    @param abs_err: positiver float oder None
+    @param rel_err: positiver float oder None
+    @param chunk_modes: list, tuple oder np.ndarray aus nicht-negativen ints oder None
+    @param chunk_size: positiver int
+    @param shape: tuple aus positiven ints oder None
+    @return: tensor.htucker.htucker, dict, dict
+    """
+    # Argument checks
+    if isinstance(A, np.ndarray):
+        shape = A.shape
+        if chunk_modes is None:
+            # Standardmäßig wird der größte Modus zerlegt, sodass nie der gesamte Tensor als Block gelesen wird
+            chunk_modes = [int(np.argmax(shape))]
+    elif callable(A):
+        if not isinstance(shape, tuple):
+            raise TypeError("Ist 'A' eine Funktion, muss 'shape' ein tuple aus positiven ints sein.")
+        if not all(np.issubdtype(type(n), np.integer) and n >= 1 for n in shape):
+            raise ValueError("Ist 'A' eine Funktion, muss 'shape' ein tuple aus positiven ints sein.")
+        if chunk_modes is None:
+            raise ValueError("Ist 'A' eine Funktion, muss 'chunk_modes' übergeben werden.")
+    else:
+        raise TypeError("'A' muss ein np.ndarray oder eine Funktion sein.")
+    if not len(shape) >= 2:
+        raise ValueError("'A' muss mindestens zwei Modi haben.")
+    if not np.issubdtype(type(max_rank), np.integer):
+        raise TypeError("'max_rank' muss ein positiver int sein.")
+    if not max_rank >= 1:
+        raise ValueError("'max_rank' muss ein positiver int sein.")
+    if abs_err is not None:
+        if not np.issubdtype(type(abs_err), np.floating):
+            raise TypeError("'abs_err' muss ein positiver float sein.")
+        if not abs_err > 0:
+            raise ValueError("'abs_err' muss ein positiver float sein.")
+    if rel_err is not None:
+        if not np.issubdtype(type(rel_err), np.floating):
+            raise TypeError("'rel_err' muss ein positiver float sein.")
+        if not rel_err > 0:
+            raise ValueError("'rel_err' muss ein positiver float sein.")
+    if not isinstance(chunk_modes, list) and not isinstance(chunk_modes, tuple) \
+            and not isinstance(chunk_modes, np.ndarray):
+        raise TypeError("'chunk_modes' muss None oder vom Typ list, tuple oder numpy.ndarray sein.")
+    if not all(np.issubdtype(type(m), np.integer) for m in chunk_modes) \
+            or not all(0 <= m < len(shape) for m in chunk_modes) or len(set(chunk_modes)) < len(chunk_modes):
+        raise ValueError("'chunk_modes' muss paarweise verschiedene Modi von 'A' enthalten.")
+    if not len(chunk_modes) < len(shape):
+        raise ValueError("Mindestens ein Modus von 'A' darf nicht in 'chunk_modes' enthalten sein.")
+    if not np.issubdtype(type(chunk_size), np.integer):
+        raise TypeError("'chunk_size' muss ein positiver int sein.")
+    if not chunk_size >= 1:
+        raise ValueError("'chunk_size' muss ein positiver int sein.")
+
+    if callable(A):
+        blocks = A
+    else:
+        def blocks():
+            return ((key, A[key]) for key in chunk_keys(shape, chunk_modes, chunk_size))
+
+    d = len(shape)
+    dtree = dimtree.get_canonic_dimtree(d)
+    dim2ind = dtree.get_dim2ind()
+    chunk_modes = [int(m) for m in chunk_modes]
+    kept = [m for m in range(d) if m not in chunk_modes]
+
+    # Erster Durchlauf: Gram'sche Matrizen der Blätter der übrigen Modi sowie ||A||
+    G = {m: np.zeros((shape[m], shape[m])) for m in kept}
+    norm_sq = 0.
+    for _, block in blocks():
+        block = to_accumulation(np.asarray(block))
+        # ||block||^2 ohne temporäre Kopie des Blocks
+        indices = string.ascii_letters[:block.ndim]
+        norm_sq += np.einsum(indices + "," + indices + "->", block, block)
+        for m in kept:
+            block_mat = matricise(block, [m])
+            G[m] += block_mat @ block_mat.T
+
+    # Gesamttoleranz. Wie in HTucker.truncate erhält jeder der 2d - 2 Knoten den gleichen Anteil
+    tolerances = [tol for tol in (abs_err, None if rel_err is None else rel_err * np.sqrt(norm_sq)) if tol is not None]
+    tol = min(tolerances) if len(tolerances) > 0 and min(tolerances) > 0 else None
+    nr_nodes = 2 * d - 2
+    node_tol = None if tol is None else tol / np.sqrt(nr_nodes)
+
+    U_kept = {}
+    error = {}
+    sv = {}
+    for m in kept:
+        u, s = left_svd_gramian(G[m], max_rank)
+        leaf = dim2ind[m]
+        rank, error[leaf], _ = trunc_rank(s, max_rank=max_rank, abs_err=node_tol)
+        U_kept[m] = u[:, :rank]
+        sv[leaf] = s
+    del G
+
+    # Zweiter Durchlauf: Projektion der Blöcke auf die Blattmatrizen der übrigen Modi
+    core_shape = tuple(U_kept[m].shape[1] if m in U_kept else shape[m] for m in range(d))
+    C = np.zeros(core_shape)
+    for key, block in blocks():
+        block = to_accumulation(np.asarray(block))
+        for m in kept:
+            block = mode_mul(U_kept[m].T, block, m)
+        C[tuple(slice(None) if m in U_kept else key[m] for m in range(d))] = block
+
+    # Kürzung des projizierten Tensors mit dem verbleibenden Anteil der Fehlertoleranz
+    rest_tol = None
+    if tol is not None and nr_nodes > len(kept):
+        rest_tol = tol * np.sqrt((nr_nodes - len(kept)) / nr_nodes)
+    y, error_core, sv_core = cls.truncate(C, max_rank, abs_err=rest_tol, sequential=True)
+
+    # Die Blattmatrizen der übrigen Modi ergeben sich als Produkte beider Schritte
+    U = dict(y.U)
+    for m in kept:
+        U[dim2ind[m]] = to_storage(U_kept[m] @ y.U[dim2ind[m]])
+    for t in error_core:
+        error[t] = np.sqrt(error.get(t, 0) ** 2 + error_core[t] ** 2)
+        sv.setdefault(t, sv_core[t])
+    x = cls.unchecked(U=U, B=y.B, dtree=y.dtree, is_orthog=True)
+    return x, error, sv
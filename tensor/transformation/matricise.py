@@ -1,4 +1,5 @@
 import numpy as np
+from tensor.utils.validation import check_cheap, check_full
 
 
 def matricise(X, t, copy=False):
@@ -14,27 +15,40 @@ def matricise(X, t, copy=False):
     """
 
     # Prüfen der Argumente
-    if not isinstance(X, np.ndarray):
-        raise ValueError("'X' muss ein N-D np.ndarray mit N>=2 sein.")
-    if not len(X.shape) >= 2:
-        raise ValueError("'X' muss ein N-D np.ndarray mit N>=2 sein.")
-    if not isinstance(t, list):
-        raise ValueError("'t' muss eine Liste nicht-negativer ints ohne Duplikate sein.")
-    if not all(np.issubdtype(type(item), np.integer) for item in t):
-        raise ValueError("'t' muss eine Liste nicht-negativer ints ohne Duplikate sein.")
-    if not all(item >= 0 for item in t):
-        raise ValueError("'t' muss eine Liste nicht-negativer ints ohne Duplikate sein.")
-    if not len(t) == len(set(t)):
-        raise ValueError("'t' muss eine Liste nicht-negativer ints ohne Duplikate sein.")
-    if not all(item < len(X.shape) for item in t):
-        raise ValueError("'t' und 'X' sind nicht kompatibel.")
-    if not isinstance(copy, bool):
-        raise ValueError("'copy' muss vom Typ bool sein.")
+    if check_cheap():
+        if not isinstance(X, np.ndarray):
+            raise ValueError("'X' muss ein N-D np.ndarray mit N>=2 sein.")
+        if not len(X.shape) >= 2:
+            raise ValueError("'X' muss ein N-D np.ndarray mit N>=2 sein.")
+        if not isinstance(t, list):
+            raise ValueError("'t' muss eine Liste nicht-negativer ints ohne Duplikate sein.")
+        if not isinstance(copy, bool):
+            raise ValueError("'copy' muss vom Typ bool sein.")
+    if check_full():
+        if not all(np.issubdtype(type(item), np.integer) for item in t):
+            raise ValueError("'t' muss eine Liste nicht-negativer ints ohne Duplikate sein.")
+        if not all(item >= 0 for item in t):
+            raise ValueError("'t' muss eine Liste nicht-negativer ints ohne Duplikate sein.")
+        if not len(t) == len(set(t)):
+            raise ValueError("'t' muss eine Liste nicht-negativer ints ohne Duplikate sein.")
+        if not all(item < len(X.shape) for item in t):
+            raise ValueError("'t' und 'X' sind nicht kompatibel.")
 
     # Kopiere ggf. 'X'
     if copy:
         X = np.copy(X)
 
+    return matricise_unchecked(X, t)
+
+
+def matricise_unchecked(X, t):
+    """
+    Berechnet die t-Matrizierung des Tensors 'X' ohne Prüfung der Argumente. Für bibliotheksinterne Aufrufe mit
+    bereits konsistenten Operanden.
+    @param X: N-D np.ndarray mit N>=2
+    @param t: Liste nicht-negativer ints
+    @return: np.ndarray
+    """
     # Ordne die Modi von 'X' so, dass die Modi aus 't' fuehrend sind
     destination = list(range(len(t)))
     X_mat = np.moveaxis(X, t, destination)
@@ -45,4 +59,4 @@ def matricise(X, t, copy=False):
     # Matriziere gemaess t
     X_mat = X_mat.reshape((rowcount, -1), order='F')
 
-    return X_mat
\ No newline at end of file
+    return X_mat
@@ -1,32 +1,101 @@
 import numpy as np
-from copy import deepcopy
+
+
+# Bereits erzeugte kanonische Dimensionsbäume, indiziert über die Anzahl der Dimensionen
+_canonic_dimtrees = {}
 
 
 class dimtree:
     """
     Implementiert den Dimensionsbaum zu einer gegebenen Modusstruktur.
+    Ein Dimensionsbaum ist unveränderlich: 'children' und 'dim2ind' werden bei der Konstruktion kopiert und
+    schreibgeschützt abgelegt. Alle abgeleiteten Größen (Level, Blätter, innere Knoten, Dimensionen je Knoten, Eltern,
+    Geschwister, Tiefe) werden einmalig vorberechnet. Daher teilen sich hierarchische Tuckertensoren ihre
+    Dimensionsbäume und 'copy' gibt den Dimensionsbaum selbst zurück.
+    Wer die Struktur verändern möchte, muss die von den Gettern gelieferten Arrays zuvor mit np.array(...) kopieren.
     """
 
     def __init__(self, children, dim2ind):
-        self.children = children
+        self.children = freeze(np.array(children, dtype=int).reshape((-1, 2)))
         self.nr_nodes = len(self.children)
-        self.dim2ind = dim2ind
-        self.nr_dims = len(dim2ind)
-        self.leaves = np.sort(np.array(dim2ind))
+        self.dim2ind = freeze(np.array(dim2ind, dtype=int).reshape(-1))
+        self.nr_dims = len(self.dim2ind)
+        self.leaves = freeze(np.sort(self.dim2ind))
         self.parent = np.array([-1] * self.nr_nodes)
         for idx, ch in enumerate(self.children):
             if ch[0] == -1:
                 continue
             self.parent[ch[0]] = idx
             self.parent[ch[1]] = idx
-        self.level = self._construct_level()
+        freeze(self.parent)
+        self.leaf_mask = freeze(np.all(self.children == -1, axis=1))
+        self.level = freeze(self._construct_level())
+        self._precompute()
+
+    def _precompute(self):
+        """
+        Helferfunktion: Berechnet die Tabellen vor, aus denen die Getter lediglich lesen.
+        """
+        # Alle Knoten sowie die inneren Knoten
+        nodes = [0]
+        for ch in self.children:
+            if ch[0] != -1 or ch[1] != -1:
+                nodes += list(ch)
+        self.nodes = freeze(np.array(sorted(nodes), dtype=int))
+        self.inner_nodes = freeze(np.array([ind for ind in self.nodes if not self.leaf_mask[ind]], dtype=int))
+
+        # Geschwister
+        self.sibling = np.array([-1] * self.nr_nodes)
+        for ch in self.children:
+            if ch[0] == -1:
+                continue
+            self.sibling[ch[0]] = ch[1]
+            self.sibling[ch[1]] = ch[0]
+        freeze(self.sibling)
+
+        # Tiefe und Knoten je Level
+        self.depth = np.max(self.level)
+        self.level_nodes = [freeze(np.array([ind for ind in self.nodes if self.level[ind] == lvl], dtype=int))
+                            for lvl in range(self.depth + 1)]
+
+        # Dimensionen je Knoten: Bottom-up über die vom Wurzelknoten aus erreichbaren Knoten
+        self.dims = {}
+        for ind in self._reachable()[::-1]:
+            if self.leaf_mask[ind]:
+                dim = [np.argmax(self.dim2ind == ind)]
+            else:
+                dim = list(self.dims[self.children[ind][0]]) + list(self.dims[self.children[ind][1]])
+            self.dims[ind] = freeze(np.array(dim, dtype=int))
+        self.dims2node = {}
+        for ind in self.nodes[::-1]:
+            if ind in self.dims:
+                self.dims2node[tuple(self.dims[ind])] = ind
+
+        # Struktureller Hashwert
+        self.key = (self.nr_dims, self.children.tobytes(), self.dim2ind.tobytes())
+        self.hash = hash(self.key)
+
+    def _reachable(self):
+        """
+        Helferfunktion: Gibt die vom Wurzelknoten aus erreichbaren Knoten in Breitensuche-Reihenfolge zurück.
+        """
+        nodes = [0]
+        ii = 0
+        while ii < len(nodes):
+            if not self.leaf_mask[nodes[ii]]:
+                nodes += list(self.children[nodes[ii]])
+            ii += 1
+        return nodes
 
     @staticmethod
     def get_canonic_dimtree(ndims):
         """
         Gibt den auf 'ndims' basierenden kanonischen Dimensionsbaum zurück.
+        Zu jeder Anzahl an Dimensionen wird dabei stets dasselbe Objekt zurückgegeben.
         """
-        d = ndims
+        d = int(ndims)
+        if d in _canonic_dimtrees:
+            return _canonic_dimtrees[d]
         p = np.ceil(np.log2(d))
         nr_nodes = 2 * d - 1
         children = np.array([[i, i + 1] for i in range(1, nr_nodes, 2)] + [[-1, -1]] * d, dtype=int)
@@ -36,7 +105,8 @@ class dimtree:
                 dim2ind[i] = 2 ** p - 1 + i
             else:
                 dim2ind[i] = 2 ** p - 1 - d + i
-        return dimtree(children=children, dim2ind=dim2ind)
+        dt = _canonic_dimtrees.setdefault(d, dimtree(children=children, dim2ind=dim2ind))
+        return dt
 
     def _construct_level(self):
         level = [0] * self.nr_nodes
@@ -44,7 +114,7 @@ class dimtree:
         while len(nodes) > 0:
             node, lvl = nodes.pop()
             level[node] = lvl
-            if not self.is_leaf(node):
+            if not self.leaf_mask[node]:
                 nodes += [(self.children[node][0], lvl + 1), (self.children[node][1], lvl + 1)]
         return np.array(level)
 
@@ -67,9 +137,37 @@ class dimtree:
 
     def copy(self):
         """
-        Gibt eine Kopie des Dimensionsbaums zurück.
+        Gibt eine Kopie des Dimensionsbaums zurück. Da Dimensionsbäume unveränderlich sind, ist dies der
+        Dimensionsbaum selbst.
         """
-        return deepcopy(self)
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        """
+        Pickle Zustand: Die Struktur ist durch 'children' und 'dim2ind' vollständig bestimmt.
+        """
+        return {"children": np.array(self.children), "dim2ind": np.array(self.dim2ind)}
+
+    def __setstate__(self, state):
+        """
+        Stellt den Zustand aus '__getstate__' wieder her und berechnet die Tabellen neu. Mit älteren Versionen
+        gepickelte Dimensionsbäume werden ebenfalls unterstützt.
+        """
+        self.__init__(children=state["children"], dim2ind=state["dim2ind"])
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        if not isinstance(other, dimtree):
+            return NotImplemented
+        return equal(self, other)
 
     def get_dim2ind(self):
         """
@@ -116,21 +214,13 @@ class dimtree:
         """
         assert np.issubdtype(type(ind), np.integer)
         assert ind >= 0
-        if np.all(self.children[ind] == -1):
-            return True
-        else:
-            return False
+        return bool(self.leaf_mask[ind])
 
     def get_nodes(self):
         """
         Gibt die Indizes alles Knoten zurück.
         """
-        nodes = [0]
-        for i in range(len(self.children)):
-            ch = list(self.children[i])
-            if ch != [-1, -1]:
-                nodes += ch
-        return np.array(sorted(nodes))
+        return self.nodes
 
     def is_root(self, ind):
         """
@@ -173,12 +263,7 @@ class dimtree:
         Gibt den Index des durch 'ind' referenzierten Knotens zurück.
         """
         assert np.issubdtype(type(ind), np.integer)
-        p = self.get_parent(ind)
-        pc = self.get_children(p)
-        if pc[0] == ind:
-            return pc[1]
-        else:
-            return pc[0]
+        return self.sibling[ind]
 
     def is_left(self, ind):
         """
@@ -209,25 +294,23 @@ class dimtree:
         Gibt zurück, ob der durch 'ind' referenzierte Knoten ein innerer Knoten ist.
         """
         assert np.issubdtype(type(ind), np.integer)
-        if not np.all(self.children[ind] == [-1, -1]):
-            return True
-        else:
-            return False
+        return not self.leaf_mask[ind]
 
     def get_dim(self, ind):
         """
         Gibt die Dimension(en) zurück, die durch den von 'ind' referenzierten Knoten repräsentiert werden.
         """
         assert np.issubdtype(type(ind), np.integer)
+        if ind in self.dims:
+            return self.dims[ind]
+        # Knoten, die nicht vom Wurzelknoten aus erreichbar sind, werden nicht vorberechnet
         if self.is_leaf(ind):
-            array = np.array(self.dim2ind)
-            dim = np.argmax(array == ind)
+            dim = np.argmax(self.dim2ind == ind)
             return np.array([dim])
         else:
             dim_left = list(self.get_dim(self.children[ind][0]))
             dim_right = list(self.get_dim(self.children[ind][1]))
-            dim = dim_left + dim_right
-            return np.array(dim)
+            return np.array(dim_left + dim_right)
 
     def get_ind(self, dim):
         """
@@ -237,11 +320,7 @@ class dimtree:
                 and not isinstance(dim, list):
             return self.dim2ind[dim]
         else:
-            nodes = self.get_nodes()
-            for ind in nodes:
-                d = self.get_dim(ind)
-                if np.all(d == dim):
-                    return ind
+            return self.dims2node.get(tuple(np.array(dim, dtype=int).reshape(-1)))
 
     def get_level(self, ind):
         """
@@ -255,21 +334,15 @@ class dimtree:
         Gibt alle Indizes der Knoten des Level 'lvl' zurück.
         """
         assert np.issubdtype(type(lvl), np.integer)
-        nodes = []
-        for ind in self.get_nodes():
-            if self.get_level(ind) == lvl:
-                nodes += [ind]
-        return np.array(nodes)
+        if 0 <= lvl < len(self.level_nodes):
+            return self.level_nodes[lvl]
+        return np.array([], dtype=int)
 
     def get_inner_nodes(self):
         """
         Gibt die Indizes aller innerer Knoten zurück.
         """
-        nodes = []
-        for ind in self.get_nodes():
-            if not self.is_leaf(ind):
-                nodes += [ind]
-        return np.array(nodes)
+        return self.inner_nodes
 
     def get_leaves(self):
         """
@@ -281,9 +354,7 @@ class dimtree:
         """
         Gibt die Tiefe des Dimensionsbaums zurück.
         """
-        level = np.array(self.level)
-        depth = np.max(level)
-        return depth
+        return self.depth
 
     def get_subtree(self, ind):
         """
@@ -303,13 +374,22 @@ class dimtree:
 def equal(dt1, dt2):
     """
     Berechnet, ob die beiden Dimensionsbäume 'dt1' und 'dt2' übereinstimmen.
+    Im Regelfall teilen sich die hierarchischen Tuckertensoren ihre Dimensionsbäume, sodass bereits der Vergleich der
+    Objektidentität genügt. Andernfalls wird der strukturelle Hashwert verglichen.
     @param dt1: tensor.utils.dimtree.dimtree
     @param dt2: tensor.utils.dimtree.dimtree
     @return: bool
     """
-    if not np.array_equal(dt1.get_children(), dt2.get_children()):
-        return False
-    elif not np.array_equal(dt1.get_dim2ind(), dt2.get_dim2ind()):
-        return False
-    else:
+    if dt1 is dt2:
         return True
+    if dt1.hash != dt2.hash:
+        return False
+    return dt1.key == dt2.key
+
+
+def freeze(array):
+    """
+    Helferfunktion: Setzt 'array' schreibgeschützt und gibt es zurück.
+    """
+    array.setflags(write=False)
+    return array
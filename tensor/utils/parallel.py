@@ -0,0 +1,86 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+
+# Global voreingestellter Executor. None bedeutet serielle Ausführung.
+_executor = None
+
+
+def set_executor(executor):
+    """
+    Setzt den global voreingestellten Executor, mit dem die Knoten eines Levels des Dimensionsbaums parallel
+    bearbeitet werden. Mit None wird wieder seriell gerechnet.
+    @param executor: concurrent.futures.Executor oder None
+    """
+    global _executor
+    check_executor(executor)
+    _executor = executor
+
+
+def get_executor(executor=None):
+    """
+    Gibt 'executor' zurück, falls übergeben, und sonst den global voreingestellten Executor.
+    @param executor: concurrent.futures.Executor oder None
+    @return: concurrent.futures.Executor oder None
+    """
+    check_executor(executor)
+    if executor is not None:
+        return executor
+    return _executor
+
+
+def map_nodes(func, nodes, executor=None):
+    """
+    Wendet 'func' auf alle Knoten aus 'nodes' an und gibt die Ergebnisse in derselben Reihenfolge als Liste zurück.
+    Die Knoten müssen voneinander unabhängig sein, wie es z.B. für alle Knoten eines Levels der Fall ist. Ist weder
+    'executor' übergeben noch global ein Executor gesetzt, wird seriell gerechnet.
+    @param func: Funktion mit einem Knotenindex als Argument
+    @param nodes: Iterable aus Knotenindizes
+    @param executor: concurrent.futures.Executor oder None
+    @return: list
+    """
+    executor = get_executor(executor)
+    nodes = list(nodes)
+    if executor is None or len(nodes) < 2:
+        return [func(t) for t in nodes]
+    return list(executor.map(func, nodes))
+
+
+@contextmanager
+def level_parallel(max_workers=None, blas_threads=None):
+    """
+    Kontextmanager: Innerhalb des Kontexts werden die Knoten eines Levels mit einem ThreadPoolExecutor mit
+    'max_workers' Threads parallel bearbeitet. numpy/LAPACK geben dabei den GIL frei.
+    Mit 'blas_threads' kann die Anzahl der BLAS-Threads begrenzt werden, sodass sich Parallelität auf Knoten- und
+    BLAS-Ebene nicht gegenseitig überbuchen. Dafür wird das optionale Paket threadpoolctl benötigt.
+    @param max_workers: positiver int oder None
+    @param blas_threads: positiver int oder None
+    """
+    if blas_threads is not None:
+        if not isinstance(blas_threads, int) or blas_threads < 1:
+            raise ValueError("'blas_threads' muss ein positiver int sein.")
+        try:
+            from threadpoolctl import threadpool_limits
+        except ImportError:
+            raise ImportError("Zum Begrenzen der BLAS-Threads wird das Paket 'threadpoolctl' benötigt.")
+        limits = threadpool_limits(limits=blas_threads, user_api="blas")
+    else:
+        limits = None
+
+    previous = _executor
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    set_executor(executor)
+    try:
+        yield executor
+    finally:
+        set_executor(previous)
+        executor.shutdown()
+        if limits is not None:
+            limits.restore_original_limits()
+
+
+def check_executor(executor):
+    """
+    Helferfunktion: Prüft, ob 'executor' None oder ein concurrent.futures.Executor ist.
+    """
+    if executor is not None and not isinstance(executor, Executor):
+        raise TypeError("'executor' muss None oder ein concurrent.futures.Executor sein.")
@@ -0,0 +1,78 @@
+import numpy as np
+from contextlib import contextmanager
+
+# Mögliche Datentypen, in denen Blattmatrizen und Transfertensoren gespeichert werden
+STORAGE_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+# Datentyp, in dem Gram'sche Matrizen, R-Faktoren von QR-Zerlegungen und die Eigenwertzerlegungen in
+# 'left_svd_gramian' unabhängig von der Speichergenauigkeit berechnet werden
+ACCUMULATION_DTYPE = np.dtype(np.float64)
+
+# Global voreingestellter Speicherdatentyp
+_storage_dtype = np.dtype(np.float64)
+
+
+def set_storage_dtype(dtype):
+    """
+    Setzt den global voreingestellten Datentyp, in dem kürzende Operationen (z.B. HTucker.truncate,
+    HTucker.truncate_htucker, HTucker.add_and_truncate) Blattmatrizen und Transfertensoren ablegen. Mit np.float32
+    halbieren sich Speicherbedarf und Speichertransfer, Gram'sche Matrizen und R-Faktoren werden weiterhin in
+    np.float64 akkumuliert.
+    @param dtype: np.float64, np.float32 oder entsprechender String bzw. np.dtype
+    """
+    global _storage_dtype
+    _storage_dtype = check_dtype(dtype)
+
+
+def get_storage_dtype():
+    """
+    Gibt den global voreingestellten Speicherdatentyp zurück.
+    @return: np.dtype
+    """
+    return _storage_dtype
+
+
+@contextmanager
+def storage_dtype(dtype):
+    """
+    Kontextmanager: Innerhalb des Kontexts gilt der Speicherdatentyp 'dtype'. Danach wird der vorherige
+    wiederhergestellt.
+    @param dtype: np.float64, np.float32 oder entsprechender String bzw. np.dtype
+    """
+    previous = _storage_dtype
+    set_storage_dtype(dtype)
+    try:
+        yield
+    finally:
+        set_storage_dtype(previous)
+
+
+def to_storage(a):
+    """
+    Gibt 'a' im Speicherdatentyp zurück. Stimmt der Datentyp bereits überein, wird nicht kopiert.
+    @param a: np.ndarray
+    @return: np.ndarray
+    """
+    return a.astype(_storage_dtype, copy=False)
+
+
+def to_accumulation(a):
+    """
+    Gibt 'a' im Akkumulationsdatentyp np.float64 zurück. Stimmt der Datentyp bereits überein, wird nicht kopiert.
+    @param a: np.ndarray
+    @return: np.ndarray
+    """
+    return a.astype(ACCUMULATION_DTYPE, copy=False)
+
+
+def check_dtype(dtype):
+    """
+    Helferfunktion: Prüft, ob 'dtype' ein zulässiger Speicherdatentyp ist, und gibt ihn als np.dtype zurück.
+    """
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise TypeError("'dtype' muss np.float64 oder np.float32 sein.")
+    if dtype not in STORAGE_DTYPES:
+        raise ValueError("'dtype' muss np.float64 oder np.float32 sein.")
+    return dtype
@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+
+# Mögliche Validierungsstufen
+# OFF:   Argumente werden nicht geprüft
+# CHEAP: Nur Prüfungen mit konstantem Aufwand (Typen, Anzahl der Modi, Shapes)
+# FULL:  Sämtliche Prüfungen, auch solche über alle Einträge (z.B. Symmetrie von Gram'schen Matrizen)
+OFF = "off"
+CHEAP = "cheap"
+FULL = "full"
+LEVELS = (OFF, CHEAP, FULL)
+
+# Global voreingestellte Validierungsstufe
+_level = FULL
+
+
+def set_validation_level(level):
+    """
+    Setzt die global voreingestellte Validierungsstufe, mit der öffentliche Funktionen ihre Argumente prüfen.
+    Bibliotheksinterne Aufrufe nutzen unabhängig davon die ungeprüften Varianten.
+    @param level: "off", "cheap" oder "full"
+    """
+    global _level
+    check_level(level)
+    _level = level
+
+
+def get_validation_level():
+    """
+    Gibt die global voreingestellte Validierungsstufe zurück.
+    @return: "off", "cheap" oder "full"
+    """
+    return _level
+
+
+@contextmanager
+def validation_level(level):
+    """
+    Kontextmanager: Innerhalb des Kontexts gilt die Validierungsstufe 'level'. Danach wird die vorherige Stufe
+    wiederhergestellt.
+    @param level: "off", "cheap" oder "full"
+    """
+    previous = _level
+    set_validation_level(level)
+    try:
+        yield
+    finally:
+        set_validation_level(previous)
+
+
+def check_cheap():
+    """
+    Gibt zurück, ob Prüfungen mit konstantem Aufwand durchzuführen sind.
+    @return: bool
+    """
+    return _level != OFF
+
+
+def check_full():
+    """
+    Gibt zurück, ob sämtliche Prüfungen durchzuführen sind.
+    @return: bool
+    """
+    return _level == FULL
+
+
+def check_level(level):
+    """
+    Helferfunktion: Prüft, ob 'level' eine gültige Validierungsstufe ist.
+    """
+    if not isinstance(level, str):
+        raise TypeError("'level' muss einer der Strings 'off', 'cheap' oder 'full' sein.")
+    if level not in LEVELS:
+        raise ValueError("'level' muss einer der Strings 'off', 'cheap' oder 'full' sein.")
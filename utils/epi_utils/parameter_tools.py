@@ -2,6 +2,7 @@ import numpy as np
 from pandas import read_csv
 import pathlib
 from os.path import join
+from tensor.htucker import HTucker
 
 CONTACT_MATRIX = join(pathlib.Path(__file__).parent.resolve(), "Kontaktmatrix.csv")
 KOMPATIBILITAET_MATRIX = np.array([[1, 1, 1, 1],
@@ -66,6 +67,41 @@ def get_lamda_scaled(kappa, beta, f_B, f_AB, N):
     return lamda
 
 
+def get_lamda_htucker(kappa, beta, f_B, f_NAB):
+    """
+    Berechnet die skalierte Kontaktrate wie 'get_lamda', jedoch direkt im hierarchischen Tuckerformat und ohne den
+    vollen 4-D Tensor zu bilden (siehe 'kronecker_lamda').
+    """
+    scaling = f_B[None, :] / f_NAB[:, :, 0, 0]
+    return kronecker_lamda(kappa, beta, scaling)
+
+
+def get_lamda_scaled_htucker(kappa, beta, f_B, f_AB, N):
+    """
+    Berechnet die skalierte Kontaktrate wie 'get_lamda_scaled', jedoch direkt im hierarchischen Tuckerformat und ohne
+    den vollen 4-D Tensor zu bilden (siehe 'kronecker_lamda').
+    """
+    scaling = f_B[None, :] / (N * f_AB)
+    return kronecker_lamda(kappa, beta, scaling)
+
+
+def kronecker_lamda(kappa, beta, scaling):
+    """
+    Erzeugt lamda[a,b,a',b'] = kappa[a,a'] * beta[b,b'] * scaling[a,b] exakt im hierarchischen Tuckerformat.
+    Die Skalierung wird dazu per Singulärwertzerlegung in Rang-1-Terme zerlegt, deren Faktoren in kappa bzw. beta
+    eingehen. Jeder Term ist ein Tensorprodukt, die Terme werden exakt addiert. Für Skalierungen der Form
+    f_B[b] / f_NAB[a,b,0,0] mit f_NAB = f_A x f_B x f_N ergibt sich genau ein Term.
+    """
+    u, s, vt = np.linalg.svd(scaling, full_matrices=False)
+    lamda = None
+    for k in range(len(s)):
+        if k > 0 and s[k] <= 1e-14 * s[0]:
+            break
+        term = HTucker.from_kronecker(kappa * (s[k] * u[:, k])[:, None], beta * vt[k][:, None], [0, 2])
+        lamda = term if lamda is None else HTucker.add(lamda, term)
+    return lamda
+
+
 def get_lamda_avg(lamda, f_AB):
     """
     Berechnet die durchschnittliche Kontaktrate. f_AB enthält die Anteile an Individuen mit allen Kombinationen